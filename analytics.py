@@ -4,45 +4,59 @@ from sklearn.cluster import KMeans
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics.pairwise import cosine_similarity
 
-from config import COUNTRY_COORDS, COUNTRY_REGIONS
+from countries import load_country_table
 
 
-def prepare_map_data(df, year):
+# Map colors by inflation bucket: deflation (blue), low (green), moderate (yellow),
+# high (orange) and very high (red). A rate belongs to the first bucket whose upper
+# bound it is below; NaN falls in the last bucket, as it fails every comparison.
+COLOR_BUCKET_BOUNDS = np.array([0.0, 2.0, 5.0, 10.0])
+COLOR_TABLE = np.array([
+    [0, 100, 255, 200],
+    [0, 200, 100, 200],
+    [255, 200, 0, 200],
+    [255, 100, 0, 200],
+    [255, 0, 0, 200],
+])
+
+
+def inflation_colors(inflation):
+    """
+    Map inflation rates to RGBA colors by bucket.
+
+    Args:
+        inflation: Array-like of inflation rates
+
+    Returns:
+        list: One [r, g, b, a] list of ints per rate, as pydeck expects
+    """
+    buckets = np.digitize(np.asarray(inflation, dtype='float64'), COLOR_BUCKET_BOUNDS)
+    return COLOR_TABLE[buckets].tolist()
+
+
+def prepare_map_data(df, year, store=None):
     """
     Prepare data for PyDeck 3D visualization.
     
     Args:
         df: DataFrame containing inflation data
         year: Year to filter and prepare data for
+        store: Optional DataStore built from df, used to look up the year's rows and
+            their coordinates by country id instead of scanning and joining df
         
     Returns:
         DataFrame with coordinates, colors, and elevation data for map visualization
     """
-    # Filter for selected year
-    year_data = df[df['year'] == year].copy()
-
-    # Add coordinates
-    year_data['lat'] = year_data['country'].map(lambda x: COUNTRY_COORDS.get(x, {}).get('lat'))
-    year_data['lon'] = year_data['country'].map(lambda x: COUNTRY_COORDS.get(x, {}).get('lon'))
+    # Filter for selected year and add coordinates by ISO3 code
+    if store is not None:
+        year_data = store.year_frame_with_coordinates(year)
+    else:
+        year_data = load_country_table().join(df[df['year'] == year], columns=('lat', 'lon'))
 
     # Remove countries without coordinates
     year_data = year_data.dropna(subset=['lat', 'lon'])
 
-    # Add color based on inflation rate
-    def get_color(inflation):
-        """Color scheme: Blue (deflation) -> Green (low) -> Yellow (moderate) -> Orange (high) -> Red (very high)"""
-        if inflation < 0:
-            return [0, 100, 255, 200]  # Blue for deflation
-        elif inflation < 2:
-            return [0, 200, 100, 200]  # Green for low inflation
-        elif inflation < 5:
-            return [255, 200, 0, 200]  # Yellow for moderate
-        elif inflation < 10:
-            return [255, 100, 0, 200]  # Orange for high
-        else:
-            return [255, 0, 0, 200]  # Red for very high
-
-    year_data['color'] = year_data['inflation'].apply(get_color)
+    year_data['color'] = inflation_colors(year_data['inflation'])
 
     # Elevation (height) based on inflation value
     year_data['elevation'] = year_data['inflation'].abs() * 10000
@@ -50,7 +64,59 @@ def prepare_map_data(df, year):
     return year_data
 
 
-def generate_insights(map_data, inflation_df, selected_year, selected_regions, selected_country=None):
+def prepare_map_frames(df, store=None, years=None):
+    """
+    Prepare the map data for every year in a single pass.
+
+    Coordinates, colors and elevations are computed once over all rows, which are
+    then split into one frame per year.
+
+    Args:
+        df: DataFrame containing inflation data
+        store: Optional DataStore (or selection) built from df, used to gather the rows
+            and their coordinates by country id instead of joining df
+        years: Years to prepare frames for; years without observations get an empty
+            frame. Defaults to the years in df
+
+    Returns:
+        dict: Year -> DataFrame, each as prepare_map_data would build it for that year
+    """
+    if store is not None:
+        all_data = store.frame_with_coordinates()
+    else:
+        all_data = load_country_table().join(df, columns=('lat', 'lon'))
+        # A stable sort keeps each year's rows in the order df[df['year'] == year] has them
+        all_data = all_data.take(np.argsort(all_data['year'].to_numpy(), kind='stable'))
+
+    all_data = all_data.dropna(subset=['lat', 'lon'])
+    all_data['color'] = inflation_colors(all_data['inflation'])
+    all_data['elevation'] = all_data['inflation'].abs() * 10000
+    return split_map_frames(all_data, years)
+
+
+def split_map_frames(all_data, years=None):
+    """
+    Split prepared map data for several years into one frame per year.
+
+    Args:
+        all_data: Prepared map data sorted by year
+        years: Years to return frames for; years without rows get an empty frame.
+            Defaults to the years in all_data
+
+    Returns:
+        dict: Year -> slice of all_data holding that year's rows
+    """
+    # Rows are sorted by year, so each year's frame is a contiguous slice
+    year_values = all_data['year'].to_numpy()
+    if years is None:
+        years = np.unique(year_values)
+    years = [int(year) for year in years]
+    starts = np.searchsorted(year_values, years, side='left')
+    stops = np.searchsorted(year_values, years, side='right')
+    return {year: all_data.iloc[start:stop] for year, start, stop in zip(years, starts, stops)}
+
+
+def generate_insights(map_data, inflation_df, selected_year, selected_regions, selected_country=None, store=None):
     """
     Generate automatic insights based on current data selection and filters.
     
@@ -60,6 +126,7 @@ def generate_insights(map_data, inflation_df, selected_year, selected_regions, s
         selected_year: Currently selected year
         selected_regions: List of selected regions for filtering
         selected_country: Optional selected country for detailed analysis
+        store: Optional DataStore built from inflation_df
         
     Returns:
         List of insight strings formatted in markdown
@@ -75,26 +142,23 @@ def generate_insights(map_data, inflation_df, selected_year, selected_regions, s
 
     # Highest region
     if len(map_data) > 0:
-        region_inflations = {}
-        for _, row in map_data.iterrows():
-            region = COUNTRY_REGIONS.get(row['country'])
-            if region:
-                if region not in region_inflations:
-                    region_inflations[region] = []
-                region_inflations[region].append(row['inflation'])
-
-        if region_inflations:
-            region_avgs = {r: sum(v) / len(v) for r, v in region_inflations.items()}
-            highest_region = max(region_avgs, key=region_avgs.get)
+        regions = load_country_table().lookup(map_data['country_code'], columns=('region',))['region']
+        region_avgs = map_data['inflation'].groupby(regions.array, observed=True).mean()
+
+        if not region_avgs.empty:
+            highest_region = region_avgs.idxmax()
             insights.append(
                 f"**Geographic Pattern**: **{highest_region}** has the highest average inflation ({region_avgs[highest_region]:.2f}%) in {selected_year}."
             )
 
     # Trend insight for selected country
     if selected_country:
-        country_data = inflation_df[
-            inflation_df['country'] == selected_country
-        ].sort_values('year')
+        if store is not None:
+            country_data = store.country_frame(selected_country)
+        else:
+            country_data = inflation_df[
+                inflation_df['country'] == selected_country
+            ].sort_values('year')
 
         if len(country_data) >= 2:
             recent_trend = (
@@ -136,7 +200,24 @@ def generate_insights(map_data, inflation_df, selected_year, selected_regions, s
     return insights
 
 
-def calculate_adjusted_value(country, start_year, end_year, initial_amount, inflation_data):
+def build_price_index(inflation_data):
+    """
+    Chain each country's annual inflation rates into a price-level index.
+
+    Args:
+        inflation_data: DataFrame containing inflation data
+
+    Returns:
+        DataFrame with country, year, inflation and price_index columns sorted by country and year,
+        where price_index is 100 times the cumulative product of (1 + inflation / 100)
+    """
+    price_index = inflation_data[['country', 'year', 'inflation']].sort_values(['country', 'year'])
+    factors = 1 + price_index['inflation'] / 100
+    price_index['price_index'] = 100 * factors.groupby(price_index['country'], observed=True).cumprod()
+    return price_index.reset_index(drop=True)
+
+
+def calculate_adjusted_value(country, start_year, end_year, initial_amount, inflation_data, store=None):
     """
     Calculate inflation-adjusted value using compound inflation methodology.
     
@@ -146,68 +227,96 @@ def calculate_adjusted_value(country, start_year, end_year, initial_amount, infl
         end_year: Ending year for calculation
         initial_amount: Initial monetary value in local currency
         inflation_data: DataFrame containing inflation data
+        store: Optional DataStore built from inflation_data; the country's rows are sliced
+            from it and chained on the spot instead of filtering inflation_data
         
     Returns:
         tuple: (DataFrame with year, price_index, adjusted_value columns, final adjusted value)
         (None, None): If insufficient data available
     """
-    country_data = inflation_data[
-        (inflation_data['country'] == country) &
-        (inflation_data['year'] >= start_year) &
-        (inflation_data['year'] <= end_year)
-    ].sort_values('year')
+    if store is not None:
+        # One country's rows, already sorted by year, so the chain needs no groupby
+        country_rows = store.country_frame(country)[['country', 'year', 'inflation']]
+        price_index = country_rows.assign(price_index=100 * (1 + country_rows['inflation'] / 100).cumprod())
+    else:
+        price_index = build_price_index(inflation_data[inflation_data['country'] == country])
+
+    country_data = price_index[
+        (price_index['country'] == country) &
+        (price_index['year'] >= start_year) &
+        (price_index['year'] <= end_year)
+    ]
 
     if country_data.empty:
         return None, None
 
-    # Build price index (base 100 at start year)
-    price_index = [100]
-    adjusted_values = [initial_amount]
-    years = [start_year]
-
-    for i, row in enumerate(country_data.itertuples()):
-        if row.year == start_year:
-            continue
+    # Rebase the chained index to 100 at the start year; the start year's own
+    # inflation is not applied
+    first = country_data.iloc[0]
+    base = first['price_index']
+    if first['year'] != start_year:
+        base /= 1 + first['inflation'] / 100
 
-        # Calculate cumulative inflation factor
-        inflation_factor = 1 + (row.inflation / 100)
-        new_index = price_index[-1] * inflation_factor
-        price_index.append(new_index)
-
-        # Calculate adjusted value
-        adjusted_value = initial_amount * (new_index / 100)
-        adjusted_values.append(adjusted_value)
-        years.append(row.year)
+    later = country_data[country_data['year'] != start_year]
+    years = [start_year] + later['year'].astype(int).tolist()
+    index_values = [100.0] + (100 * later['price_index'] / base).tolist()
+    adjusted_values = [initial_amount * (value / 100) for value in index_values]
 
     return pd.DataFrame({
         'year': years,
-        'price_index': price_index,
+        'price_index': index_values,
         'adjusted_value': adjusted_values
     }), adjusted_values[-1] if adjusted_values else None
 
 
-def cluster_countries(inflation_data, n_clusters=4):
+def _inflation_pivot(inflation_data, cube=None):
+    """
+    Build the gap-filled country x year inflation matrix used for clustering and similarity.
+
+    When a memory-mapped InflationCube is available the matrix is sliced from it instead
+    of pivoting the long-format data again.
+
+    Args:
+        inflation_data: DataFrame containing inflation data
+        cube: Optional InflationCube built from the same dataset
+
+    Returns:
+        DataFrame with countries as rows and years as columns
+    """
+    pivot_data = None
+    if cube is not None:
+        countries = sorted(str(c) for c in inflation_data['country'].unique())
+        years = sorted(int(y) for y in inflation_data['year'].unique())
+        pivot_data = cube.select(countries, years)
+
+    if pivot_data is None:
+        pivot_data = inflation_data.pivot_table(
+            values='inflation',
+            index='country',
+            columns='year',
+            aggfunc='mean',
+            observed=True
+        )
+
+    # Aggregates are already dropped at ingestion time, so every row is a country
+    return pivot_data.fillna(method='ffill').fillna(method='bfill').fillna(0)
+
+
+def cluster_countries(inflation_data, n_clusters=4, cube=None):
     """
     Cluster countries based on their inflation time series patterns using K-means algorithm.
     
     Args:
         inflation_data: DataFrame containing inflation data
         n_clusters: Number of clusters to create (default: 4)
+        cube: Optional InflationCube to slice instead of pivoting inflation_data
         
     Returns:
         tuple: (cluster_map dictionary, pivot_data DataFrame)
         None: If insufficient data for clustering
     """
     # Create pivot table with countries as rows and years as columns
-    pivot_data = inflation_data.pivot_table(
-        values='inflation',
-        index='country',
-        columns='year',
-        aggfunc='mean'
-    ).fillna(method='ffill').fillna(method='bfill').fillna(0)
-
-    # Only include countries with coordinates
-    pivot_data = pivot_data[pivot_data.index.isin(COUNTRY_COORDS.keys())]
+    pivot_data = _inflation_pivot(inflation_data, cube)
 
     if len(pivot_data) < n_clusters:
         return None
@@ -226,7 +335,29 @@ def cluster_countries(inflation_data, n_clusters=4):
     return cluster_map, pivot_data
 
 
-def find_similar_countries(target_country, inflation_data, top_n=5):
+def similarity_matrix(inflation_data, cube=None):
+    """
+    Compute the cosine similarity between every pair of countries' inflation histories.
+
+    Args:
+        inflation_data: DataFrame containing inflation data
+        cube: Optional InflationCube to slice instead of pivoting inflation_data
+
+    Returns:
+        DataFrame with countries as both rows and columns
+    """
+    pivot_data = _inflation_pivot(inflation_data, cube)
+    if pivot_data.empty:
+        return pd.DataFrame(index=pivot_data.index, columns=pivot_data.index, dtype='float64')
+
+    return pd.DataFrame(
+        cosine_similarity(pivot_data),
+        index=pivot_data.index,
+        columns=pivot_data.index
+    )
+
+
+def find_similar_countries(target_country, inflation_data, top_n=5, cube=None, similarity=None):
     """
     Find countries with similar inflation patterns using cosine similarity.
     
@@ -234,32 +365,17 @@ def find_similar_countries(target_country, inflation_data, top_n=5):
         target_country: Country to find similarities for
         inflation_data: DataFrame containing inflation data
         top_n: Number of similar countries to return (default: 5)
+        cube: Optional InflationCube to slice instead of pivoting inflation_data
+        similarity: Optional precomputed output of similarity_matrix for inflation_data
         
     Returns:
         Series: Top N similar countries with similarity scores
         None: If target country not found or insufficient data
     """
-    # Create pivot table
-    pivot_data = inflation_data.pivot_table(
-        values='inflation',
-        index='country',
-        columns='year',
-        aggfunc='mean'
-    ).fillna(method='ffill').fillna(method='bfill').fillna(0)
-
-    # Only include countries with coordinates
-    pivot_data = pivot_data[pivot_data.index.isin(COUNTRY_COORDS.keys())]
-
-    if target_country not in pivot_data.index:
-        return None
+    similarity_df = similarity if similarity is not None else similarity_matrix(inflation_data, cube)
 
-    # Calculate cosine similarity
-    similarities = cosine_similarity(pivot_data)
-    similarity_df = pd.DataFrame(
-        similarities,
-        index=pivot_data.index,
-        columns=pivot_data.index
-    )
+    if target_country not in similarity_df.index:
+        return None
 
     # Get top similar countries (excluding the target itself)
     similar = similarity_df[target_country].sort_values(ascending=False)[1:top_n + 1]
@@ -267,6 +383,32 @@ def find_similar_countries(target_country, inflation_data, top_n=5):
     return similar
 
 
+def compare_indicators(indicator_data, country):
+    """
+    Line up several inflation measures for one country.
+
+    Args:
+        indicator_data: Long-format DataFrame with country, indicator, year and value columns
+        country: Country to compare measures for
+
+    Returns:
+        DataFrame with years as rows and one column per indicator code
+        None: If the country has no observations
+    """
+    country_data = indicator_data[indicator_data['country'] == country]
+
+    if country_data.empty:
+        return None
+
+    return country_data.pivot_table(
+        values='value',
+        index='year',
+        columns='indicator',
+        aggfunc='mean',
+        observed=True
+    ).sort_index()
+
+
 def calculate_volatility(country_data):
     """
     Calculate inflation volatility using standard deviation.
@@ -0,0 +1,322 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import zipfile
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import (
+    API_TIMEOUT,
+    API_MAX_RETRIES,
+    API_BACKOFF_FACTOR,
+    MAX_FETCH_WORKERS,
+    API_MODE,
+    API_ARCHIVE_FILE,
+    API_REPLAY_LATENCY,
+)
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_BACKOFF_SECONDS = 30
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """Raised when the overall deadline for a load runs out before a request succeeds."""
+
+
+class ReplayMiss(requests.exceptions.RequestException):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+class WorldBankClient:
+    """
+    Pooled HTTP client for World Bank API requests.
+
+    A single keep-alive session is shared by all requests (and threads), responses are
+    negotiated with gzip compression, and transient failures (connection errors, timeouts,
+    429 and 5xx responses) are retried with exponential backoff. Every request can be
+    bounded by an overall deadline that also caps backoff sleeps.
+    """
+
+    def __init__(self, timeout=API_TIMEOUT, max_retries=API_MAX_RETRIES,
+                 backoff_factor=API_BACKOFF_FACTOR, pool_size=MAX_FETCH_WORKERS):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_count = 0
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _backoff(self, attempt, response=None):
+        """Seconds to wait before retry number `attempt`, honouring Retry-After when given."""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), MAX_BACKOFF_SECONDS)
+        return min(self.backoff_factor * (2 ** (attempt - 1)), MAX_BACKOFF_SECONDS)
+
+    def _remaining(self, deadline):
+        """Seconds left before the deadline, raising DeadlineExceeded if none remain."""
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded("Deadline exceeded while fetching from World Bank API")
+        return remaining
+
+    def get_json(self, url, params=None, deadline=None, stats=None):
+        """
+        GET a URL and decode its JSON body, retrying transient failures.
+
+        Args:
+            url: URL to request
+            params: Optional query parameters
+            deadline: Optional time.monotonic() value after which no further attempts are made
+            stats: Optional dict filled in with the successful attempt's 'latency' (seconds,
+                including the body), payload 'bytes', JSON 'decode_seconds' and the number
+                of 'retries' it took
+
+        Returns:
+            Decoded JSON payload
+
+        Raises:
+            requests.exceptions.RequestException: If the request still fails after all retries
+        """
+        attempt = 0
+        while True:
+            remaining = self._remaining(deadline)
+            timeout = self.timeout if remaining is None else min(self.timeout, remaining)
+
+            response = None
+            try:
+                start = time.perf_counter()
+                response = self.session.get(url, params=params, timeout=timeout)
+                if response.status_code not in RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    content = response.content
+                    received = time.perf_counter()
+                    payload = json.loads(content)
+                    if stats is not None:
+                        stats.update(
+                            latency=received - start,
+                            bytes=len(content),
+                            decode_seconds=time.perf_counter() - received,
+                            retries=attempt,
+                        )
+                    return payload
+                error = requests.exceptions.HTTPError(
+                    f"{response.status_code} Error for url: {response.url}", response=response
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+
+            attempt += 1
+            if attempt > self.max_retries:
+                raise error
+
+            delay = self._backoff(attempt, response)
+            remaining = self._remaining(deadline)
+            if remaining is not None and delay >= remaining:
+                raise DeadlineExceeded(
+                    f"Deadline exceeded while fetching from World Bank API (last error: {error})"
+                )
+
+            with self._lock:
+                self.retry_count += 1
+            time.sleep(delay)
+
+    def close(self):
+        self.session.close()
+
+
+class ResponseArchive:
+    """
+    Compressed zip archive of raw API responses keyed by request path and parameters.
+
+    The host is left out of the key so an archive recorded against one server (for
+    example a local stand-in) replays against any base URL.
+    """
+
+    def __init__(self, path=API_ARCHIVE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._reader = None
+
+    @staticmethod
+    def key(url, params=None):
+        """Return the archive entry name for a request."""
+        query = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        digest = hashlib.sha1(json.dumps([urlsplit(url).path, query]).encode('utf-8')).hexdigest()
+        return f"{digest}.json"
+
+    def put(self, url, params, payload):
+        """Store one decoded response; a request that is already recorded keeps its first response."""
+        name = self.key(url, params)
+        with self._lock:
+            # The reader's central directory goes stale once the archive is appended to
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+            mode = 'a' if os.path.exists(self.path) else 'w'
+            with zipfile.ZipFile(self.path, mode, compression=zipfile.ZIP_DEFLATED) as archive:
+                if name not in archive.namelist():
+                    archive.writestr(name, json.dumps(payload))
+
+    def get_raw(self, url, params=None):
+        """
+        Return the recorded JSON body of a request, undecoded.
+
+        Raises:
+            KeyError: If the request was never recorded
+        """
+        name = self.key(url, params)
+        with self._lock:
+            if self._reader is None:
+                if not os.path.exists(self.path):
+                    raise KeyError(name)
+                self._reader = zipfile.ZipFile(self.path)
+            return self._reader.read(name)
+
+    def get(self, url, params=None):
+        """
+        Return the recorded response for a request.
+
+        Raises:
+            KeyError: If the request was never recorded
+        """
+        return json.loads(self.get_raw(url, params))
+
+    def close(self):
+        with self._lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+
+class RecordingClient(WorldBankClient):
+    """WorldBankClient that also saves every successful response to a ResponseArchive."""
+
+    def __init__(self, archive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def get_json(self, url, params=None, deadline=None, stats=None):
+        payload = super().get_json(url, params=params, deadline=deadline, stats=stats)
+        self.archive.put(url, params, payload)
+        return payload
+
+
+class ReplayClient:
+    """
+    Drop-in replacement for WorldBankClient that serves responses from a ResponseArchive.
+
+    Every response can be delayed by a fixed latency so replayed ingestion runs are
+    timed like a network-bound load while staying repeatable.
+    """
+
+    def __init__(self, archive, latency=API_REPLAY_LATENCY):
+        self.archive = archive
+        self.latency = latency
+        self.retry_count = 0
+
+    def get_json(self, url, params=None, deadline=None, stats=None):
+        """
+        Return the recorded response for a request.
+
+        Args:
+            stats: Optional dict filled in like WorldBankClient.get_json's, with the
+                injected latency and archive read counted as request latency
+
+        Raises:
+            ReplayMiss: If the request is not in the archive
+            DeadlineExceeded: If the injected latency would overrun the deadline
+        """
+        start = time.perf_counter()
+        if self.latency:
+            if deadline is not None and time.monotonic() + self.latency > deadline:
+                raise DeadlineExceeded("Deadline exceeded while replaying World Bank API responses")
+            time.sleep(self.latency)
+        try:
+            content = self.archive.get_raw(url, params)
+        except KeyError:
+            raise ReplayMiss(f"No recorded response for {url} with {params} in {self.archive.path}")
+        received = time.perf_counter()
+        payload = json.loads(content)
+        if stats is not None:
+            stats.update(
+                latency=received - start,
+                bytes=len(content),
+                decode_seconds=time.perf_counter() - received,
+                retries=0,
+            )
+        return payload
+
+    def close(self):
+        self.archive.close()
+
+
+def create_client(mode=API_MODE, archive_file=API_ARCHIVE_FILE, latency=API_REPLAY_LATENCY):
+    """
+    Build a client for the given API mode.
+
+    Args:
+        mode: 'live', 'record' or 'replay'
+        archive_file: Response archive used by record and replay modes
+        latency: Seconds added to every replayed response
+
+    Returns:
+        WorldBankClient or ReplayClient
+    """
+    if mode == 'live':
+        return WorldBankClient()
+    if mode == 'record':
+        return RecordingClient(ResponseArchive(archive_file))
+    if mode == 'replay':
+        return ReplayClient(ResponseArchive(archive_file), latency=latency)
+    raise ValueError(f"Unknown API mode: {mode!r}")
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """
+    Return the process-wide API client, creating it for API_MODE on first use.
+
+    Returns:
+        WorldBankClient: Shared client whose connection pool is reused across loads
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = create_client()
+        return _client
+
+
+def set_client(client):
+    """
+    Replace the process-wide API client, e.g. to switch to a replay client in a benchmark.
+
+    Args:
+        client: Client to install, or None to recreate one for API_MODE on next use
+
+    Returns:
+        The previously installed client (or None)
+    """
+    global _client
+    with _client_lock:
+        previous, _client = _client, client
+        return previous
@@ -0,0 +1,142 @@
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from analytics import prepare_map_frames, split_map_frames, cluster_countries, similarity_matrix
+from data_cache import CACHE_DTYPES, atomic_write
+from config import ARTIFACTS_DIR
+
+ARTIFACTS_MANIFEST = "manifest.json"
+MAP_FRAMES_FILE = "map_frames.parquet"
+CLUSTERS_FILE = "clusters.json"
+SIMILARITY_FILE = "similarity.parquet"
+N_CLUSTERS = 4  # Matches the clustering shown on the map
+
+
+class Artifacts:
+    """
+    Precomputed, read-only analytics for the full (unfiltered) dataset.
+
+    Instances are shared by every session in a process; callers must not modify them.
+
+    Attributes:
+        map_frames: Year -> prepared map data, as analytics.prepare_map_frames builds it
+        clusters: Country -> cluster id
+        similarity: Country x country similarity matrix
+    """
+
+    def __init__(self, map_frames, clusters, similarity, dataset_version):
+        self.map_frames = map_frames
+        self.clusters = clusters
+        self.similarity = similarity
+        self.dataset_version = dataset_version
+
+
+def _with_plain_labels(matrix):
+    """Replace categorical row and column labels with plain strings, which Parquet can round-trip."""
+    labels = pd.Index([str(label) for label in matrix.index], name='country')
+    return matrix.set_axis(labels, axis=0).set_axis(labels.rename(None), axis=1)
+
+
+def build_artifacts(df, dataset_version, artifacts_dir=ARTIFACTS_DIR, on_status=None):
+    """
+    Precompute the dashboard's derived data and write it to an artifacts directory.
+
+    The manifest is removed first and written last, so an interrupted build never
+    leaves a directory that looks complete.
+
+    Args:
+        df: Inflation DataFrame the artifacts are derived from
+        dataset_version: Version of df (see data_cache.dataset_version) recorded in the manifest
+        artifacts_dir: Output directory
+        on_status: Optional callback called as on_status(message) after each artifact
+
+    Returns:
+        dict: The written manifest, including each artifact's build time in seconds
+    """
+    os.makedirs(artifacts_dir, exist_ok=True)
+    manifest_path = os.path.join(artifacts_dir, ARTIFACTS_MANIFEST)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    timings = {}
+
+    def write(name, build, save):
+        start = time.perf_counter()
+        value = build()
+        with atomic_write(os.path.join(artifacts_dir, name)) as tmp_path:
+            save(value, tmp_path)
+        timings[name] = round(time.perf_counter() - start, 3)
+        if on_status:
+            on_status(f"Built {name} in {timings[name]:.2f} s")
+
+    def save_json(value, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(value, f)
+
+    years = sorted(int(year) for year in df['year'].unique())
+
+    write(
+        MAP_FRAMES_FILE,
+        lambda: pd.concat(prepare_map_frames(df, years=years).values(), ignore_index=True),
+        lambda frames, path: frames.to_parquet(path, index=False),
+    )
+    write(
+        CLUSTERS_FILE,
+        lambda: (cluster_countries(df, n_clusters=N_CLUSTERS) or ({}, None))[0],
+        save_json,
+    )
+    write(
+        SIMILARITY_FILE,
+        lambda: similarity_matrix(df),
+        lambda similarity, path: _with_plain_labels(similarity).to_parquet(path),
+    )
+
+    manifest = {
+        'dataset_version': dataset_version,
+        'built_at': time.time(),
+        'years': years,
+        'build_seconds': timings,
+    }
+    with atomic_write(manifest_path) as tmp_path:
+        save_json(manifest, tmp_path)
+    return manifest
+
+
+def load_artifacts(dataset_version, artifacts_dir=ARTIFACTS_DIR):
+    """
+    Load precomputed artifacts if they were built from the given dataset version.
+
+    Args:
+        dataset_version: Version of the dataset being served
+        artifacts_dir: Directory written by build_artifacts
+
+    Returns:
+        Artifacts: The loaded artifacts
+        None: If there are no artifacts or they belong to a different dataset version
+    """
+    manifest_path = os.path.join(artifacts_dir, ARTIFACTS_MANIFEST)
+    if dataset_version is None or not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('dataset_version') != dataset_version:
+        return None
+
+    map_frames = pd.read_parquet(os.path.join(artifacts_dir, MAP_FRAMES_FILE))
+    # An all-missing metadata column is read back as object; restore the cache dtypes
+    map_frames = map_frames.astype({col: dtype for col, dtype in CACHE_DTYPES.items()
+                                    if col in map_frames.columns and map_frames[col].dtype != dtype})
+    # Parquet returns the color lists as arrays; pydeck needs plain lists of ints
+    colors = map_frames['color'].to_numpy()
+    map_frames['color'] = np.vstack(colors).astype('int64').tolist() if len(colors) else []
+    map_frames = split_map_frames(map_frames, manifest.get('years'))
+
+    with open(os.path.join(artifacts_dir, CLUSTERS_FILE), encoding='utf-8') as f:
+        clusters = json.load(f)
+
+    similarity = pd.read_parquet(os.path.join(artifacts_dir, SIMILARITY_FILE))
+    return Artifacts(map_frames, clusters, similarity, dataset_version)
@@ -0,0 +1,110 @@
+"""
+Bulk WDI file import versus the paginated API path.
+
+Builds a synthetic dataset, serves it from the local API stand-in once to
+record a response archive, and writes the same data as a bulk WDI ZIP padded
+with filler indicators (the real WDI_CSV.zip holds ~1,500 indicators per
+country). Each timed run then loads the inflation indicator into a fresh cache
+both ways: by replaying the archive through ingestion.refresh_inflation_data,
+and with wdi_import.import_bulk_file. Neither path touches the network.
+
+The default replay latency (300 ms per page) is in the range of a real World
+Bank API round trip for a 1,000-row page. The API path is also replayed once
+with no latency, and the page latency at which the two paths break even is
+reported: the bulk import wins on any connection slower than that.
+
+Usage:
+    python benchmarks/bench_bulk_import.py
+    python benchmarks/bench_bulk_import.py --filler 1500 --latency 0.05
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ingestion  # noqa: E402
+import wdi_import  # noqa: E402
+from api_client import RecordingClient, ReplayClient, ResponseArchive, set_client  # noqa: E402
+from data_cache import save_cache  # noqa: E402
+from fake_worldbank import FakeWorldBankServer, synthetic_records, write_bulk_archive  # noqa: E402
+
+
+def load_from_api(start_year, end_year):
+    df, _, last_updated = ingestion.refresh_inflation_data(start_year=start_year, end_year=end_year)
+    save_cache(df, date_range=(start_year, end_year), source_last_updated=last_updated)
+    return len(df)
+
+
+def load_from_bulk(bulk_path, start_year, end_year):
+    return sum(wdi_import.import_bulk_file(bulk_path, first_year=start_year, last_year=end_year).values())
+
+
+def time_runs(load, repeat):
+    timings = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            os.chdir(cache_dir)
+            start = time.perf_counter()
+            rows = load()
+            timings.append(time.perf_counter() - start)
+    return rows, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--countries', type=int, default=260, help="Synthetic countries")
+    parser.add_argument('--start-year', type=int, default=1960, help="First year loaded")
+    parser.add_argument('--end-year', type=int, default=2024, help="Last year loaded")
+    parser.add_argument('--filler', type=int, default=200, help="Filler indicators per country in the bulk file")
+    parser.add_argument('--latency', type=float, default=0.3, help="Injected latency per replayed response (seconds)")
+    parser.add_argument('--repeat', type=int, default=3, help="Number of timed runs per path")
+    args = parser.parse_args()
+
+    records = synthetic_records(n_countries=args.countries, start_year=args.start_year, end_year=args.end_year)
+    workdir = tempfile.mkdtemp()
+    archive_path = os.path.join(workdir, 'api_archive.zip')
+    bulk_path = os.path.join(workdir, 'WDI_CSV.zip')
+
+    write_bulk_archive(bulk_path, records, filler_indicators=args.filler)
+    archive = ResponseArchive(archive_path)
+    with FakeWorldBankServer(records) as server, tempfile.TemporaryDirectory() as cache_dir:
+        os.chdir(cache_dir)
+        ingestion.WORLD_BANK_API_URL = server.base_url
+        set_client(RecordingClient(archive))
+        load_from_api(args.start_year, args.end_year)
+    archive.close()
+
+    print(f"{len(records):,} observations, {args.start_year}-{args.end_year}; bulk file "
+          f"{os.path.getsize(bulk_path) / 1024 ** 2:.1f} MB with {args.filler + 1} indicators per country")
+
+    results = {}
+    for latency in sorted({0.0, args.latency}):
+        set_client(ReplayClient(ResponseArchive(archive_path), latency=latency))
+        results[f'API replay ({latency * 1000:.0f} ms/page)'] = time_runs(
+            lambda: load_from_api(args.start_year, args.end_year), args.repeat)
+    results['Bulk file import'] = time_runs(
+        lambda: load_from_bulk(bulk_path, args.start_year, args.end_year), args.repeat)
+    for label, (rows, timings) in results.items():
+        print(f"  {label:<24} {rows:,} rows   best {min(timings):.3f} s, "
+              f"median {sorted(timings)[len(timings) // 2]:.3f} s over {args.repeat} runs")
+
+    if args.latency > 0:
+        # Replay time grows linearly with the page latency (pages are fetched in
+        # concurrent rounds), so two points give the break-even latency
+        api_base = min(results['API replay (0 ms/page)'][1])
+        api_slow = min(results[f'API replay ({args.latency * 1000:.0f} ms/page)'][1])
+        bulk = min(results['Bulk file import'][1])
+        seconds_per_latency = (api_slow - api_base) / args.latency
+        if bulk <= api_base:
+            print("  Bulk import is faster at any page latency")
+        elif seconds_per_latency > 0:
+            print(f"  Break-even at ~{(bulk - api_base) / seconds_per_latency * 1000:.0f} ms/page; "
+                  f"bulk import is faster on slower connections")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Compare load time and file size of the legacy CSV cache and the Parquet cache.
+
+By default the repository's inflation_data_cache.csv is used. --scale repeats
+the data (with shifted years) to approximate larger caches such as the full
+1960+ history or several indicators. Replicated values compress unusually
+well, so treat file size ratios at --scale > 1 as optimistic.
+
+Usage:
+    python benchmarks/bench_cache_format.py --scale 10 --repeat 20
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd  # noqa: E402
+
+from data_cache import coerce_cache_dtypes, save_cache, load_cache  # noqa: E402
+
+
+def time_load(load, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    repo_root = Path(__file__).resolve().parent.parent
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--csv', default=str(repo_root / 'inflation_data_cache.csv'), help="Source CSV cache")
+    parser.add_argument('--scale', type=int, default=1, help="Number of times to replicate the data")
+    parser.add_argument('--repeat', type=int, default=20, help="Timed loads per format (median reported)")
+    args = parser.parse_args()
+
+    source = pd.read_csv(args.csv)
+    span = int(source['year'].max() - source['year'].min() + 1)
+    df = pd.concat(
+        [source.assign(year=source['year'] - i * span) for i in range(args.scale)],
+        ignore_index=True
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, 'cache.csv')
+        parquet_file = os.path.join(tmp, 'cache.parquet')
+        cube_files = {
+            'cube_file': os.path.join(tmp, 'cube.npy'),
+            'index_file': os.path.join(tmp, 'cube_index.json'),
+        }
+        df.to_csv(csv_file, index=False)
+        save_cache(df, parquet_file, **cube_files)
+
+        csv_time = time_load(lambda: coerce_cache_dtypes(pd.read_csv(csv_file)), args.repeat)
+        parquet_time = time_load(lambda: load_cache(parquet_file, csv_file, **cube_files), args.repeat)
+        csv_size = os.path.getsize(csv_file)
+        parquet_size = os.path.getsize(parquet_file)
+
+        loaded = load_cache(parquet_file, csv_file, **cube_files)
+        memory_csv = pd.read_csv(csv_file).memory_usage(deep=True).sum()
+        memory_parquet = loaded.memory_usage(deep=True).sum()
+
+    print(f"{len(df):,} rows")
+    print(f"{'format':<10}{'load (ms)':>12}{'file size':>14}{'in memory':>14}")
+    print(f"{'CSV':<10}{csv_time * 1000:>12.2f}{csv_size / 1024:>11.1f} KB{memory_csv / 1024:>11.1f} KB")
+    print(f"{'Parquet':<10}{parquet_time * 1000:>12.2f}{parquet_size / 1024:>11.1f} KB"
+          f"{memory_parquet / 1024:>11.1f} KB")
+    print(f"Parquet loads {csv_time / parquet_time:.1f}x faster and is {csv_size / parquet_size:.1f}x smaller")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Exercise the pooled World Bank client against a flaky local API stand-in.
+
+The stand-in fails every Nth request with a transient error status. Reports
+how long the fetch takes with the failures absorbed by retries, and how many
+bytes gzip negotiation saved on the wire. Correctness (same pages as a healthy
+run, giving up at the deadline) is checked by tests/test_api_client.py.
+
+Usage:
+    python benchmarks/bench_flaky_api.py --fail-every 3 --fail-status 503
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_worldbank import FakeWorldBankServer, page_payload, synthetic_records  # noqa: E402
+from api_client import WorldBankClient  # noqa: E402
+from ingestion import fetch_api_pages  # noqa: E402
+
+
+def fetch_all(server, client, per_page, deadline_seconds=60):
+    url = f"{server.base_url}/country/all/indicator/FP.CPI.TOTL.ZG"
+    params = {'format': 'json', 'date': '2010:2024', 'per_page': per_page}
+    start = time.perf_counter()
+    pages = list(fetch_api_pages(url, params, client=client, deadline_seconds=deadline_seconds))
+    return pages, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fail-every', type=int, default=3, help="Fail every Nth request")
+    parser.add_argument('--fail-status', type=int, default=503, help="Status code returned for failed requests")
+    parser.add_argument('--per-page', type=int, default=200, help="Records per API page")
+    parser.add_argument('--latency', type=float, default=0.02, help="Injected latency per response (seconds)")
+    args = parser.parse_args()
+
+    records = synthetic_records()
+
+    with FakeWorldBankServer(records, latency=args.latency) as healthy:
+        expected, _ = fetch_all(healthy, WorldBankClient(backoff_factor=0.05), args.per_page)
+        raw_bytes = sum(
+            len(json.dumps(page_payload(records, {'per_page': [str(args.per_page)], 'page': [str(page)],
+                                                  'date': ['2010:2024']})).encode('utf-8'))
+            for page in range(1, len(expected) + 1)
+        )
+        wire_bytes = healthy.bytes_sent
+
+    with FakeWorldBankServer(records, latency=args.latency, fail_every=args.fail_every,
+                             fail_status=args.fail_status) as flaky:
+        client = WorldBankClient(backoff_factor=0.05)
+        pages, elapsed = fetch_all(flaky, client, args.per_page)
+        failures = flaky.failure_count
+
+    if pages != expected:
+        raise SystemExit("Flaky-server fetch returned different pages than the healthy-server fetch")
+    print(f"{len(pages)} pages fetched in {elapsed:.2f} s despite {failures} injected "
+          f"{args.fail_status} responses ({client.retry_count} retries)")
+    print(f"gzip: {wire_bytes:,} bytes on the wire vs {raw_bytes:,} uncompressed "
+          f"({1 - wire_bytes / raw_bytes:.0%} saved)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Map data preparation: per-row lookups versus vectorized coordinates and colors.
+
+Builds a synthetic dataset and a matching country table with --locations
+countries (10,000 by default, far more than the ~200 real ones, to make the
+per-row cost visible), then prepares one year's map frame three ways:
+
+  per-row      coordinates from a name-keyed dict and colors from an if/elif
+               function, both applied row by row (the original implementation)
+  table join   coordinates joined from the ISO3-keyed country table and colors
+               bucketed with np.digitize into a color lookup table
+  store        analytics.prepare_map_data with a DataStore: the year's rows and
+               their coordinates are gathered by country id from arrays built
+               once per dataset
+
+All three must produce the same rows, coordinates, colors and elevations.
+
+It then compares preparing every year's frame with one prepare_map_data call
+per year against analytics.prepare_map_frames, which colors all rows in one
+pass and splits them by year (what the app caches, so a slider move is a
+dictionary lookup).
+
+Usage:
+    python benchmarks/bench_map_data.py
+    python benchmarks/bench_map_data.py --locations 10000 --repeat 20
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd  # noqa: E402
+
+from analytics import prepare_map_data, prepare_map_frames, inflation_colors  # noqa: E402
+from countries import CountryTable  # noqa: E402
+from data_cache import coerce_cache_dtypes  # noqa: E402
+from datastore import DataStore  # noqa: E402
+from fake_worldbank import synthetic_records  # noqa: E402
+
+
+def synthetic_country_table(df, seed=7):
+    rng = random.Random(seed)
+    countries = df[['country_code', 'country']].drop_duplicates('country_code')
+    return CountryTable(pd.DataFrame({
+        'iso3': countries['country_code'].astype('object').to_numpy(),
+        'name': countries['country'].astype('object').to_numpy(),
+        'aliases': [[] for _ in range(len(countries))],
+        'lat': [rng.uniform(-60, 70) for _ in range(len(countries))],
+        'lon': [rng.uniform(-180, 180) for _ in range(len(countries))],
+        'region': 'Synthetic',
+    }))
+
+
+def get_color(inflation):
+    if inflation < 0:
+        return [0, 100, 255, 200]
+    elif inflation < 2:
+        return [0, 200, 100, 200]
+    elif inflation < 5:
+        return [255, 200, 0, 200]
+    elif inflation < 10:
+        return [255, 100, 0, 200]
+    else:
+        return [255, 0, 0, 200]
+
+
+def map_data_per_row(df, year, coords):
+    year_data = df[df['year'] == year].copy()
+    year_data['lat'] = year_data['country'].apply(lambda c: coords.get(c, {}).get('lat'))
+    year_data['lon'] = year_data['country'].apply(lambda c: coords.get(c, {}).get('lon'))
+    year_data = year_data.dropna(subset=['lat', 'lon'])
+    year_data['color'] = year_data['inflation'].apply(get_color)
+    year_data['elevation'] = year_data['inflation'].abs() * 10000
+    return year_data
+
+
+def map_data_table_join(df, year, table):
+    year_data = table.join(df[df['year'] == year], columns=('lat', 'lon')).dropna(subset=['lat', 'lon'])
+    year_data['color'] = inflation_colors(year_data['inflation'])
+    year_data['elevation'] = year_data['inflation'].abs() * 10000
+    return year_data
+
+
+def normalised(frame):
+    frame = frame[['country_code', 'year', 'inflation', 'lat', 'lon', 'color', 'elevation']]
+    frame = frame.astype({'country_code': 'object', 'lat': 'float64', 'lon': 'float64'})
+    return frame.sort_values('country_code').reset_index(drop=True)
+
+
+def time_runs(prepare, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        frame = prepare()
+        timings.append(time.perf_counter() - start)
+    return frame, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--locations', type=int, default=10000, help="Synthetic countries on the map")
+    parser.add_argument('--years', type=int, default=15, help="Years of data per country")
+    parser.add_argument('--repeat', type=int, default=10, help="Timed runs per variant (median reported)")
+    args = parser.parse_args()
+
+    end_year = 2024
+    df = coerce_cache_dtypes(pd.DataFrame(
+        synthetic_records(n_countries=args.locations, start_year=end_year - args.years + 1, end_year=end_year)
+    ))
+    table = synthetic_country_table(df)
+    coords = {name: {'lat': lat, 'lon': lon}
+              for name, lat, lon in zip(table.frame['name'], table.frame['lat'], table.frame['lon'])}
+
+    start = time.perf_counter()
+    store = DataStore(df, country_table=table)
+    build_seconds = time.perf_counter() - start
+
+    results = {
+        'per-row': time_runs(lambda: map_data_per_row(df, end_year, coords), args.repeat),
+        'table join': time_runs(lambda: map_data_table_join(df, end_year, table), args.repeat),
+        'store': time_runs(lambda: prepare_map_data(df, end_year, store=store), args.repeat),
+    }
+    reference = normalised(results['per-row'][0])
+    for label, (frame, _) in results.items():
+        pd.testing.assert_frame_equal(normalised(frame), reference, obj=label)
+
+    print(f"{len(df):,} rows, {len(reference):,} locations on the map; "
+          f"DataStore built once in {build_seconds * 1000:.1f} ms")
+    baseline = results['per-row'][1]
+    for label, (_, seconds) in results.items():
+        print(f"  {label:<12}{seconds * 1000:>9.2f} ms   {baseline / seconds:>5.1f}x")
+    print("All variants produce identical map data")
+
+    years = sorted(int(year) for year in df['year'].unique())
+    per_year, per_year_seconds = time_runs(
+        lambda: {year: prepare_map_data(df, year, store=store) for year in years}, args.repeat
+    )
+    frames, one_pass_seconds = time_runs(lambda: prepare_map_frames(df, store=store, years=years), args.repeat)
+    for year in years:
+        pd.testing.assert_frame_equal(frames[year], per_year[year], obj=str(year))
+    _, lookup_seconds = time_runs(lambda: frames[end_year], args.repeat)
+    print(f"All {len(years)} years: per year {per_year_seconds * 1000:.2f} ms, "
+          f"one pass {one_pass_seconds * 1000:.2f} ms; cached lookup {lookup_seconds * 1e6:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
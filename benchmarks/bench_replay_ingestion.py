@@ -0,0 +1,100 @@
+"""
+Repeatable ingestion benchmark driven by a recorded response archive.
+
+The first run records every page of a full inflation download into a
+compressed archive (from the local API stand-in, or from the real World Bank
+API with --live). Later runs replay the archive through the normal ingestion
+path with an optional injected latency, so parsing, DataFrame assembly and
+cache writes can be timed and profiled without any network access.
+
+Usage:
+    python benchmarks/bench_replay_ingestion.py --archive /tmp/wb_archive.zip --repeat 5
+    python benchmarks/bench_replay_ingestion.py --archive /tmp/wb_archive.zip --profile
+"""
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ingestion  # noqa: E402
+from api_client import RecordingClient, ReplayClient, ResponseArchive, set_client  # noqa: E402
+from data_cache import save_cache  # noqa: E402
+from fake_worldbank import FakeWorldBankServer, synthetic_records  # noqa: E402
+
+
+def load_once(cache_dir):
+    df, _, last_updated = ingestion.refresh_inflation_data()
+    save_cache(
+        df,
+        cache_file=os.path.join(cache_dir, 'cache.parquet'),
+        cube_file=os.path.join(cache_dir, 'cube.npy'),
+        index_file=os.path.join(cache_dir, 'cube_index.json'),
+        source_last_updated=last_updated,
+    )
+    return df
+
+
+def record(archive_path, live, countries, start_year):
+    archive = ResponseArchive(archive_path)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        if live:
+            set_client(RecordingClient(archive))
+            df = load_once(cache_dir)
+        else:
+            records = synthetic_records(n_countries=countries, start_year=start_year)
+            with FakeWorldBankServer(records) as server:
+                ingestion.WORLD_BANK_API_URL = server.base_url
+                set_client(RecordingClient(archive))
+                df = load_once(cache_dir)
+    print(f"Recorded {len(df):,} rows into {archive_path} ({os.path.getsize(archive_path) / 1024:.0f} KB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--archive', default=os.path.join(tempfile.gettempdir(), 'wb_replay_archive.zip'),
+                        help="Response archive to replay (recorded first if missing)")
+    parser.add_argument('--live', action='store_true', help="Record from the real World Bank API")
+    parser.add_argument('--countries', type=int, default=260, help="Synthetic countries when recording locally")
+    parser.add_argument('--start-year', type=int, default=2010, help="First synthetic year when recording locally")
+    parser.add_argument('--latency', type=float, default=0.0, help="Injected latency per replayed response (seconds)")
+    parser.add_argument('--repeat', type=int, default=5, help="Number of timed replay runs")
+    parser.add_argument('--profile', action='store_true', help="Print a cProfile summary of one replay run")
+    args = parser.parse_args()
+
+    archive_path = os.path.abspath(args.archive)
+    repo_dir = os.getcwd()
+    # Ingestion also refreshes the country metadata cache in the working directory, so
+    # everything runs in a scratch directory to keep the synthetic metadata out of the repo
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.chdir(cache_dir)
+        try:
+            if not os.path.exists(archive_path):
+                record(archive_path, args.live, args.countries, args.start_year)
+
+            set_client(ReplayClient(ResponseArchive(archive_path), latency=args.latency))
+
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                df = load_once(cache_dir)
+                timings.append(time.perf_counter() - start)
+
+            print(f"Replayed {len(df):,} rows, {args.latency * 1000:.0f} ms injected latency")
+            print(f"  best {min(timings):.3f} s, median {sorted(timings)[len(timings) // 2]:.3f} s "
+                  f"over {args.repeat} runs")
+
+            if args.profile:
+                profiler = cProfile.Profile()
+                profiler.runcall(load_once, cache_dir)
+                pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+        finally:
+            os.chdir(repo_dir)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Full dashboard rerun time with compact dtypes versus plain object/int64 columns.
+
+Runs main.py headlessly with Streamlit's AppTest against a copy of the
+repository's CSV cache (--scale repeats it with shifted years to approximate
+the full 1960+ history). The served dataset is swapped between two layouts of
+the same data, and a fixed sequence of interactions is timed for each: moving
+the year slider, changing the region filter and selecting a country. Every
+interaction is a full script rerun; rounds alternate between the layouts.
+
+  wide     country, country_code, wb_region and income_group as object
+           strings and year as int64 (the table before typed columns)
+  compact  the cache dtypes: categorical labels and an int16 year
+
+Both layouts share the rest of the process (country table, cube, caches), so
+the difference is what the column dtypes cost in filters, isin, groupby and
+joins on every rerun.
+
+Usage:
+    python benchmarks/bench_rerun.py
+    python benchmarks/bench_rerun.py --scale 4 --rounds 5
+"""
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import pandas as pd  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from data_cache import load_cache  # noqa: E402
+
+WIDE_DTYPES = {
+    'country': 'object',
+    'country_code': 'object',
+    'year': 'int64',
+    'wb_region': 'object',
+    'income_group': 'object',
+}
+
+
+def interactions(at, years, country):
+    """Yield (label, action) pairs; each action changes one widget and reruns the script."""
+    # Widgets are looked up again for every action, since a rerun replaces the element tree
+    for year in years:
+        yield 'year slider', lambda year=year: at.select_slider[0].set_value(year).run()
+    yield 'region filter', lambda: at.sidebar.multiselect[0].set_value(['Europe']).run()
+    yield 'region filter', lambda: at.sidebar.multiselect[0].set_value([]).run()
+    yield 'select country', lambda: at.sidebar.selectbox[2].select(country).run()
+    yield 'select country', lambda: at.sidebar.selectbox[2].select('None').run()
+
+
+def time_round(at, live, df, fetched_at, years, country, timings):
+    """Serve df and time one pass of the interaction sequence, adding to timings."""
+    # Each layout keeps its own fetch time, so its DataStore is built once and reused
+    live.publish(df, fetched_at)
+    at.run()
+    for label, action in interactions(at, years, country):
+        start = time.perf_counter()
+        action()
+        timings.setdefault(label, []).append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--csv', default=str(REPO_ROOT / 'inflation_data_cache.csv'), help="Source CSV cache")
+    parser.add_argument('--scale', type=int, default=1, help="Number of times to replicate the data")
+    parser.add_argument('--rounds', type=int, default=3, help="Times the interaction sequence is repeated")
+    parser.add_argument('--country', default='Germany', help="Country selected during the run")
+    args = parser.parse_args()
+
+    source = pd.read_csv(args.csv)
+    span = int(source['year'].max() - source['year'].min() + 1)
+    scaled = pd.concat(
+        [source.assign(year=source['year'] - i * span) for i in range(args.scale)],
+        ignore_index=True
+    )
+
+    workdir = tempfile.mkdtemp()
+    try:
+        os.chdir(workdir)
+        scaled.to_csv('inflation_data_cache.csv', index=False)
+        compact = load_cache()  # Migrates the CSV to the typed Parquet cache
+        wide = compact.astype(WIDE_DTYPES)
+        years = sorted(int(y) for y in compact['year'].unique())[-4:]
+
+        at = AppTest.from_file(str(REPO_ROOT / 'main.py'), default_timeout=300)
+        at.run()
+        import util  # Imported by the app run above; holds the process-wide dataset
+        live = util.get_live_dataset()
+
+        print(f"{len(compact):,} rows; compact {compact.memory_usage(deep=True).sum() / 1024:.0f} KB, "
+              f"wide {wide.memory_usage(deep=True).sum() / 1024:.0f} KB in memory")
+        layouts = {'wide': (wide, time.time() - 1), 'compact': (compact, time.time())}
+        results = {layout: {} for layout in layouts}
+        # Rounds alternate between the layouts so warm-up and drift affect both alike
+        for _ in range(args.rounds):
+            for layout, (df, fetched_at) in layouts.items():
+                time_round(at, live, df, fetched_at, years, args.country, results[layout])
+    finally:
+        os.chdir(REPO_ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"{'rerun':<16}{'wide (ms)':>12}{'compact (ms)':>14}")
+    for label in results['wide']:
+        wide_ms = statistics.median(results['wide'][label]) * 1000
+        compact_ms = statistics.median(results['compact'][label]) * 1000
+        print(f"{label:<16}{wide_ms:>12.1f}{compact_ms:>14.1f}")
+    totals = {layout: sum(sum(t) for t in timings.values()) for layout, timings in results.items()}
+    print(f"Total over {args.rounds} rounds: wide {totals['wide']:.2f} s, compact {totals['compact']:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Memory held by concurrent sessions: shared read-only dataset versus per-rerun copies.
+
+Simulates --sessions Streamlit sessions that are all mid-rerun at once (the
+worst case for a busy app). Each session runs the dashboard's data path for
+one year, cycling through no region filter and a few region filters. The
+objects each rerun holds stay alive until every session has run. Three
+strategies are measured with tracemalloc:
+
+  cache_data copy  every rerun unpickles its own dataset (what st.cache_data
+                   returns) and copies it before filtering
+  copy per rerun   the dataset is shared, but each rerun copies it and
+                   region filters rebuild an indexed store from the copy
+  shared           the dataset and its DataStore are shared; filters keep
+                   the selected rows or a country mask (the current app)
+
+The repository's CSV cache is used. --scale repeats it with shifted years to
+approximate the full 1960+ history or several indicators.
+
+Usage:
+    python benchmarks/bench_session_memory.py
+    python benchmarks/bench_session_memory.py --sessions 50 --scale 5
+"""
+import argparse
+import pickle
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd  # noqa: E402
+
+from analytics import prepare_map_data  # noqa: E402
+from countries import load_country_table  # noqa: E402
+from data_cache import coerce_cache_dtypes  # noqa: E402
+from datastore import DataStore  # noqa: E402
+
+REGION_FILTERS = [None, ['Europe'], None, ['Asia', 'Africa'], None, ['Americas']]
+
+
+def region_codes(country_index, regions):
+    return country_index.loc[country_index['region'].isin(regions), 'country_code']
+
+
+def rerun_cache_data_copy(shared, store, country_index, regions, year):
+    df = pickle.loads(shared['pickled']).copy()
+    if regions:
+        df = df[df['country_code'].isin(region_codes(country_index, regions))]
+    return df, prepare_map_data(df, year)
+
+
+def rerun_copy(shared, store, country_index, regions, year):
+    df = shared['df'].copy()
+    filtered_store = store
+    if regions:
+        codes = region_codes(country_index, regions)
+        df = df[df['country_code'].isin(codes)]
+        filtered_store = DataStore(df)
+    return df, filtered_store, prepare_map_data(df, year, store=filtered_store)
+
+
+def rerun_shared(shared, store, country_index, regions, year):
+    df = shared['df']
+    filtered_store = store
+    if regions:
+        codes = region_codes(country_index, regions)
+        df = df[df['country_code'].isin(codes)]
+        filtered_store = store.select_countries(codes)
+    return df, filtered_store, prepare_map_data(df, year, store=filtered_store)
+
+
+def measure(rerun, shared, store, country_index, sessions, year):
+    """Run `sessions` reruns, keeping every result alive; return (held bytes, peak bytes) over the baseline."""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    held = [
+        rerun(shared, store, country_index, REGION_FILTERS[i % len(REGION_FILTERS)], year)
+        for i in range(sessions)
+    ]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return current - baseline, peak - baseline
+
+
+def main():
+    repo_root = Path(__file__).resolve().parent.parent
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--csv', default=str(repo_root / 'inflation_data_cache.csv'), help="Source CSV cache")
+    parser.add_argument('--scale', type=int, default=1, help="Number of times to replicate the data")
+    parser.add_argument('--sessions', type=int, default=50, help="Simulated concurrent sessions")
+    args = parser.parse_args()
+
+    source = pd.read_csv(args.csv)
+    span = int(source['year'].max() - source['year'].min() + 1)
+    df = coerce_cache_dtypes(pd.concat(
+        [source.assign(year=source['year'] - i * span) for i in range(args.scale)],
+        ignore_index=True
+    ))
+    year = int(df['year'].max())
+    country_index = load_country_table().join(
+        df[['country', 'country_code']].drop_duplicates('country_code'), columns=('region',)
+    )
+    shared = {'df': df, 'pickled': pickle.dumps(df)}
+    store = DataStore(df)
+    # Warm up lazily built caches (country table lookups, pandas internals) outside the measurement
+    for rerun in (rerun_cache_data_copy, rerun_copy, rerun_shared):
+        rerun(shared, store, country_index, REGION_FILTERS[1], year)
+
+    dataset_bytes = df.memory_usage(deep=True).sum()
+    print(f"{len(df):,} rows, {dataset_bytes / 1024 ** 2:.2f} MB in memory; {args.sessions} concurrent sessions")
+    print(f"{'strategy':<18}{'held':>12}{'peak':>12}{'per session':>14}")
+    for label, rerun in [
+        ('cache_data copy', rerun_cache_data_copy),
+        ('copy per rerun', rerun_copy),
+        ('shared', rerun_shared),
+    ]:
+        held, peak = measure(rerun, shared, store, country_index, args.sessions, year)
+        print(f"{label:<18}{held / 1024 ** 2:>9.2f} MB{peak / 1024 ** 2:>9.2f} MB"
+              f"{held / args.sessions / 1024:>11.1f} KB")
+
+
+if __name__ == '__main__':
+    main()
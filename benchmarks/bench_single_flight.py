@@ -0,0 +1,76 @@
+"""
+Cold-start several worker processes against one cache directory at once.
+
+Each process tries to refresh the cache through data_cache.single_flight. Only
+one of them should crawl the (local stand-in) API; the rest wait on the cache
+lock and load the file it wrote. Every process must end up with the same data.
+
+Usage:
+    python benchmarks/bench_single_flight.py --processes 6 --latency 0.2
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_worldbank import FakeWorldBankServer, synthetic_records  # noqa: E402
+
+
+def worker(cache_dir, base_url, results):
+    os.chdir(cache_dir)
+    import ingestion
+    from data_cache import save_cache, single_flight
+
+    ingestion.WORLD_BANK_API_URL = base_url
+
+    def refresh_and_save():
+        df, _, last_updated = ingestion.refresh_inflation_data()
+        save_cache(df, source_last_updated=last_updated)
+        return df
+
+    start = time.perf_counter()
+    df, fetched_here = single_flight(refresh_and_save)
+    results.put((os.getpid(), fetched_here, len(df), float(df['inflation'].sum()), time.perf_counter() - start))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--processes', type=int, default=6, help="Number of worker processes")
+    parser.add_argument('--latency', type=float, default=0.2, help="Injected latency per response (seconds)")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context('spawn')
+    results = ctx.Queue()
+
+    with tempfile.TemporaryDirectory() as cache_dir, \
+            FakeWorldBankServer(synthetic_records(), latency=args.latency) as server:
+        processes = [
+            ctx.Process(target=worker, args=(cache_dir, server.base_url, results))
+            for _ in range(args.processes)
+        ]
+        for process in processes:
+            process.start()
+        rows = [results.get(timeout=120) for _ in processes]
+        for process in processes:
+            process.join()
+        requests_served = server.request_count
+
+    fetchers = [row for row in rows if row[1]]
+    print(f"{args.processes} processes, {requests_served} API requests served")
+    for pid, fetched_here, n_rows, checksum, elapsed in sorted(rows, key=lambda row: row[4]):
+        role = "fetched from API" if fetched_here else "reused cache"
+        print(f"  pid {pid}: {role:<17} {n_rows:,} rows in {elapsed:.2f} s")
+
+    if len(fetchers) != 1:
+        raise SystemExit(f"Expected exactly one process to fetch, got {len(fetchers)}")
+    if len({(row[2], round(row[3], 6)) for row in rows}) != 1:
+        raise SystemExit("Processes ended up with different data")
+
+
+if __name__ == '__main__':
+    main()
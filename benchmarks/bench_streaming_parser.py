@@ -0,0 +1,86 @@
+"""
+Compare the old list-of-dicts ingestion with the streaming column parser.
+
+Pages are pre-serialised to JSON bytes (as they arrive from the API) so only
+decoding, parsing and DataFrame assembly are measured. Peak memory is traced
+with tracemalloc while each approach consumes the pages one at a time.
+
+Usage:
+    python benchmarks/bench_streaming_parser.py --start-year 1960 --indicators 4
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd  # noqa: E402
+
+from fake_worldbank import page_payload, synthetic_records  # noqa: E402
+from ingestion import ObservationColumns, iter_observations  # noqa: E402
+
+
+def list_of_dicts(pages):
+    all_records = []
+    for body in pages:
+        for item in json.loads(body)[1]:
+            if item['value'] is not None:
+                all_records.append({
+                    'country': item['country']['value'],
+                    'country_code': item['countryiso3code'],
+                    'year': int(item['date']),
+                    'inflation': float(item['value'])
+                })
+    return pd.DataFrame(all_records)
+
+
+def streaming_columns(pages):
+    columns = ObservationColumns()
+    for body in pages:
+        columns.extend(iter_observations(json.loads(body)[1]))
+    return columns.to_frame()
+
+
+def measure(parse, pages):
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = parse(pages)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return df, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--start-year', type=int, default=1960, help="First year of synthetic data")
+    parser.add_argument('--indicators', type=int, default=4, help="Copies of the dataset (simulated indicators)")
+    parser.add_argument('--per-page', type=int, default=1000, help="Records per API page")
+    args = parser.parse_args()
+
+    records = synthetic_records(start_year=args.start_year) * args.indicators
+    n_pages = -(-len(records) // args.per_page)
+    pages = [
+        json.dumps(page_payload(records, {'per_page': [str(args.per_page)], 'page': [str(page)]})).encode('utf-8')
+        for page in range(1, n_pages + 1)
+    ]
+
+    baseline_df, baseline_time, baseline_peak = measure(list_of_dicts, pages)
+    streaming_df, streaming_time, streaming_peak = measure(streaming_columns, pages)
+
+    pd.testing.assert_frame_equal(
+        baseline_df.astype({'year': 'int16'}),
+        streaming_df.astype({'country': object, 'country_code': object}),
+    )
+
+    print(f"{len(records):,} observations in {n_pages} pages")
+    print(f"{'parser':<16}{'time (s)':>10}{'peak memory':>16}")
+    print(f"{'list of dicts':<16}{baseline_time:>10.2f}{baseline_peak / 2**20:>13.1f} MB")
+    print(f"{'streaming':<16}{streaming_time:>10.2f}{streaming_peak / 2**20:>13.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,284 @@
+"""
+Local stand-in for the World Bank indicator and country APIs.
+
+Serves paginated JSON in the same shape as api.worldbank.org/v2 so ingestion
+code can be exercised and timed without network access. A fixed latency can be
+injected into every response to mimic a slow upstream, and every Nth request can
+be failed with a transient error status to mimic a flaky one. Responses are
+gzip-compressed when the client asks for it. write_bulk_archive builds the
+matching bulk CSV/ZIP download.
+"""
+import csv
+import gzip
+import io
+import json
+import random
+import zipfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+def synthetic_records(n_countries=260, start_year=2010, end_year=2024, seed=7):
+    """
+    Build a deterministic synthetic inflation dataset.
+
+    Args:
+        n_countries: Number of fake countries to generate
+        start_year: First year of data
+        end_year: Last year of data
+        seed: Seed for the pseudo-random inflation values
+
+    Returns:
+        list: Dictionaries with country, country_code, year and inflation keys
+    """
+    rng = random.Random(seed)
+    records = []
+    for i in range(n_countries):
+        name = f"Country {i:03d}"
+        code = f"{chr(65 + i // 676 % 26)}{chr(65 + i // 26 % 26)}{chr(65 + i % 26)}"
+        for year in range(end_year, start_year - 1, -1):
+            records.append({
+                'country': name,
+                'country_code': code,
+                'year': year,
+                'inflation': round(rng.gauss(4.0, 3.0), 6),
+            })
+    return records
+
+
+def page_payload(records, query, last_updated='2025-01-01'):
+    """
+    Build the [metadata, items] payload the World Bank API returns for a query.
+
+    Args:
+        records: Dictionaries with country, country_code, year and inflation keys
+        query: Parsed query string, as returned by urllib.parse.parse_qs
+        last_updated: Date reported in the metadata's 'lastupdated' field
+
+    Returns:
+        list: [metadata, items] for the requested page
+    """
+    per_page = int(query.get('per_page', ['50'])[0])
+    page = int(query.get('page', ['1'])[0])
+
+    rows = records
+    if 'date' in query:
+        start, _, end = query['date'][0].partition(':')
+        start, end = int(start), int(end or start)
+        rows = [r for r in rows if start <= r['year'] <= end]
+
+    total = len(rows)
+    pages = max(1, -(-total // per_page))
+    chunk = rows[(page - 1) * per_page:page * per_page]
+
+    metadata = {
+        'page': page,
+        'pages': pages,
+        'per_page': per_page,
+        'total': total,
+        'sourceid': '2',
+        'lastupdated': last_updated,
+    }
+    items = [
+        {
+            'indicator': {'id': 'FP.CPI.TOTL.ZG', 'value': 'Inflation, consumer prices (annual %)'},
+            'country': {'id': r['country_code'][:2], 'value': r['country']},
+            'countryiso3code': r['country_code'],
+            'date': str(r['year']),
+            'value': r['inflation'],
+            'unit': '',
+            'obs_status': '',
+            'decimal': 1,
+        }
+        for r in chunk
+    ]
+    return [metadata, items]
+
+
+def country_payload(records, query, aggregate_codes=()):
+    """
+    Build the [metadata, items] payload of the country endpoint for a query.
+
+    Every distinct country in `records` is listed; codes in `aggregate_codes` are
+    reported in the 'Aggregates' region like the World Bank's regional and income
+    group aggregates.
+
+    Args:
+        records: Dictionaries with country and country_code keys
+        query: Parsed query string, as returned by urllib.parse.parse_qs
+        aggregate_codes: Country codes to report as aggregates
+
+    Returns:
+        list: [metadata, items] for the requested page
+    """
+    per_page = int(query.get('per_page', ['50'])[0])
+    page = int(query.get('page', ['1'])[0])
+
+    countries = sorted({(r['country_code'], r['country']) for r in records if r['country_code']})
+    total = len(countries)
+    chunk = countries[(page - 1) * per_page:page * per_page]
+
+    metadata = {'page': page, 'pages': max(1, -(-total // per_page)), 'per_page': str(per_page), 'total': total}
+    items = []
+    for code, name in chunk:
+        aggregate = code in aggregate_codes
+        items.append({
+            'id': code,
+            'iso2Code': code[:2],
+            'name': name,
+            'region': {'id': 'NA' if aggregate else 'TST', 'value': 'Aggregates' if aggregate else 'Test Region '},
+            'incomeLevel': {'id': 'NA' if aggregate else 'UMC',
+                            'value': 'Aggregates' if aggregate else 'Upper middle income'},
+            'capitalCity': '',
+            'longitude': '',
+            'latitude': '',
+        })
+    return [metadata, items]
+
+
+def write_bulk_archive(path, records, indicator='FP.CPI.TOTL.ZG', filler_indicators=0,
+                       layout='wdi', last_updated='2025-01-01', seed=7):
+    """
+    Write records as a World Bank bulk download ZIP.
+
+    Args:
+        path: Destination ZIP file
+        records: Dictionaries with country, country_code, year and inflation keys
+        indicator: Indicator code the inflation values are written under
+        filler_indicators: Number of extra random indicators per country, to mimic the
+            size of the full WDI file (which has ~1,500 indicators)
+        layout: 'wdi' for WDI_CSV.zip (WDICSV.csv and WDICountry.csv) or 'indicator'
+            for a single-indicator API_*.zip (with its preamble and Metadata_Country file)
+        last_updated: 'Last Updated Date' written to a single-indicator preamble
+        seed: Seed for the filler values
+    """
+    rng = random.Random(seed)
+    years = sorted({r['year'] for r in records})
+    values = {}
+    names = {}
+    for r in records:
+        values[(r['country_code'], r['year'])] = r['inflation']
+        names[r['country_code']] = r['country']
+
+    data = io.StringIO()
+    if layout == 'indicator':
+        data.write('"Data Source","World Development Indicators",\n\n')
+        data.write(f'"Last Updated Date","{last_updated}",\n\n')
+    writer = csv.writer(data, quoting=csv.QUOTE_ALL if layout == 'indicator' else csv.QUOTE_MINIMAL)
+    writer.writerow(['Country Name', 'Country Code', 'Indicator Name', 'Indicator Code'] + [str(y) for y in years])
+    for code, name in sorted(names.items()):
+        for i in range(filler_indicators):
+            writer.writerow([name, code, f'Filler indicator {i}, synthetic', f'XX.FILL.{i:04d}']
+                            + [f'{rng.gauss(50, 20):.6f}' for _ in years])
+        writer.writerow([name, code, 'Inflation, consumer prices (annual %)', indicator]
+                        + ['' if values.get((code, y)) is None else repr(values[(code, y)]) for y in years])
+
+    countries = io.StringIO()
+    writer = csv.writer(countries)
+    if layout == 'indicator':
+        writer.writerow(['Country Code', 'Region', 'IncomeGroup', 'SpecialNotes', 'TableName'])
+        for code, name in sorted(names.items()):
+            writer.writerow([code, 'Test Region', 'Upper middle income', '', name])
+        members = {f'API_{indicator}_DS2_en_csv_v2.csv': data, f'Metadata_Country_API_{indicator}.csv': countries}
+    else:
+        writer.writerow(['Country Code', 'Short Name', 'Table Name', 'Region', 'Income Group'])
+        for code, name in sorted(names.items()):
+            writer.writerow([code, name, name, 'Test Region', 'Upper middle income'])
+        members = {'WDICSV.csv': data, 'WDICountry.csv': countries}
+
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members.items():
+            archive.writestr(name, content.getvalue())
+
+
+class FakeWorldBankServer:
+    """
+    Threaded HTTP server answering World Bank style indicator queries.
+
+    Usage:
+        with FakeWorldBankServer(records, latency=0.2) as server:
+            url = f"{server.base_url}/country/all/indicator/FP.CPI.TOTL.ZG"
+    """
+
+    def __init__(self, records, latency=0.0, fail_every=0, fail_status=503, host="127.0.0.1", port=0,
+                 last_updated='2025-01-01', aggregate_codes=()):
+        self.records = records
+        self.last_updated = last_updated
+        self.aggregate_codes = set(aggregate_codes)
+        self.latency = latency
+        self.fail_every = fail_every
+        self.fail_status = fail_status
+        self.request_count = 0
+        self.failure_count = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v2"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def page_payload(self, query, path=''):
+        """Build the [metadata, items] payload for a parsed query string."""
+        if path.rstrip('/').endswith('/country'):
+            return country_payload(self.records, query, self.aggregate_codes)
+        return page_payload(self.records, query, self.last_updated)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.request_count += 1
+                    fail = server.fail_every and server.request_count % server.fail_every == 0
+                    if fail:
+                        server.failure_count += 1
+                if server.latency:
+                    time.sleep(server.latency)
+
+                if fail:
+                    self.send_response(server.fail_status)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                url = urlparse(self.path)
+                payload = server.page_payload(parse_qs(url.query), url.path)
+                body = json.dumps(payload).encode('utf-8')
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                    body = gzip.compress(body)
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with server._lock:
+                    server.bytes_sent += len(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -1,368 +1,68 @@
-import streamlit as st
+import os
+
 
 # ---- Page configuration ----
 def set_page_config():
+    # Imported here so the data-loading modules can use this config without Streamlit
+    import streamlit as st
+
     st.set_page_config(
         page_title="Global Inflation Tracker",
         page_icon="🌍",
         layout="wide"
     )
 
-# ---- Country coordinates mapping (ALL World Bank countries - 200+ entries) ----
-COUNTRY_COORDS = {
-    # A
-    'Afghanistan': {'lat': 33.9391, 'lon': 67.7100},
-    'Albania': {'lat': 41.1533, 'lon': 20.1683},
-    'Algeria': {'lat': 28.0339, 'lon': 1.6596},
-    'American Samoa': {'lat': -14.2710, 'lon': -170.1322},
-    'Andorra': {'lat': 42.5063, 'lon': 1.5218},
-    'Angola': {'lat': -11.2027, 'lon': 17.8739},
-    'Antigua and Barbuda': {'lat': 17.0608, 'lon': -61.7964},
-    'Argentina': {'lat': -38.4161, 'lon': -63.6167},
-    'Armenia': {'lat': 40.0691, 'lon': 45.0382},
-    'Aruba': {'lat': 12.5211, 'lon': -69.9683},
-    'Australia': {'lat': -25.2744, 'lon': 133.7751},
-    'Austria': {'lat': 47.5162, 'lon': 14.5501},
-    'Azerbaijan': {'lat': 40.1431, 'lon': 47.5769},
-
-    # B
-    'Bahamas, The': {'lat': 25.0343, 'lon': -77.3963},
-    'Bahrain': {'lat': 26.0667, 'lon': 50.5577},
-    'Bangladesh': {'lat': 23.6850, 'lon': 90.3563},
-    'Barbados': {'lat': 13.1939, 'lon': -59.5432},
-    'Belarus': {'lat': 53.7098, 'lon': 27.9534},
-    'Belgium': {'lat': 50.5039, 'lon': 4.4699},
-    'Belize': {'lat': 17.1899, 'lon': -88.4976},
-    'Benin': {'lat': 9.3077, 'lon': 2.3158},
-    'Bermuda': {'lat': 32.3078, 'lon': -64.7505},
-    'Bhutan': {'lat': 27.5142, 'lon': 90.4336},
-    'Bolivia': {'lat': -16.2902, 'lon': -63.5887},
-    'Bosnia and Herzegovina': {'lat': 43.9159, 'lon': 17.6791},
-    'Botswana': {'lat': -22.3285, 'lon': 24.6849},
-    'Brazil': {'lat': -14.2350, 'lon': -51.9253},
-    'Brunei Darussalam': {'lat': 4.5353, 'lon': 114.7277},
-    'Bulgaria': {'lat': 42.7339, 'lon': 25.4858},
-    'Burkina Faso': {'lat': 12.2383, 'lon': -1.5616},
-    'Burundi': {'lat': -3.3731, 'lon': 29.9189},
-
-    # C
-    'Cabo Verde': {'lat': 16.5388, 'lon': -23.0418},
-    'Cambodia': {'lat': 12.5657, 'lon': 104.9910},
-    'Cameroon': {'lat': 7.3697, 'lon': 12.3547},
-    'Canada': {'lat': 56.1304, 'lon': -106.3468},
-    'Cayman Islands': {'lat': 19.3133, 'lon': -81.2546},
-    'Central African Republic': {'lat': 6.6111, 'lon': 20.9394},
-    'Chad': {'lat': 15.4542, 'lon': 18.7322},
-    'Channel Islands': {'lat': 49.3723, 'lon': -2.3644},
-    'Chile': {'lat': -35.6751, 'lon': -71.5430},
-    'China': {'lat': 35.8617, 'lon': 104.1954},
-    'Colombia': {'lat': 4.5709, 'lon': -74.2973},
-    'Comoros': {'lat': -11.6455, 'lon': 43.3333},
-    'Congo, Dem. Rep.': {'lat': -4.0383, 'lon': 21.7587},
-    'Congo, Rep.': {'lat': -0.2280, 'lon': 15.8277},
-    'Costa Rica': {'lat': 9.7489, 'lon': -83.7534},
-    "Cote d'Ivoire": {'lat': 7.5400, 'lon': -5.5471},
-    'Croatia': {'lat': 45.1, 'lon': 15.2},
-    'Cuba': {'lat': 21.5218, 'lon': -77.7812},
-    'Curacao': {'lat': 12.1696, 'lon': -68.9900},
-    'Cyprus': {'lat': 35.1264, 'lon': 33.4299},
-    'Czech Republic': {'lat': 49.8175, 'lon': 15.4730},
-    'Czechia': {'lat': 49.8175, 'lon': 15.4730},
-
-    # D
-    'Denmark': {'lat': 56.2639, 'lon': 9.5018},
-    'Djibouti': {'lat': 11.8251, 'lon': 42.5903},
-    'Dominica': {'lat': 15.4150, 'lon': -61.3710},
-    'Dominican Republic': {'lat': 18.7357, 'lon': -70.1627},
-
-    # E
-    'Ecuador': {'lat': -1.8312, 'lon': -78.1834},
-    'Egypt, Arab Rep.': {'lat': 26.8206, 'lon': 30.8025},
-    'El Salvador': {'lat': 13.7942, 'lon': -88.8965},
-    'Equatorial Guinea': {'lat': 1.6508, 'lon': 10.2679},
-    'Eritrea': {'lat': 15.1794, 'lon': 39.7823},
-    'Estonia': {'lat': 58.5953, 'lon': 25.0136},
-    'Eswatini': {'lat': -26.5225, 'lon': 31.4659},
-    'Ethiopia': {'lat': 9.1450, 'lon': 40.4897},
-
-    # F
-    'Faroe Islands': {'lat': 61.8926, 'lon': -6.9118},
-    'Fiji': {'lat': -17.7134, 'lon': 178.0650},
-    'Finland': {'lat': 61.9241, 'lon': 25.7482},
-    'France': {'lat': 46.2276, 'lon': 2.2137},
-    'French Polynesia': {'lat': -17.6797, 'lon': -149.4068},
-
-    # G
-    'Gabon': {'lat': -0.8037, 'lon': 11.6094},
-    'Gambia, The': {'lat': 13.4432, 'lon': -15.3101},
-    'Georgia': {'lat': 42.3154, 'lon': 43.3569},
-    'Germany': {'lat': 51.1657, 'lon': 10.4515},
-    'Ghana': {'lat': 7.9465, 'lon': -1.0232},
-    'Gibraltar': {'lat': 36.1408, 'lon': -5.3536},
-    'Greece': {'lat': 39.0742, 'lon': 21.8243},
-    'Greenland': {'lat': 71.7069, 'lon': -42.6043},
-    'Grenada': {'lat': 12.1165, 'lon': -61.6790},
-    'Guam': {'lat': 13.4443, 'lon': 144.7937},
-    'Guatemala': {'lat': 15.7835, 'lon': -90.2308},
-    'Guinea': {'lat': 9.9456, 'lon': -9.6966},
-    'Guinea-Bissau': {'lat': 11.8037, 'lon': -15.1804},
-    'Guyana': {'lat': 4.8604, 'lon': -58.9302},
-
-    # H
-    'Haiti': {'lat': 18.9712, 'lon': -72.2852},
-    'Honduras': {'lat': 15.2000, 'lon': -86.2419},
-    'Hong Kong SAR, China': {'lat': 22.3193, 'lon': 114.1694},
-    'Hungary': {'lat': 47.1625, 'lon': 19.5033},
-
-    # I
-    'Iceland': {'lat': 64.9631, 'lon': -19.0208},
-    'India': {'lat': 20.5937, 'lon': 78.9629},
-    'Indonesia': {'lat': -0.7893, 'lon': 113.9213},
-    'Iran, Islamic Rep.': {'lat': 32.4279, 'lon': 53.6880},
-    'Iraq': {'lat': 33.2232, 'lon': 43.6793},
-    'Ireland': {'lat': 53.4129, 'lon': -8.2439},
-    'Isle of Man': {'lat': 54.2361, 'lon': -4.5481},
-    'Israel': {'lat': 31.0461, 'lon': 34.8516},
-    'Italy': {'lat': 41.8719, 'lon': 12.5674},
-
-    # J
-    'Jamaica': {'lat': 18.1096, 'lon': -77.2975},
-    'Japan': {'lat': 36.2048, 'lon': 138.2529},
-    'Jordan': {'lat': 30.5852, 'lon': 36.2384},
-
-    # K
-    'Kazakhstan': {'lat': 48.0196, 'lon': 66.9237},
-    'Kenya': {'lat': -0.0236, 'lon': 37.9062},
-    'Kiribati': {'lat': -3.3704, 'lon': -168.7340},
-    'Korea, Dem. People\'s Rep.': {'lat': 40.3399, 'lon': 127.5101},
-    'Korea, Rep.': {'lat': 35.9078, 'lon': 127.7669},
-    'Kosovo': {'lat': 42.6026, 'lon': 20.9030},
-    'Kuwait': {'lat': 29.3117, 'lon': 47.4818},
-    'Kyrgyz Republic': {'lat': 41.2044, 'lon': 74.7661},
-
-    # L
-    'Lao PDR': {'lat': 19.8563, 'lon': 102.4955},
-    'Latvia': {'lat': 56.8796, 'lon': 24.6032},
-    'Lebanon': {'lat': 33.8547, 'lon': 35.8623},
-    'Lesotho': {'lat': -29.6100, 'lon': 28.2336},
-    'Liberia': {'lat': 6.4281, 'lon': -9.4295},
-    'Libya': {'lat': 26.3351, 'lon': 17.2283},
-    'Liechtenstein': {'lat': 47.1660, 'lon': 9.5554},
-    'Lithuania': {'lat': 55.1694, 'lon': 23.8813},
-    'Luxembourg': {'lat': 49.8153, 'lon': 6.1296},
-
-    # M
-    'Macao SAR, China': {'lat': 22.1987, 'lon': 113.5439},
-    'Madagascar': {'lat': -18.7669, 'lon': 46.8691},
-    'Malawi': {'lat': -13.2543, 'lon': 34.3015},
-    'Malaysia': {'lat': 4.2105, 'lon': 101.9758},
-    'Maldives': {'lat': 3.2028, 'lon': 73.2207},
-    'Mali': {'lat': 17.5707, 'lon': -3.9962},
-    'Malta': {'lat': 35.9375, 'lon': 14.3754},
-    'Marshall Islands': {'lat': 7.1315, 'lon': 171.1845},
-    'Mauritania': {'lat': 21.0079, 'lon': -10.9408},
-    'Mauritius': {'lat': -20.3484, 'lon': 57.5522},
-    'Mexico': {'lat': 23.6345, 'lon': -102.5528},
-    'Micronesia, Fed. Sts.': {'lat': 7.4256, 'lon': 150.5508},
-    'Moldova': {'lat': 47.4116, 'lon': 28.3699},
-    'Monaco': {'lat': 43.7384, 'lon': 7.4246},
-    'Mongolia': {'lat': 46.8625, 'lon': 103.8467},
-    'Montenegro': {'lat': 42.7087, 'lon': 19.3744},
-    'Morocco': {'lat': 31.7917, 'lon': -7.0926},
-    'Mozambique': {'lat': -18.6657, 'lon': 35.5296},
-    'Myanmar': {'lat': 21.9162, 'lon': 95.9560},
-
-    # N
-    'Namibia': {'lat': -22.9576, 'lon': 18.4904},
-    'Nauru': {'lat': -0.5228, 'lon': 166.9315},
-    'Nepal': {'lat': 28.3949, 'lon': 84.1240},
-    'Netherlands': {'lat': 52.1326, 'lon': 5.2913},
-    'New Caledonia': {'lat': -20.9043, 'lon': 165.6180},
-    'New Zealand': {'lat': -40.9006, 'lon': 174.8860},
-    'Nicaragua': {'lat': 12.8654, 'lon': -85.2072},
-    'Niger': {'lat': 17.6078, 'lon': 8.0817},
-    'Nigeria': {'lat': 9.0820, 'lon': 8.6753},
-    'North Macedonia': {'lat': 41.6086, 'lon': 21.7453},
-    'Northern Mariana Islands': {'lat': 15.0979, 'lon': 145.6739},
-    'Norway': {'lat': 60.4720, 'lon': 8.4689},
-
-    # O
-    'Oman': {'lat': 21.4735, 'lon': 55.9754},
-
-    # P
-    'Pakistan': {'lat': 30.3753, 'lon': 69.3451},
-    'Palau': {'lat': 7.5150, 'lon': 134.5825},
-    'Panama': {'lat': 8.5380, 'lon': -80.7821},
-    'Papua New Guinea': {'lat': -6.3150, 'lon': 143.9555},
-    'Paraguay': {'lat': -23.4425, 'lon': -58.4438},
-    'Peru': {'lat': -9.1900, 'lon': -75.0152},
-    'Philippines': {'lat': 12.8797, 'lon': 121.7740},
-    'Poland': {'lat': 51.9194, 'lon': 19.1451},
-    'Portugal': {'lat': 39.3999, 'lon': -8.2245},
-    'Puerto Rico': {'lat': 18.2208, 'lon': -66.5901},
-
-    # Q
-    'Qatar': {'lat': 25.3548, 'lon': 51.1839},
-
-    # R
-    'Romania': {'lat': 45.9432, 'lon': 24.9668},
-    'Russian Federation': {'lat': 61.5240, 'lon': 105.3188},
-    'Rwanda': {'lat': -1.9403, 'lon': 29.8739},
-
-    # S
-    'Samoa': {'lat': -13.7590, 'lon': -172.1046},
-    'San Marino': {'lat': 43.9424, 'lon': 12.4578},
-    'Sao Tome and Principe': {'lat': 0.1864, 'lon': 6.6131},
-    'Saudi Arabia': {'lat': 23.8859, 'lon': 45.0792},
-    'Senegal': {'lat': 14.4974, 'lon': -14.4524},
-    'Serbia': {'lat': 44.0165, 'lon': 21.0059},
-    'Seychelles': {'lat': -4.6796, 'lon': 55.4920},
-    'Sierra Leone': {'lat': 8.4606, 'lon': -11.7799},
-    'Singapore': {'lat': 1.3521, 'lon': 103.8198},
-    'Sint Maarten (Dutch part)': {'lat': 18.0425, 'lon': -63.0548},
-    'Slovak Republic': {'lat': 48.6690, 'lon': 19.6990},
-    'Slovenia': {'lat': 46.1512, 'lon': 14.9955},
-    'Solomon Islands': {'lat': -9.6457, 'lon': 160.1562},
-    'Somalia': {'lat': 5.1521, 'lon': 46.1996},
-    'South Africa': {'lat': -30.5595, 'lon': 22.9375},
-    'South Sudan': {'lat': 6.8770, 'lon': 31.3070},
-    'Spain': {'lat': 40.4637, 'lon': -3.7492},
-    'Sri Lanka': {'lat': 7.8731, 'lon': 80.7718},
-    'St. Kitts and Nevis': {'lat': 17.3578, 'lon': -62.7830},
-    'St. Lucia': {'lat': 13.9094, 'lon': -60.9789},
-    'St. Martin (French part)': {'lat': 18.0708, 'lon': -63.0501},
-    'St. Vincent and the Grenadines': {'lat': 12.9843, 'lon': -61.2872},
-    'Sudan': {'lat': 12.8628, 'lon': 30.2176},
-    'Suriname': {'lat': 3.9193, 'lon': -56.0278},
-    'Sweden': {'lat': 60.1282, 'lon': 18.6435},
-    'Switzerland': {'lat': 46.8182, 'lon': 8.2275},
-    'Syrian Arab Republic': {'lat': 34.8021, 'lon': 38.9968},
-
-    # T
-    'Tajikistan': {'lat': 38.8610, 'lon': 71.2761},
-    'Tanzania': {'lat': -6.3690, 'lon': 34.8888},
-    'Thailand': {'lat': 15.8700, 'lon': 100.9925},
-    'Timor-Leste': {'lat': -8.8742, 'lon': 125.7275},
-    'Togo': {'lat': 8.6195, 'lon': 0.8248},
-    'Tonga': {'lat': -21.1789, 'lon': -175.1982},
-    'Trinidad and Tobago': {'lat': 10.6918, 'lon': -61.2225},
-    'Tunisia': {'lat': 33.8869, 'lon': 9.5375},
-    'Turkey': {'lat': 38.9637, 'lon': 35.2433},
-    'Turkiye': {'lat': 38.9637, 'lon': 35.2433},
-    'Turkmenistan': {'lat': 38.9697, 'lon': 59.5563},
-    'Turks and Caicos Islands': {'lat': 21.6940, 'lon': -71.7979},
-    'Tuvalu': {'lat': -7.1095, 'lon': 177.6493},
-
-    # U
-    'Uganda': {'lat': 1.3733, 'lon': 32.2903},
-    'Ukraine': {'lat': 48.3794, 'lon': 31.1656},
-    'United Arab Emirates': {'lat': 23.4241, 'lon': 53.8478},
-    'United Kingdom': {'lat': 55.3781, 'lon': -3.4360},
-    'United States': {'lat': 37.0902, 'lon': -95.7129},
-    'Uruguay': {'lat': -32.5228, 'lon': -55.7658},
-    'Uzbekistan': {'lat': 41.3775, 'lon': 64.5853},
-
-    # V
-    'Vanuatu': {'lat': -15.3767, 'lon': 166.9592},
-    'Venezuela, RB': {'lat': 6.4238, 'lon': -66.5897},
-    'Vietnam': {'lat': 14.0583, 'lon': 108.2772},
-    'Virgin Islands (U.S.)': {'lat': 18.3358, 'lon': -64.8963},
-
-    # W
-    'West Bank and Gaza': {'lat': 31.9522, 'lon': 35.2332},
-
-    # Y
-    'Yemen, Rep.': {'lat': 15.5527, 'lon': 48.5164},
-
-    # Z
-    'Zambia': {'lat': -13.1339, 'lon': 27.8493},
-    'Zimbabwe': {'lat': -19.0154, 'lon': 29.1549},
+# ---- World Bank API settings ----
+WORLD_BANK_API_URL = "https://api.worldbank.org/v2"
+INFLATION_INDICATOR = "FP.CPI.TOTL.ZG"
+# Inflation measures available to the multi-indicator ingestion engine
+INDICATORS = {
+    'FP.CPI.TOTL.ZG': 'Inflation, consumer prices (annual %)',
+    'NY.GDP.DEFL.KD.ZG': 'Inflation, GDP deflator (annual %)',
+    'NY.GDP.DEFL.KD.ZG.AD': 'Inflation, GDP deflator: linked series (annual %)',
+    'FP.CPI.TOTL': 'Consumer price index (2010 = 100)',
 }
-
-# ---- Region mapping for ALL countries (200+ entries) ----
-COUNTRY_REGIONS = {
-    'Afghanistan': 'Asia', 'Albania': 'Europe', 'Algeria': 'Africa', 'American Samoa': 'Oceania',
-    'Andorra': 'Europe', 'Angola': 'Africa', 'Antigua and Barbuda': 'Central America & Caribbean',
-    'Argentina': 'South America', 'Armenia': 'Central Asia', 'Aruba': 'Central America & Caribbean',
-    'Australia': 'Oceania', 'Austria': 'Europe', 'Azerbaijan': 'Central Asia',
-    'Bahamas, The': 'Central America & Caribbean', 'Bahrain': 'Middle East', 'Bangladesh': 'Asia',
-    'Barbados': 'Central America & Caribbean', 'Belarus': 'Europe', 'Belgium': 'Europe',
-    'Belize': 'Central America & Caribbean', 'Benin': 'Africa', 'Bermuda': 'Central America & Caribbean',
-    'Bhutan': 'Asia', 'Bolivia': 'South America', 'Bosnia and Herzegovina': 'Europe',
-    'Botswana': 'Africa', 'Brazil': 'South America', 'Brunei Darussalam': 'Asia',
-    'Bulgaria': 'Europe', 'Burkina Faso': 'Africa', 'Burundi': 'Africa',
-    'Cabo Verde': 'Africa', 'Cambodia': 'Asia', 'Cameroon': 'Africa',
-    'Canada': 'North America', 'Cayman Islands': 'Central America & Caribbean',
-    'Central African Republic': 'Africa', 'Chad': 'Africa', 'Channel Islands': 'Europe',
-    'Chile': 'South America', 'China': 'Asia', 'Colombia': 'South America',
-    'Comoros': 'Africa', 'Congo, Dem. Rep.': 'Africa', 'Congo, Rep.': 'Africa',
-    'Costa Rica': 'Central America & Caribbean', "Cote d'Ivoire": 'Africa', 'Croatia': 'Europe',
-    'Cuba': 'Central America & Caribbean', 'Curacao': 'Central America & Caribbean', 'Cyprus': 'Europe',
-    'Czech Republic': 'Europe', 'Czechia': 'Europe',
-    'Denmark': 'Europe', 'Djibouti': 'Africa', 'Dominica': 'Central America & Caribbean',
-    'Dominican Republic': 'Central America & Caribbean',
-    'Ecuador': 'South America', 'Egypt, Arab Rep.': 'Africa', 'El Salvador': 'Central America & Caribbean',
-    'Equatorial Guinea': 'Africa', 'Eritrea': 'Africa', 'Estonia': 'Europe',
-    'Eswatini': 'Africa', 'Ethiopia': 'Africa',
-    'Faroe Islands': 'Europe', 'Fiji': 'Oceania', 'Finland': 'Europe',
-    'France': 'Europe', 'French Polynesia': 'Oceania',
-    'Gabon': 'Africa', 'Gambia, The': 'Africa', 'Georgia': 'Central Asia',
-    'Germany': 'Europe', 'Ghana': 'Africa', 'Gibraltar': 'Europe',
-    'Greece': 'Europe', 'Greenland': 'North America', 'Grenada': 'Central America & Caribbean',
-    'Guam': 'Oceania', 'Guatemala': 'Central America & Caribbean', 'Guinea': 'Africa',
-    'Guinea-Bissau': 'Africa', 'Guyana': 'South America',
-    'Haiti': 'Central America & Caribbean', 'Honduras': 'Central America & Caribbean',
-    'Hong Kong SAR, China': 'Asia', 'Hungary': 'Europe',
-    'Iceland': 'Europe', 'India': 'Asia', 'Indonesia': 'Asia',
-    'Iran, Islamic Rep.': 'Middle East', 'Iraq': 'Middle East', 'Ireland': 'Europe',
-    'Isle of Man': 'Europe', 'Israel': 'Middle East', 'Italy': 'Europe',
-    'Jamaica': 'Central America & Caribbean', 'Japan': 'Asia', 'Jordan': 'Middle East',
-    'Kazakhstan': 'Central Asia', 'Kenya': 'Africa', 'Kiribati': 'Oceania',
-    "Korea, Dem. People's Rep.": 'Asia', 'Korea, Rep.': 'Asia', 'Kosovo': 'Europe',
-    'Kuwait': 'Middle East', 'Kyrgyz Republic': 'Central Asia',
-    'Lao PDR': 'Asia', 'Latvia': 'Europe', 'Lebanon': 'Middle East',
-    'Lesotho': 'Africa', 'Liberia': 'Africa', 'Libya': 'Africa',
-    'Liechtenstein': 'Europe', 'Lithuania': 'Europe', 'Luxembourg': 'Europe',
-    'Macao SAR, China': 'Asia', 'Madagascar': 'Africa', 'Malawi': 'Africa',
-    'Malaysia': 'Asia', 'Maldives': 'Asia', 'Mali': 'Africa',
-    'Malta': 'Europe', 'Marshall Islands': 'Oceania', 'Mauritania': 'Africa',
-    'Mauritius': 'Africa', 'Mexico': 'North America', 'Micronesia, Fed. Sts.': 'Oceania',
-    'Moldova': 'Europe', 'Monaco': 'Europe', 'Mongolia': 'Asia',
-    'Montenegro': 'Europe', 'Morocco': 'Africa', 'Mozambique': 'Africa',
-    'Myanmar': 'Asia',
-    'Namibia': 'Africa', 'Nauru': 'Oceania', 'Nepal': 'Asia',
-    'Netherlands': 'Europe', 'New Caledonia': 'Oceania', 'New Zealand': 'Oceania',
-    'Nicaragua': 'Central America & Caribbean', 'Niger': 'Africa', 'Nigeria': 'Africa',
-    'North Macedonia': 'Europe', 'Northern Mariana Islands': 'Oceania', 'Norway': 'Europe',
-    'Oman': 'Middle East',
-    'Pakistan': 'Asia', 'Palau': 'Oceania', 'Panama': 'Central America & Caribbean',
-    'Papua New Guinea': 'Oceania', 'Paraguay': 'South America', 'Peru': 'South America',
-    'Philippines': 'Asia', 'Poland': 'Europe', 'Portugal': 'Europe',
-    'Puerto Rico': 'Central America & Caribbean',
-    'Qatar': 'Middle East',
-    'Romania': 'Europe', 'Russian Federation': 'Europe', 'Rwanda': 'Africa',
-    'Samoa': 'Oceania', 'San Marino': 'Europe', 'Sao Tome and Principe': 'Africa',
-    'Saudi Arabia': 'Middle East', 'Senegal': 'Africa', 'Serbia': 'Europe',
-    'Seychelles': 'Africa', 'Sierra Leone': 'Africa', 'Singapore': 'Asia',
-    'Sint Maarten (Dutch part)': 'Central America & Caribbean', 'Slovak Republic': 'Europe',
-    'Slovenia': 'Europe', 'Solomon Islands': 'Oceania', 'Somalia': 'Africa',
-    'South Africa': 'Africa', 'South Sudan': 'Africa', 'Spain': 'Europe',
-    'Sri Lanka': 'Asia', 'St. Kitts and Nevis': 'Central America & Caribbean',
-    'St. Lucia': 'Central America & Caribbean', 'St. Martin (French part)': 'Central America & Caribbean',
-    'St. Vincent and the Grenadines': 'Central America & Caribbean', 'Sudan': 'Africa',
-    'Suriname': 'South America', 'Sweden': 'Europe', 'Switzerland': 'Europe',
-    'Syrian Arab Republic': 'Middle East',
-    'Tajikistan': 'Central Asia', 'Tanzania': 'Africa', 'Thailand': 'Asia',
-    'Timor-Leste': 'Asia', 'Togo': 'Africa', 'Tonga': 'Oceania',
-    'Trinidad and Tobago': 'Central America & Caribbean', 'Tunisia': 'Africa',
-    'Turkey': 'Europe', 'Turkiye': 'Europe', 'Turkmenistan': 'Central Asia',
-    'Turks and Caicos Islands': 'Central America & Caribbean', 'Tuvalu': 'Oceania',
-    'Uganda': 'Africa', 'Ukraine': 'Europe', 'United Arab Emirates': 'Middle East',
-    'United Kingdom': 'Europe', 'United States': 'North America', 'Uruguay': 'South America',
-    'Uzbekistan': 'Central Asia',
-    'Vanuatu': 'Oceania', 'Venezuela, RB': 'South America', 'Vietnam': 'Asia',
-    'Virgin Islands (U.S.)': 'Central America & Caribbean',
-    'West Bank and Gaza': 'Middle East',
-    'Yemen, Rep.': 'Middle East',
-    'Zambia': 'Africa', 'Zimbabwe': 'Africa',
-}
\ No newline at end of file
+API_PAGE_SIZE = 1000
+MAX_FETCH_WORKERS = 8  # Upper bound on concurrent page requests
+API_TIMEOUT = 10  # Seconds per request attempt
+API_MAX_RETRIES = 4  # Retries on connection errors, timeouts, 429 and 5xx responses
+API_BACKOFF_FACTOR = 0.5  # Backoff doubles each retry: 0.5s, 1s, 2s, ...
+API_DEADLINE = 120  # Overall seconds allowed for one API load
+# 'live' talks to the API; 'record' also saves every response to API_ARCHIVE_FILE;
+# 'replay' serves responses from API_ARCHIVE_FILE with no network access
+API_MODE = "live"
+API_ARCHIVE_FILE = "api_archive.zip"
+API_REPLAY_LATENCY = 0.0  # Seconds added to every replayed response
+
+# ---- Local cache ----
+CACHE_FILE = "inflation_data_cache.parquet"
+LEGACY_CSV_CACHE_FILE = "inflation_data_cache.csv"  # Migrated to CACHE_FILE on first load
+CUBE_FILE = "inflation_cube.npy"  # Dense country x year matrix, memory-mapped at startup
+CUBE_INDEX_FILE = "inflation_cube_index.json"  # Country and year labels for CUBE_FILE
+INDICATOR_CACHE_DIR = "indicator_cache"  # One Parquet file per additional indicator
+COUNTRY_METADATA_FILE = "country_metadata.parquet"  # World Bank country list with regions and income groups
+# ISO3-keyed names, aliases, coordinates and regions; checked in, so resolved next to this file
+COUNTRY_TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "countries.csv")
+CACHE_LOCK_FILE = "inflation_data_cache.lock"  # Cross-process lock held while refreshing the cache
+CACHE_LOCK_TIMEOUT = 300  # Seconds a process waits for another one's refresh
+ARTIFACTS_DIR = "artifacts"  # Precomputed map frames and analytics written by warmup.py
+# Optional SQLite copy of the dataset indexed on (country_code, year) and (year, region);
+# when enabled, region/year filters and exports are answered by indexed queries
+SQL_STORE_ENABLED = False
+SQL_STORE_FILE = "inflation_store.sqlite"
+# Every refresh that changes the data is kept as a vintage (a diff against the previous
+# one) so World Bank revisions can be audited and rolled back; see vintages.py
+VINTAGE_DIR = "vintages"
+VINTAGE_SNAPSHOT_INTERVAL = 10  # Every Nth vintage is a full snapshot, bounding the diffs applied on load
+# Years loaded into the cache; the World Bank series start in 1960. Widening the range
+# later only fetches the years the cache does not cover yet.
+DATA_START_YEAR = 2010
+DATA_END_YEAR = 2024
+DATA_CHUNK_YEARS = 10  # Large ranges are fetched as parallel chunks of this many years (decades)
+REFRESH_LOOKBACK_YEARS = 2  # Recent years re-requested by a delta refresh
+STALE_WHILE_REVALIDATE = True  # Serve cached data immediately and refresh it in the background
+DATA_MAX_AGE = 3600  # Seconds before served data is refreshed in the background
+REFRESH_RETRY_INTERVAL = 300  # Seconds to wait before retrying a failed background refresh
+
+# ---- Admin ----
+SHOW_TELEMETRY_PANEL = False  # Show the ingestion telemetry panel (also shown with ?debug=1 in the URL)
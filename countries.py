@@ -0,0 +1,193 @@
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from config import COUNTRY_TABLE_FILE, CACHE_FILE, LEGACY_CSV_CACHE_FILE, COUNTRY_METADATA_FILE
+
+ALIAS_SEPARATOR = '|'
+
+
+class CountryTable:
+    """
+    Country metadata keyed by ISO3 code: display name, name aliases, coordinates and region.
+
+    Lookups are vectorised joins on the ISO3 index, so callers pass whole columns of
+    codes (or names) rather than looking countries up one row at a time.
+    """
+
+    def __init__(self, frame):
+        self.frame = frame.set_index('iso3')
+        names, codes = [], []
+        for iso3, name, aliases in zip(self.frame.index, self.frame['name'], self.frame['aliases']):
+            for alias in [name] + aliases:
+                names.append(alias)
+                codes.append(iso3)
+        # get_indexer needs unique labels; the first country to claim a name keeps it
+        names = pd.Index(names)
+        unique = ~names.duplicated()
+        self._names = names[unique]
+        self._name_codes = np.array(codes, dtype=object)[unique]
+
+    def __len__(self):
+        return len(self.frame)
+
+    def regions(self):
+        """Return the sorted list of regions."""
+        return sorted(self.frame['region'].cat.categories)
+
+    def codes_for_names(self, names):
+        """
+        Resolve country names or aliases to ISO3 codes.
+
+        Args:
+            names: Sequence of country names
+
+        Returns:
+            np.ndarray: ISO3 codes aligned with names, None where a name is unknown
+        """
+        positions = self._names.get_indexer(pd.Index(np.asarray(names, dtype=object)))
+        return np.where(positions >= 0, self._name_codes[np.maximum(positions, 0)], None)
+
+    def lookup(self, codes, columns=('lat', 'lon', 'region')):
+        """
+        Look up attributes for a column of ISO3 codes.
+
+        Args:
+            codes: Sequence of ISO3 codes
+            columns: Table columns to return
+
+        Returns:
+            pd.DataFrame: One row per code (NaN for unknown codes), indexed by code
+        """
+        return self.frame.reindex(pd.Index(np.asarray(codes, dtype=object)))[list(columns)]
+
+    def join(self, df, columns=('lat', 'lon', 'region')):
+        """
+        Add table columns to a DataFrame with country and country_code columns.
+
+        Rows are matched on country_code; rows whose code is missing or unknown fall back
+        to matching the country name against names and aliases.
+
+        Args:
+            df: DataFrame with country and country_code columns
+            columns: Table columns to add
+
+        Returns:
+            pd.DataFrame: Copy of df with the added columns
+        """
+        codes = df['country_code'].astype('object').to_numpy()
+        unknown = ~pd.Index(codes).isin(self.frame.index)
+        if unknown.any():
+            codes = codes.copy()
+            codes[unknown] = self.codes_for_names(df['country'].astype('object').to_numpy()[unknown])
+
+        values = self.lookup(codes, columns)
+        df = df.copy()
+        for column in columns:
+            # .array keeps categorical columns (region) categorical
+            df[column] = values[column].array
+        return df
+
+
+def read_country_table(path=COUNTRY_TABLE_FILE):
+    """
+    Read the country table data file.
+
+    Args:
+        path: CSV file with iso3, name, aliases, lat, lon and region columns, where
+            aliases is a '|'-separated list of alternative names
+
+    Returns:
+        CountryTable: The parsed table
+    """
+    frame = pd.read_csv(path, keep_default_na=False, na_values={'lat': [''], 'lon': [''], 'region': ['']})
+    frame['aliases'] = [value.split(ALIAS_SEPARATOR) if value else [] for value in frame['aliases']]
+    # Region filters, isin and groupby then compare integer codes rather than strings
+    frame['region'] = frame['region'].astype('category')
+    return CountryTable(frame)
+
+
+@lru_cache(maxsize=None)
+def load_country_table(path=COUNTRY_TABLE_FILE):
+    """Return the country table, read once per process."""
+    return read_country_table(path)
+
+
+def _known_iso3_by_name():
+    """Collect World Bank name -> ISO3 pairs from the cached country metadata and observations."""
+    iso3_by_name = {}
+    if os.path.exists(COUNTRY_METADATA_FILE):
+        metadata = pd.read_parquet(COUNTRY_METADATA_FILE)
+        metadata = metadata[~metadata['is_aggregate']]
+        iso3_by_name.update(zip(metadata['name'], metadata['iso3']))
+    observed = []
+    if os.path.exists(LEGACY_CSV_CACHE_FILE):
+        observed.append(pd.read_csv(LEGACY_CSV_CACHE_FILE, usecols=['country', 'country_code']))
+    if os.path.exists(CACHE_FILE):
+        observed.append(pd.read_parquet(CACHE_FILE, columns=['country', 'country_code']))
+    for pairs in observed:
+        pairs = pairs.dropna().drop_duplicates('country')
+        iso3_by_name.update(zip(pairs['country'].astype(str), pairs['country_code'].astype(str)))
+    return iso3_by_name
+
+
+def bootstrap_country_table(path=COUNTRY_TABLE_FILE):
+    """
+    Build the country table data file from the name-keyed seed dicts in country_seed.py.
+
+    Seed names are resolved to ISO3 codes using the World Bank names in the local caches
+    (falling back to SEED_ISO3). Seed names sharing a code become aliases of the World
+    Bank name.
+
+    Args:
+        path: Destination CSV file
+
+    Returns:
+        list: Seed names that could not be resolved to an ISO3 code
+    """
+    from country_seed import COUNTRY_COORDS, COUNTRY_REGIONS, SEED_ISO3
+
+    wb_names = _known_iso3_by_name()
+    iso3_by_name = {**SEED_ISO3, **wb_names}
+
+    rows = {}
+    unresolved = []
+    for name, coords in COUNTRY_COORDS.items():
+        iso3 = iso3_by_name.get(name)
+        if iso3 is None:
+            unresolved.append(name)
+            continue
+        row = rows.setdefault(iso3, {
+            'iso3': iso3, 'names': [], 'lat': coords['lat'], 'lon': coords['lon'],
+            'region': COUNTRY_REGIONS.get(name, ''),
+        })
+        row['names'].append(name)
+
+    # World Bank names that differ from every seed name (e.g. 'Viet Nam') are added too
+    for name, iso3 in wb_names.items():
+        if iso3 in rows and name not in rows[iso3]['names']:
+            rows[iso3]['names'].append(name)
+
+    records = []
+    for iso3, row in sorted(rows.items()):
+        # Prefer the current World Bank name as the display name
+        names = sorted(row['names'], key=lambda n: (n not in wb_names, n))
+        records.append({
+            'iso3': iso3,
+            'name': names[0],
+            'aliases': ALIAS_SEPARATOR.join(names[1:]),
+            'lat': row['lat'],
+            'lon': row['lon'],
+            'region': row['region'],
+        })
+
+    pd.DataFrame(records).to_csv(path, index=False)
+    load_country_table.cache_clear()
+    return unresolved
+
+
+if __name__ == '__main__':
+    missing = bootstrap_country_table()
+    print(f"Wrote {COUNTRY_TABLE_FILE}" + (f"; unresolved seed names: {', '.join(missing)}" if missing else ""))
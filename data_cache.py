@@ -0,0 +1,689 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from countries import load_country_table
+from config import (
+    CACHE_FILE,
+    LEGACY_CSV_CACHE_FILE,
+    CUBE_FILE,
+    CUBE_INDEX_FILE,
+    INDICATOR_CACHE_DIR,
+    COUNTRY_METADATA_FILE,
+    INFLATION_INDICATOR,
+    CACHE_LOCK_FILE,
+    CACHE_LOCK_TIMEOUT,
+)
+
+# Explicit on-disk dtypes: country names, ISO3 codes and metadata are stored once as
+# categories, years fit in a small integer and inflation stays full precision
+CACHE_DTYPES = {
+    'country': 'category',
+    'country_code': 'category',
+    'year': 'int16',
+    'inflation': 'float64',
+    'wb_region': 'category',
+    'income_group': 'category',
+}
+
+# Bump whenever the cache's columns or dtypes change. Version 1 caches (no country
+# metadata) are upgraded in place; any other mismatch is refetched rather than read
+CACHE_SCHEMA_VERSION = 2
+
+COUNTRY_METADATA_DTYPES = {
+    'iso3': 'object',
+    'name': 'object',
+    'wb_region': 'object',
+    'income_group': 'object',
+    'is_aggregate': 'bool',
+}
+
+
+def _current_umask():
+    """Return the process umask (os.umask can only be read by setting it)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import; changing the umask around every write would race between threads
+FILE_MODE = 0o666 & ~_current_umask()
+
+
+class CacheError(Exception):
+    """Raised when a cache file fails its manifest checks."""
+
+
+@contextmanager
+def atomic_write(path):
+    """
+    Write a file atomically: yield a temporary path in the same directory and rename it
+    over `path` once the block succeeds, so readers only ever see a complete file.
+
+    Args:
+        path: Final file path
+
+    Yields:
+        str: Temporary path to write to
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        yield tmp_path
+        # mkstemp creates owner-only files; give the result the mode a plain open() would
+        os.chmod(tmp_path, FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _try_lock(f):
+    """Take a non-blocking exclusive lock on an open file, raising OSError if it is held."""
+    if fcntl:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+
+
+def _unlock(f):
+    if fcntl:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+# Lock files held by the current thread, so cache_lock can be nested: file locks taken
+# through a second file handle would otherwise wait on the thread's own lock
+_held_locks = threading.local()
+
+
+@contextmanager
+def cache_lock(lock_file=CACHE_LOCK_FILE, timeout=CACHE_LOCK_TIMEOUT):
+    """
+    Hold an exclusive lock on the cache that is shared by every process on this machine.
+
+    The lock is re-entrant within a thread, so code holding it can call functions that
+    take it themselves (e.g. load_cache upgrading an old cache).
+
+    Args:
+        lock_file: Lock file path
+        timeout: Seconds to wait for the lock before giving up
+
+    Raises:
+        TimeoutError: If the lock could not be acquired within `timeout`
+    """
+    held = _held_locks.__dict__.setdefault('paths', set())
+    key = os.path.abspath(lock_file)
+    if key in held:
+        yield
+        return
+
+    deadline = time.monotonic() + timeout
+    with open(lock_file, 'a+b') as f:
+        while True:
+            try:
+                _try_lock(f)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for cache lock {lock_file}")
+                time.sleep(0.1)
+        held.add(key)
+        try:
+            yield
+        finally:
+            held.discard(key)
+            _unlock(f)
+
+
+def single_flight(refresh, lock_file=CACHE_LOCK_FILE):
+    """
+    Run a cache refresh so that only one process fetches from the API at a time.
+
+    `refresh` runs while holding the cache lock and is expected to fetch and save the
+    new data. A process that had to wait for the lock and finds the cache was rewritten
+    in the meantime loads that result instead of fetching again, after releasing the
+    lock so that waiting processes read the new cache concurrently.
+
+    Args:
+        refresh: Callable returning the refreshed DataFrame (or None if nothing was fetched)
+        lock_file: Lock file path
+
+    Returns:
+        tuple: (DataFrame or None, True if this process ran `refresh`)
+    """
+    version_before = cache_version()
+    with cache_lock(lock_file):
+        if cache_version() == version_before:
+            return refresh(), True
+    # Cache files are replaced atomically, so the new cache can be read without the lock
+    return load_cache(), False
+
+
+def coerce_cache_dtypes(df, value_column='inflation'):
+    """
+    Cast an inflation DataFrame to the cache dtypes.
+
+    Args:
+        df: DataFrame with country, country_code, year and value columns (and optionally
+            the wb_region and income_group metadata columns)
+        value_column: Name of the value column (CACHE_DTYPES' 'inflation' dtype is used)
+
+    Returns:
+        pd.DataFrame: Copy of the data using CACHE_DTYPES
+    """
+    dtypes = dict(CACHE_DTYPES)
+    dtypes[value_column] = dtypes.pop('inflation')
+    dtypes = {col: dtype for col, dtype in dtypes.items() if col in df.columns}
+    # Rebuild categories from scratch so values dropped by filtering or merging don't linger
+    df = df.astype({col: 'object' for col, dtype in dtypes.items()
+                    if dtype == 'category' and df[col].dtype == 'category'})
+    return df.astype(dtypes)
+
+
+def attach_country_metadata(df, metadata=None):
+    """
+    Drop aggregate rows ('World', regions, income groups, ...) and tag each country with
+    its World Bank region and income group.
+
+    Args:
+        df: DataFrame with country and country_code (ISO3) columns
+        metadata: Country metadata with iso3, wb_region, income_group and is_aggregate
+            columns. Without it, only countries in the country table are kept and the
+            metadata columns are left empty.
+
+    Returns:
+        pd.DataFrame: Country rows only, with wb_region and income_group columns
+    """
+    df = df.drop(columns=['wb_region', 'income_group'], errors='ignore')
+
+    if metadata is None:
+        known = load_country_table().join(df, columns=('name',))['name'].notna()
+        df = df[known.to_numpy()].copy()
+        df['wb_region'] = None
+        df['income_group'] = None
+        return df
+
+    countries = metadata[~metadata['is_aggregate']].set_index('iso3')
+    codes = df['country_code'].astype('object')
+    keep = codes.isin(countries.index)
+    df = df[keep].copy()
+    df['wb_region'] = codes[keep].map(countries['wb_region'])
+    df['income_group'] = codes[keep].map(countries['income_group'])
+    return df
+
+
+def load_country_metadata_cache(metadata_file=COUNTRY_METADATA_FILE):
+    """
+    Load the cached World Bank country metadata.
+
+    Returns:
+        pd.DataFrame: iso3, name, wb_region, income_group and is_aggregate columns
+        None: If the metadata has not been fetched yet
+    """
+    if not os.path.exists(metadata_file):
+        return None
+    return pd.read_parquet(metadata_file)
+
+
+def save_country_metadata_cache(metadata, metadata_file=COUNTRY_METADATA_FILE):
+    """Atomically write the World Bank country metadata to its cache file."""
+    with atomic_write(metadata_file) as tmp_path:
+        metadata.astype(COUNTRY_METADATA_DTYPES).to_parquet(tmp_path, index=False)
+
+
+class InflationCube:
+    """
+    Dense country x year inflation matrix (NaN for gaps) with its row and column labels.
+
+    The values are normally a read-only memory map of CUBE_FILE, so every process that
+    loads the cube shares the same pages of the OS file cache.
+    """
+
+    def __init__(self, values, countries, years):
+        self.values = values
+        self.countries = list(countries)
+        self.years = np.asarray(years, dtype='int16')
+        self._country_pos = {country: i for i, country in enumerate(self.countries)}
+        self._year_pos = {int(year): i for i, year in enumerate(self.years)}
+
+    def select(self, countries, years):
+        """
+        Slice the cube into a country x year DataFrame.
+
+        Args:
+            countries: Row labels to select, in the desired order
+            years: Column labels to select, in the desired order
+
+        Returns:
+            pd.DataFrame: Selected values indexed by country with year columns
+            None: If any requested country or year is not in the cube
+        """
+        try:
+            rows = [self._country_pos[country] for country in countries]
+            cols = [self._year_pos[int(year)] for year in years]
+        except KeyError:
+            return None
+
+        return pd.DataFrame(
+            self.values[np.ix_(rows, cols)],
+            index=pd.Index(countries, name='country'),
+            columns=pd.Index(np.asarray(years, dtype='int16'), name='year')
+        )
+
+
+def build_cube(df):
+    """
+    Pivot long-format inflation data into an InflationCube held in memory.
+
+    Args:
+        df: Inflation DataFrame with country, year and inflation columns
+
+    Returns:
+        InflationCube: Dense matrix with countries and years in sorted order
+    """
+    pivot = df.pivot_table(values='inflation', index='country', columns='year', aggfunc='mean', observed=True)
+    pivot = pivot.sort_index().sort_index(axis=1)
+    return InflationCube(pivot.to_numpy(dtype='float64'), pivot.index.astype(str), pivot.columns)
+
+
+def save_cube(df, cube_file=CUBE_FILE, index_file=CUBE_INDEX_FILE):
+    """
+    Persist the dense country x year matrix and its country/year index.
+
+    Args:
+        df: Inflation DataFrame to pivot
+        cube_file: Destination .npy file for the float64 matrix
+        index_file: Destination JSON file holding the country and year labels
+    """
+    cube = build_cube(df)
+    with atomic_write(cube_file) as tmp_path:
+        with open(tmp_path, 'wb') as f:
+            np.save(f, cube.values)
+    with atomic_write(index_file) as tmp_path:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'countries': cube.countries, 'years': [int(y) for y in cube.years]}, f)
+
+
+def load_cube(cube_file=CUBE_FILE, index_file=CUBE_INDEX_FILE, cache_file=CACHE_FILE):
+    """
+    Memory-map the persisted country x year matrix.
+
+    The cube is rebuilt from the Parquet cache first if it is missing or older than
+    the cache.
+
+    Args:
+        cube_file: .npy file holding the matrix
+        index_file: JSON file holding the country and year labels
+        cache_file: Parquet cache the cube is derived from
+
+    Returns:
+        InflationCube: Cube backed by a read-only memory map
+        None: If neither the cube nor the cache exists
+    """
+    cube_files_exist = os.path.exists(cube_file) and os.path.exists(index_file)
+    if os.path.exists(cache_file) and (
+        not cube_files_exist or os.path.getmtime(cube_file) < os.path.getmtime(cache_file)
+    ):
+        with cache_lock():
+            # Another process may have rebuilt it while this one waited for the lock
+            if not os.path.exists(cube_file) or os.path.getmtime(cube_file) < os.path.getmtime(cache_file):
+                save_cube(pd.read_parquet(cache_file), cube_file, index_file)
+    elif not cube_files_exist:
+        return None
+
+    with open(index_file, encoding='utf-8') as f:
+        index = json.load(f)
+    return InflationCube(np.load(cube_file, mmap_mode='r'), index['countries'], index['years'])
+
+
+def cache_version(cache_file=CACHE_FILE):
+    """Return a value that changes whenever the cache (and so the cube derived from it) is rewritten."""
+    return os.path.getmtime(cache_file) if os.path.exists(cache_file) else None
+
+
+def manifest_file(cache_file=CACHE_FILE):
+    """Return the path of the JSON manifest stored next to a Parquet cache file."""
+    return os.path.splitext(cache_file)[0] + '.manifest.json'
+
+
+def read_manifest(cache_file=CACHE_FILE):
+    """
+    Read the manifest describing a cache file.
+
+    Args:
+        cache_file: Parquet cache file
+
+    Returns:
+        dict: Manifest fields
+        None: If the cache has no manifest
+    """
+    path = manifest_file(cache_file)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_manifest(manifest, cache_file=CACHE_FILE):
+    """Atomically write the manifest for a cache file."""
+    with atomic_write(manifest_file(cache_file)) as tmp_path:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+
+def build_manifest(df, content, date_range=None, source_last_updated=None, fetched_at=None):
+    """
+    Describe a cache file's contents.
+
+    Args:
+        df: Inflation DataFrame stored in the cache
+        content: Raw bytes of the cache file
+        date_range: (first_year, last_year) requested from the API; defaults to the years in df
+        source_last_updated: The API's 'lastupdated' stamp for the indicator, if known
+        fetched_at: Unix timestamp of the fetch (defaults to now)
+
+    Returns:
+        dict: Manifest fields
+    """
+    if date_range is None:
+        date_range = (df['year'].min(), df['year'].max()) if len(df) else (None, None)
+    fetched_at = fetched_at if fetched_at is not None else time.time()
+    return {
+        'schema_version': CACHE_SCHEMA_VERSION,
+        'indicator': INFLATION_INDICATOR,
+        'fetched_at': fetched_at,
+        'checked_at': fetched_at,
+        'date_range': [None if year is None else int(year) for year in date_range],
+        'row_count': len(df),
+        'sha256': hashlib.sha256(content).hexdigest(),
+        'source_last_updated': source_last_updated,
+    }
+
+
+def mark_cache_checked(cache_file=CACHE_FILE, checked_at=None):
+    """
+    Record that the cache was revalidated against the API and found up to date.
+
+    Args:
+        cache_file: Parquet cache file
+        checked_at: Unix timestamp of the check (defaults to now)
+    """
+    manifest = read_manifest(cache_file)
+    if manifest is None:
+        return
+    manifest['checked_at'] = checked_at if checked_at is not None else time.time()
+    write_manifest(manifest, cache_file)
+
+
+def cache_checked_at(cache_file=CACHE_FILE):
+    """
+    Return when the cached data was last known to match the API.
+
+    This is the later of the last fetch and the last successful revalidation, falling
+    back to the cache file's mtime for caches without a manifest.
+    """
+    manifest = read_manifest(cache_file)
+    if manifest and manifest.get('checked_at'):
+        return manifest['checked_at']
+    return cache_version(cache_file)
+
+
+def dataset_version(cache_file=CACHE_FILE):
+    """
+    Return the content hash of the cached dataset, used to tie derived artifacts to it.
+
+    Returns:
+        str: SHA-256 recorded in the cache manifest
+        None: If the cache has no manifest
+    """
+    manifest = read_manifest(cache_file)
+    return manifest.get('sha256') if manifest else None
+
+
+def save_cache(df, cache_file=CACHE_FILE, cube_file=CUBE_FILE, index_file=CUBE_INDEX_FILE,
+               date_range=None, source_last_updated=None, fetched_at=None):
+    """
+    Write inflation data to the columnar Parquet cache and refresh the dense cube.
+
+    Each file is written atomically, so concurrent readers never see a torn file. A
+    manifest with the row count, content hash and schema version is written alongside.
+
+    Args:
+        df: Inflation DataFrame to persist
+        cache_file: Destination Parquet file
+        cube_file: Destination .npy file for the dense matrix
+        index_file: Destination JSON file for the cube's country and year labels
+        date_range: (first_year, last_year) the data was requested for
+        source_last_updated: The API's 'lastupdated' stamp for the fetched data
+        fetched_at: Unix timestamp of the fetch (defaults to now)
+    """
+    df = coerce_cache_dtypes(df)
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index=False)
+    content = buffer.getvalue()
+
+    with atomic_write(cache_file) as tmp_path:
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+    write_manifest(build_manifest(df, content, date_range, source_last_updated, fetched_at), cache_file)
+    save_cube(df, cube_file, index_file)
+
+
+def _upgrade_cache(df, manifest, cache_file, cube_file, index_file):
+    """
+    Rewrite a version 1 cache (no country metadata) under the current schema.
+
+    Aggregates are dropped using the cached country metadata if it has been fetched,
+    otherwise by country table membership; the next refresh fills in the metadata.
+    """
+    with cache_lock():
+        current = read_manifest(cache_file)
+        if current is not None and current.get('schema_version') == CACHE_SCHEMA_VERSION:
+            # Another process upgraded the cache while this one waited for the lock
+            return _read_verified_cache(cache_file, cube_file, index_file)
+        df = coerce_cache_dtypes(attach_country_metadata(df, load_country_metadata_cache()))
+        save_cache(df, cache_file, cube_file, index_file,
+                   date_range=manifest.get('date_range'),
+                   source_last_updated=manifest.get('source_last_updated'),
+                   fetched_at=manifest.get('fetched_at'))
+    return df
+
+
+def _restore_cache_dtypes(df):
+    """
+    Cast the columns Parquet does not read back with their cache dtype.
+
+    A metadata column that is entirely missing (e.g. a cache built without the World
+    Bank country list) is stored with a null type and read back as object; every other
+    column already round-trips, so it is left as is rather than re-encoded.
+    """
+    return df.astype({col: dtype for col, dtype in CACHE_DTYPES.items()
+                      if col in df.columns and df[col].dtype != dtype})
+
+
+def _read_verified_cache(cache_file, cube_file, index_file, attempts=3):
+    """
+    Read a Parquet cache and check it against its manifest.
+
+    save_cache replaces the Parquet file before its manifest, so a mismatch seen while a
+    write is in progress is retried briefly before the cache is declared corrupt.
+
+    Raises:
+        CacheError: If the schema version or content hash does not match the manifest
+    """
+    for attempt in range(attempts):
+        with open(cache_file, 'rb') as f:
+            content = f.read()
+        manifest = read_manifest(cache_file)
+
+        if manifest is None:
+            # Caches written before manifests existed use the version 1 schema
+            manifest = {'fetched_at': os.path.getmtime(cache_file)}
+            return _upgrade_cache(pd.read_parquet(io.BytesIO(content)), manifest,
+                                  cache_file, cube_file, index_file)
+
+        schema_version = manifest.get('schema_version')
+        if schema_version not in (1, CACHE_SCHEMA_VERSION):
+            raise CacheError(
+                f"Cache schema version {schema_version} does not match "
+                f"expected version {CACHE_SCHEMA_VERSION}"
+            )
+        if hashlib.sha256(content).hexdigest() == manifest.get('sha256'):
+            df = _restore_cache_dtypes(pd.read_parquet(io.BytesIO(content)))
+            if schema_version != CACHE_SCHEMA_VERSION:
+                df = _upgrade_cache(df, manifest, cache_file, cube_file, index_file)
+            return df
+        if attempt < attempts - 1:
+            time.sleep(0.2)
+
+    raise CacheError(f"Cache file {cache_file} does not match the checksum in its manifest")
+
+
+def migrate_csv_cache(csv_file=LEGACY_CSV_CACHE_FILE, cache_file=CACHE_FILE,
+                      cube_file=CUBE_FILE, index_file=CUBE_INDEX_FILE):
+    """
+    Convert a legacy CSV cache into the Parquet cache.
+
+    The CSV is left in place so older checkouts keep working. Its modification time is
+    recorded as the fetch time, so the migrated cache keeps the age of the data.
+
+    Args:
+        csv_file: Existing CSV cache file
+        cache_file: Parquet file to create
+        cube_file: Dense matrix file to create
+        index_file: Cube label file to create
+
+    Returns:
+        pd.DataFrame: The migrated data
+    """
+    with cache_lock():
+        if os.path.exists(cache_file):
+            # Another process migrated the CSV while this one waited for the lock
+            return _read_verified_cache(cache_file, cube_file, index_file)
+        df = attach_country_metadata(pd.read_csv(csv_file), load_country_metadata_cache())
+        df = coerce_cache_dtypes(df)
+        save_cache(df, cache_file, cube_file, index_file, fetched_at=os.path.getmtime(csv_file))
+    return df
+
+
+def cache_exists(cache_file=CACHE_FILE, csv_file=LEGACY_CSV_CACHE_FILE):
+    """Return True if either the Parquet cache or a legacy CSV cache is present."""
+    return os.path.exists(cache_file) or os.path.exists(csv_file)
+
+
+def load_cache(cache_file=CACHE_FILE, csv_file=LEGACY_CSV_CACHE_FILE,
+               cube_file=CUBE_FILE, index_file=CUBE_INDEX_FILE):
+    """
+    Load cached inflation data, migrating a legacy CSV cache on first use.
+
+    Args:
+        cache_file: Parquet cache file
+        csv_file: Legacy CSV cache file used when no Parquet cache exists yet
+        cube_file: Dense matrix file written when migrating
+        index_file: Cube label file written when migrating
+
+    Returns:
+        pd.DataFrame: Cached data with CACHE_DTYPES
+        None: If no cache exists
+
+    Raises:
+        CacheError: If the cache fails its manifest checks (wrong schema version or checksum)
+    """
+    if os.path.exists(cache_file):
+        return _read_verified_cache(cache_file, cube_file, index_file)
+    if os.path.exists(csv_file):
+        return migrate_csv_cache(csv_file, cache_file, cube_file, index_file)
+    return None
+
+
+def indicator_cache_file(indicator):
+    """Return the per-indicator Parquet cache path for a World Bank indicator code."""
+    return os.path.join(INDICATOR_CACHE_DIR, f"{indicator}.parquet")
+
+
+def load_indicator_cache(indicator):
+    """
+    Load one indicator's cached observations.
+
+    The headline inflation indicator shares the main cache rather than keeping a copy.
+
+    Args:
+        indicator: World Bank indicator code
+
+    Returns:
+        pd.DataFrame: country, country_code, year and value columns
+        None: If the indicator has not been cached yet
+    """
+    if indicator == INFLATION_INDICATOR:
+        df = load_cache()
+        return None if df is None else df.rename(columns={'inflation': 'value'})
+
+    cache_file = indicator_cache_file(indicator)
+    if not os.path.exists(cache_file):
+        return None
+    return pd.read_parquet(cache_file)
+
+
+def indicator_date_range(indicator):
+    """
+    Return the years an indicator's cache was requested for, from its manifest.
+
+    Returns:
+        tuple: (first_year, last_year)
+        None: If the indicator is not cached or its cache predates manifests
+    """
+    first_year, last_year = (read_manifest(indicator_cache_file(indicator)) or {}).get('date_range') or (None, None)
+    if first_year is None or last_year is None:
+        return None
+    return int(first_year), int(last_year)
+
+
+def save_indicator_cache(indicator, df, date_range=None):
+    """
+    Write one indicator's observations to its cache, with a manifest recording the years
+    that were requested.
+
+    Args:
+        indicator: World Bank indicator code
+        df: DataFrame with country, country_code, year and value columns
+        date_range: (first_year, last_year) requested from the API; defaults to the years in df
+
+    Raises:
+        ValueError: For the headline inflation indicator, whose cache is the main cache and
+            is written with save_cache under cache_lock (see loader.load_inflation_data)
+    """
+    if indicator == INFLATION_INDICATOR:
+        raise ValueError(f"{indicator} is stored in the main cache; write it with save_cache")
+
+    os.makedirs(INDICATOR_CACHE_DIR, exist_ok=True)
+    cache_file = indicator_cache_file(indicator)
+    with atomic_write(cache_file) as tmp_path:
+        coerce_cache_dtypes(df, value_column='value').to_parquet(tmp_path, index=False)
+    if date_range is None:
+        date_range = (df['year'].min(), df['year'].max()) if len(df) else (None, None)
+    write_manifest({
+        'indicator': indicator,
+        'fetched_at': time.time(),
+        'date_range': [None if year is None else int(year) for year in date_range],
+        'row_count': len(df),
+    }, cache_file=cache_file)
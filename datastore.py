@@ -0,0 +1,182 @@
+import numpy as np
+import pandas as pd
+
+from countries import load_country_table
+
+
+class DataStore:
+    """
+    Read-only inflation table sorted by (country, year) with CSR-style row offsets.
+
+    Countries get integer ids in name order; the rows of country i are the contiguous
+    range offsets[i]:offsets[i + 1] of the sorted table, so a country slice is a view
+    rather than a boolean scan. Rows are also indexed by year the same way: the row
+    positions of year j are year_rows[year_offsets[j]:year_offsets[j + 1]], in country
+    order. Each country's map coordinates are looked up once and kept in arrays indexed
+    by country id. Built once per dataset and shared, so callers must not modify what
+    it returns.
+    """
+
+    def __init__(self, df, country_table=None):
+        # Factorizing the categorical column works on its integer codes
+        country_ids, countries = pd.factorize(df['country'], sort=True)
+        years = df['year'].to_numpy()
+        order = np.lexsort((years, country_ids))
+
+        self.df = df.take(order).reset_index(drop=True)
+        self.countries = pd.Index(countries, name='country')
+        self.country_ids = country_ids[order].astype('int32')
+        self.offsets = np.searchsorted(self.country_ids, np.arange(len(countries) + 1))
+        self.country_codes = self.df['country_code'].to_numpy()[self.offsets[:-1]]
+        self._country_pos = {country: i for i, country in enumerate(countries)}
+        self._code_pos = {code: i for i, code in enumerate(self.country_codes)}
+
+        year_ids, year_labels = pd.factorize(years[order], sort=True)
+        self.years = np.asarray(year_labels, dtype='int16')
+        self.year_rows = np.argsort(year_ids, kind='stable')
+        self.year_offsets = np.searchsorted(year_ids[self.year_rows], np.arange(len(year_labels) + 1))
+        self._year_pos = {int(year): j for j, year in enumerate(self.years)}
+
+        # One row per country, joined like CountryTable.join (ISO3 code, then name)
+        first_rows = self.df.take(self.offsets[:-1])[['country', 'country_code']]
+        coordinates = (country_table or load_country_table()).join(first_rows, columns=('lat', 'lon'))
+        self.lat = coordinates['lat'].to_numpy(dtype='float64')
+        self.lon = coordinates['lon'].to_numpy(dtype='float64')
+
+    def __len__(self):
+        return len(self.df)
+
+    def country_slice(self, country):
+        """
+        Return the row range of one country in the sorted table.
+
+        Args:
+            country: Country name
+
+        Returns:
+            slice: Rows of the country (empty if the country is unknown)
+        """
+        i = self._country_pos.get(country)
+        if i is None:
+            return slice(0, 0)
+        return slice(self.offsets[i], self.offsets[i + 1])
+
+    def country_frame(self, country):
+        """
+        Return one country's rows, sorted by year.
+
+        Returns:
+            pd.DataFrame: A slice of the sorted table (empty if the country is unknown)
+        """
+        return self.df.iloc[self.country_slice(country)]
+
+    def rows_for_year(self, year):
+        """
+        Return the row positions holding one year, in country order.
+
+        Returns:
+            np.ndarray: Positions into the sorted table (a view; empty if the year is unknown)
+        """
+        j = self._year_pos.get(int(year))
+        if j is None:
+            return self.year_rows[:0]
+        return self.year_rows[self.year_offsets[j]:self.year_offsets[j + 1]]
+
+    def year_frame(self, year):
+        """
+        Return every country's row for one year.
+
+        Returns:
+            pd.DataFrame: The year's rows in country order (empty if the year is unknown)
+        """
+        return self.df.take(self.rows_for_year(year))
+
+    def year_frame_with_coordinates(self, year):
+        """
+        Return every country's row for one year with lat and lon columns added.
+
+        Returns:
+            pd.DataFrame: As year_frame, plus coordinates (NaN where a country has none)
+        """
+        return _with_coordinates(self, self.rows_for_year(year))
+
+    def frame_with_coordinates(self):
+        """
+        Return every row with lat and lon columns added, grouped by year.
+
+        Returns:
+            pd.DataFrame: Rows sorted by year and, within a year, in country order (the
+                concatenation of year_frame_with_coordinates over all years)
+        """
+        return _with_coordinates(self, self.year_rows)
+
+    def select_countries(self, country_codes):
+        """
+        Restrict the store to a subset of countries without copying any rows.
+
+        Args:
+            country_codes: ISO3 codes of the countries to keep; unknown codes are ignored
+
+        Returns:
+            DataStoreSelection: View of this store holding only the selected countries
+        """
+        selected = np.zeros(len(self.countries), dtype=bool)
+        ids = [self._code_pos[code] for code in set(country_codes) if code in self._code_pos]
+        selected[ids] = True
+        return DataStoreSelection(self, selected)
+
+
+class DataStoreSelection:
+    """
+    A country subset of a DataStore, e.g. the countries of the selected regions.
+
+    Holds only a boolean mask over the store's country ids; lookups go through the
+    parent store's offsets, so country slices stay views of the shared table and year
+    lookups return index arrays. Nothing is copied until a frame is requested.
+    """
+
+    def __init__(self, store, selected):
+        self.store = store
+        self.selected = selected
+
+    def __len__(self):
+        lengths = np.diff(self.store.offsets)
+        return int(lengths[self.selected].sum())
+
+    def country_slice(self, country):
+        """Return the row range of one country in the parent's sorted table (empty if not selected)."""
+        i = self.store._country_pos.get(country)
+        if i is None or not self.selected[i]:
+            return slice(0, 0)
+        return slice(self.store.offsets[i], self.store.offsets[i + 1])
+
+    def country_frame(self, country):
+        """Return one selected country's rows, sorted by year (a slice of the shared table)."""
+        return self.store.df.iloc[self.country_slice(country)]
+
+    def rows_for_year(self, year):
+        """Return the positions of the selected countries' rows for one year, in country order."""
+        rows = self.store.rows_for_year(year)
+        return rows[self.selected[self.store.country_ids[rows]]]
+
+    def year_frame(self, year):
+        """Return the selected countries' rows for one year, in country order."""
+        return self.store.df.take(self.rows_for_year(year))
+
+    def year_frame_with_coordinates(self, year):
+        """Return the selected countries' rows for one year with lat and lon columns added."""
+        return _with_coordinates(self.store, self.rows_for_year(year))
+
+    def frame_with_coordinates(self):
+        """Return the selected countries' rows with lat and lon columns added, grouped by year."""
+        rows = self.store.year_rows
+        return _with_coordinates(self.store, rows[self.selected[self.store.country_ids[rows]]])
+
+
+def _with_coordinates(store, rows):
+    """Take rows of a store's table and add their countries' coordinates, gathered by country id."""
+    frame = store.df.take(rows)
+    ids = store.country_ids[rows]
+    frame['lat'] = store.lat[ids]
+    frame['lon'] = store.lon[ids]
+    return frame
@@ -0,0 +1,758 @@
+import queue
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from api_client import get_client
+from data_cache import (
+    load_indicator_cache,
+    save_indicator_cache,
+    indicator_date_range,
+    coerce_cache_dtypes,
+    read_manifest,
+    attach_country_metadata,
+    load_country_metadata_cache,
+    save_country_metadata_cache,
+)
+from config import (
+    WORLD_BANK_API_URL,
+    INFLATION_INDICATOR,
+    API_PAGE_SIZE,
+    MAX_FETCH_WORKERS,
+    API_DEADLINE,
+    DATA_START_YEAR,
+    DATA_END_YEAR,
+    DATA_CHUNK_YEARS,
+    REFRESH_LOOKBACK_YEARS,
+)
+
+
+def _fetch_page(client, url, params, page, deadline):
+    """
+    Fetch a single page of a World Bank API query.
+
+    Args:
+        client: WorldBankClient used for the request
+        url: API endpoint URL
+        params: Query parameters shared by every page
+        page: 1-based page number to request
+        deadline: time.monotonic() value by which the whole query must finish
+
+    Returns:
+        tuple: (decoded JSON payload ([metadata, items]), request stats from get_json)
+    """
+    stats = {}
+    data = client.get_json(url, params={**params, 'page': page}, deadline=deadline, stats=stats)
+    return data, stats
+
+
+def _page_items(data):
+    """Return the items of a decoded page, or an empty list for an empty or error payload."""
+    return (data[1] or []) if len(data) >= 2 else []
+
+
+def iter_api_pages(url, params, max_workers=MAX_FETCH_WORKERS, on_page=None,
+                   client=None, deadline_seconds=API_DEADLINE):
+    """
+    Fetch every page of a paginated World Bank API query, with per-request stats.
+
+    Page 1 is requested first to read the page count from its metadata, then the
+    remaining pages are fetched in parallel on a bounded thread pool. Pages are
+    yielded in page order regardless of which request finishes first.
+
+    Args:
+        url: API endpoint URL
+        params: Query parameters shared by every page (without 'page')
+        max_workers: Maximum number of concurrent requests
+        on_page: Optional callback called as on_page(pages_done, total_pages)
+        client: WorldBankClient to use (defaults to the shared pooled client)
+        deadline_seconds: Overall time budget for fetching every page
+
+    Yields:
+        tuple: (page number, items, request stats) for every page, including empty ones
+    """
+    client = client or get_client()
+    deadline = time.monotonic() + deadline_seconds
+
+    data, stats = _fetch_page(client, url, params, 1, deadline)
+    items = _page_items(data)
+    if not items:
+        yield 1, items, stats
+        return
+
+    total_pages = int(data[0].get('pages', 1))
+    if on_page:
+        on_page(1, total_pages)
+    yield 1, items, stats
+
+    if total_pages < 2:
+        return
+
+    # Keep a bounded window of pages in flight so memory stays proportional to the
+    # pool size rather than to the number of pages finished ahead of the consumer
+    workers = max(1, min(max_workers, total_pages - 1))
+    window = 2 * workers
+    pending = deque()
+    next_page = 2
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for pages_done in range(2, total_pages + 1):
+            while next_page <= total_pages and len(pending) < window:
+                pending.append(executor.submit(_fetch_page, client, url, params, next_page, deadline))
+                next_page += 1
+
+            data, stats = pending.popleft().result()
+            if on_page:
+                on_page(pages_done, total_pages)
+            yield pages_done, _page_items(data), stats
+
+
+def fetch_api_pages(url, params, max_workers=MAX_FETCH_WORKERS, on_page=None,
+                    client=None, deadline_seconds=API_DEADLINE):
+    """
+    Fetch every page of a paginated World Bank API query (see iter_api_pages).
+
+    Yields:
+        list: The items of each non-empty page
+    """
+    for _, items, _ in iter_api_pages(url, params, max_workers, on_page, client, deadline_seconds):
+        if items:
+            yield items
+
+
+def iter_observations(items):
+    """
+    Parse one page of World Bank API items, skipping missing values.
+
+    Args:
+        items: Observation items of a single API page
+
+    Yields:
+        tuple: (country, country_code, year, value)
+    """
+    for item in items:
+        if item['value'] is not None:
+            yield item['country']['value'], item['countryiso3code'], int(item['date']), float(item['value'])
+
+
+class ObservationColumns:
+    """
+    Preallocated typed column buffers that parsed observations are streamed into.
+
+    Countries are stored as integer ids into a small lookup table, so once a page has
+    been parsed no per-observation Python objects are kept alive. Buffers grow by
+    doubling if more observations arrive than were reserved.
+    """
+
+    def __init__(self, capacity=API_PAGE_SIZE):
+        self.size = 0
+        self._country_ids = {}  # (country, country_code) -> id
+        self.country_id = np.empty(capacity, dtype='int32')
+        self.year = np.empty(capacity, dtype='int16')
+        self.value = np.empty(capacity, dtype='float64')
+
+    def reserve(self, capacity):
+        """Grow the buffers to hold at least `capacity` observations."""
+        if capacity <= len(self.year):
+            return
+        for name in ('country_id', 'year', 'value'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def extend(self, observations):
+        """Append one page of (country, country_code, year, value) observations."""
+        ids, years, values = [], [], []
+        for country, country_code, year, value in observations:
+            key = (country, country_code)
+            country_id = self._country_ids.get(key)
+            if country_id is None:
+                country_id = self._country_ids[key] = len(self._country_ids)
+            ids.append(country_id)
+            years.append(year)
+            values.append(value)
+
+        start, end = self.size, self.size + len(ids)
+        if end > len(self.year):
+            self.reserve(max(end, 2 * len(self.year)))
+        self.country_id[start:end] = ids
+        self.year[start:end] = years
+        self.value[start:end] = values
+        self.size = end
+
+    def to_frame(self, value_column='inflation'):
+        """
+        Build a DataFrame from the filled part of the buffers.
+
+        Returns:
+            pd.DataFrame: Categorical country/country_code, int16 year and float64 value columns
+        """
+        pairs = list(self._country_ids)  # Insertion order matches the ids
+        ids = self.country_id[:self.size]
+
+        columns = {}
+        for position, name in enumerate(('country', 'country_code')):
+            labels = [pair[position] for pair in pairs]
+            categories = sorted(set(labels))
+            lookup = {label: code for code, label in enumerate(categories)}
+            codes = np.array([lookup[label] for label in labels], dtype='int32')
+            columns[name] = pd.Categorical.from_codes(codes[ids], categories=categories)
+
+        columns['year'] = self.year[:self.size].copy()
+        columns[value_column] = self.value[:self.size].copy()
+        return pd.DataFrame(columns)
+
+
+def download_indicator(indicator, first_year, last_year, on_page=None, value_column='value',
+                       max_workers=MAX_FETCH_WORKERS, telemetry=None):
+    """
+    Download one World Bank indicator for a year window.
+
+    Args:
+        indicator: World Bank indicator code (e.g. 'FP.CPI.TOTL.ZG')
+        first_year: First year to request
+        last_year: Last year to request
+        on_page: Optional progress callback passed to fetch_api_pages
+        value_column: Name of the column holding the observation values
+        max_workers: Maximum number of concurrent page requests
+        telemetry: Optional IngestionTelemetry that every page is recorded in
+
+    Returns:
+        pd.DataFrame: country, country_code, year and value columns
+        None: If the API returned no observations
+    """
+    url = f"{WORLD_BANK_API_URL}/country/all/indicator/{indicator}"
+    params = {
+        'format': 'json',
+        'date': f'{first_year}:{last_year}',
+        'per_page': API_PAGE_SIZE
+    }
+
+    columns = ObservationColumns()
+
+    def track_pages(pages_done, total_pages):
+        # Page 1's metadata gives the page count, which bounds the number of observations
+        if pages_done == 1:
+            columns.reserve(total_pages * API_PAGE_SIZE)
+        if on_page:
+            on_page(pages_done, total_pages)
+
+    query = f"{indicator} {first_year}-{last_year}"
+    for page, items, stats in iter_api_pages(url, params, max_workers=max_workers, on_page=track_pages):
+        start, size = time.perf_counter(), columns.size
+        columns.extend(iter_observations(items))
+        if telemetry:
+            telemetry.record_page(query, page, stats, time.perf_counter() - start, columns.size - size)
+
+    if columns.size == 0:
+        return None
+
+    return columns.to_frame(value_column)
+
+
+def year_chunks(first_year, last_year, chunk_years=DATA_CHUNK_YEARS):
+    """
+    Split a year window into chunks aligned to multiples of chunk_years.
+
+    With the default of 10, 1965-1994 becomes 1965-1969, 1970-1979, 1980-1989 and 1990-1994.
+
+    Args:
+        first_year: First year of the window
+        last_year: Last year of the window
+        chunk_years: Length of a full chunk
+
+    Returns:
+        list: (first_year, last_year) tuples in ascending order
+    """
+    chunks = []
+    year = first_year
+    while year <= last_year:
+        chunk_end = min(last_year, (year // chunk_years + 1) * chunk_years - 1)
+        chunks.append((year, chunk_end))
+        year = chunk_end + 1
+    return chunks
+
+
+def download_year_windows(indicator, windows, on_page=None, value_column='value',
+                          max_workers=MAX_FETCH_WORKERS, chunk_years=DATA_CHUNK_YEARS, telemetry=None):
+    """
+    Download one World Bank indicator for several year windows, chunk by chunk in parallel.
+
+    Each window is split with year_chunks and every chunk is an independent paginated
+    query; the chunks run concurrently, splitting the page worker budget between them,
+    and their observations are concatenated.
+
+    Args:
+        indicator: World Bank indicator code
+        windows: (first_year, last_year) windows to download; they must not overlap
+        on_page: Optional callback called as on_page(pages_done, total_pages) summed over
+            every chunk (the total grows as each chunk reports its page count)
+        value_column: Name of the column holding the observation values
+        max_workers: Maximum number of concurrent page requests
+        chunk_years: Length of a full chunk
+        telemetry: Optional IngestionTelemetry that every page is recorded in
+
+    Returns:
+        pd.DataFrame: country, country_code, year and value columns
+        None: If the API returned no observations
+    """
+    chunks = [chunk for first_year, last_year in windows for chunk in year_chunks(first_year, last_year, chunk_years)]
+    if len(chunks) == 1:
+        return download_indicator(indicator, *chunks[0], on_page=on_page, value_column=value_column,
+                                  max_workers=max_workers, telemetry=telemetry)
+
+    # Chunks run on worker threads, but on_page may touch thread-bound state (Streamlit
+    # elements only work on the script thread), so workers post their progress to a queue
+    # that this thread drains. Each chunk posts None once it has finished.
+    updates = queue.SimpleQueue()
+
+    def track_chunk(chunk):
+        def track_pages(pages_done, total_pages):
+            updates.put((chunk, pages_done, total_pages))
+        return track_pages
+
+    progress = {}  # chunk -> (pages_done, total_pages)
+    workers_per_chunk = max(1, max_workers // len(chunks))
+    with ThreadPoolExecutor(max_workers=min(len(chunks), max_workers)) as executor:
+        futures = []
+        for first_year, last_year in chunks:
+            future = executor.submit(
+                download_indicator, indicator, first_year, last_year,
+                on_page=track_chunk((first_year, last_year)), value_column=value_column,
+                max_workers=workers_per_chunk, telemetry=telemetry
+            )
+            future.add_done_callback(lambda _: updates.put(None))
+            futures.append(future)
+
+        running = len(futures)
+        while running:
+            update = updates.get()
+            if update is None:
+                running -= 1
+                continue
+            chunk, pages_done, total_pages = update
+            progress[chunk] = (pages_done, total_pages)
+            if on_page:
+                done = sum(pages for pages, _ in progress.values())
+                total = sum(pages for _, pages in progress.values()) + len(chunks) - len(progress)
+                on_page(done, total)
+        frames = [frame for frame in (future.result() for future in futures) if frame is not None]
+
+    if not frames:
+        return None
+    # Each chunk has its own country categories, so the labels are re-encoded once merged
+    df = pd.concat(frames, ignore_index=True)
+    return df.astype({'country': 'category', 'country_code': 'category'})
+
+
+def iter_country_metadata(items):
+    """
+    Parse one page of the World Bank country endpoint.
+
+    Args:
+        items: Country items of a single API page
+
+    Yields:
+        tuple: (iso3, name, wb_region, income_group, is_aggregate)
+    """
+    for item in items:
+        region = item['region']['value'].strip()
+        yield item['id'], item['name'], region, item['incomeLevel']['value'].strip(), region == 'Aggregates'
+
+
+def fetch_country_metadata(max_workers=MAX_FETCH_WORKERS, telemetry=None):
+    """
+    Download the World Bank country list, which also describes every aggregate.
+
+    Args:
+        max_workers: Maximum number of concurrent page requests
+        telemetry: Optional IngestionTelemetry that every page is recorded in
+
+    Returns:
+        pd.DataFrame: iso3, name, wb_region, income_group and is_aggregate columns
+    """
+    url = f"{WORLD_BANK_API_URL}/country"
+    params = {'format': 'json', 'per_page': API_PAGE_SIZE}
+    rows = []
+    for page, items, stats in iter_api_pages(url, params, max_workers=max_workers):
+        start, size = time.perf_counter(), len(rows)
+        rows.extend(iter_country_metadata(items))
+        if telemetry:
+            telemetry.record_page('country', page, stats, time.perf_counter() - start, len(rows) - size)
+    return pd.DataFrame(rows, columns=['iso3', 'name', 'wb_region', 'income_group', 'is_aggregate'])
+
+
+def load_country_metadata(force_refresh=False, telemetry=None):
+    """
+    Load the country metadata from its cache, fetching it from the API on first use.
+
+    Args:
+        force_refresh: If True, re-downloads the metadata even if it is cached
+        telemetry: Optional IngestionTelemetry that fetched pages are recorded in
+
+    Returns:
+        pd.DataFrame: iso3, name, wb_region, income_group and is_aggregate columns
+    """
+    metadata = None if force_refresh else load_country_metadata_cache()
+    if metadata is None:
+        metadata = fetch_country_metadata(telemetry=telemetry)
+        save_country_metadata_cache(metadata)
+    return metadata
+
+
+def cached_date_range(cached_df, manifest=None):
+    """
+    Work out which years a cache covers.
+
+    The manifest's date_range records the years that were requested, which can be wider
+    than the years with observations (e.g. a year nothing has been published for yet).
+
+    Args:
+        cached_df: DataFrame loaded from the local cache
+        manifest: Cache manifest from data_cache.read_manifest(), or None
+
+    Returns:
+        tuple: (first_year, last_year) covered by the cache
+        None: If the cache is empty and has no manifest range
+    """
+    first_year, last_year = (manifest or {}).get('date_range') or (None, None)
+    if first_year is not None and last_year is not None:
+        return int(first_year), int(last_year)
+    if cached_df is None or cached_df.empty:
+        return None
+    return int(cached_df['year'].min()), int(cached_df['year'].max())
+
+
+def extended_date_range(covered, start_year=DATA_START_YEAR, end_year=DATA_END_YEAR):
+    """
+    Return the year range a cache covers once it has been extended to start_year-end_year.
+
+    Args:
+        covered: (first_year, last_year) the cache covered before, or None
+
+    Returns:
+        tuple: (first_year, last_year) spanning both ranges
+    """
+    if covered is None:
+        return start_year, end_year
+    return min(start_year, covered[0]), max(end_year, covered[1])
+
+
+def missing_year_windows(covered, start_year=DATA_START_YEAR, end_year=DATA_END_YEAR):
+    """
+    Work out which years must be fetched to extend a cache to start_year-end_year.
+
+    The cache always stays one contiguous range, so a requested range that does not
+    touch the covered one also pulls in the years between them.
+
+    Args:
+        covered: (first_year, last_year) the cache covers, or None for an empty cache
+
+    Returns:
+        list: (first_year, last_year) windows to fetch, at most one on each side
+    """
+    if covered is None:
+        return [(start_year, end_year)]
+    first_year, last_year = extended_date_range(covered, start_year, end_year)
+    windows = []
+    if first_year < covered[0]:
+        windows.append((first_year, covered[0] - 1))
+    if last_year > covered[1]:
+        windows.append((covered[1] + 1, last_year))
+    return windows
+
+
+def delta_year_windows(covered, cached_years, start_year=DATA_START_YEAR, end_year=DATA_END_YEAR,
+                       lookback=REFRESH_LOOKBACK_YEARS):
+    """
+    Work out which years a delta refresh needs to request.
+
+    The most recent `lookback` cached years are always re-requested since the World Bank
+    may still revise them. Years of the configured range the cache does not cover are
+    included as well.
+
+    Args:
+        covered: (first_year, last_year) the cache covers (see cached_date_range)
+        cached_years: Years with observations in the local cache
+        start_year: First year of the configured data range
+        end_year: Last year of the configured data range
+        lookback: Number of most recent cached years to re-request; 0 only fills gaps
+
+    Returns:
+        list: Non-overlapping (first_year, last_year) windows to fetch, in ascending order
+    """
+    windows = missing_year_windows(covered, start_year, end_year)
+    if lookback > 0:
+        cached_years = [int(y) for y in cached_years]
+        latest_cached = min(max(cached_years), end_year) if cached_years else end_year
+        last_year = extended_date_range(covered, start_year, end_year)[1]
+        windows.append((max(start_year, latest_cached - lookback + 1), last_year))
+
+    merged = []
+    for first_year, last_year in sorted(windows):
+        if merged and first_year <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], last_year))
+        else:
+            merged.append((first_year, last_year))
+    return merged
+
+
+def merge_inflation_data(cached_df, fresh_df, value_column='inflation'):
+    """
+    Merge freshly fetched observations into cached data by (country_code, year).
+
+    Fresh values replace cached values for the same key; all other cached rows are kept.
+
+    Args:
+        cached_df: DataFrame loaded from the local cache
+        fresh_df: DataFrame of newly fetched observations
+        value_column: Name of the column holding the observation values
+
+    Returns:
+        pd.DataFrame: Merged data with cache dtypes, sorted by country and descending year
+    """
+    merged = pd.concat([cached_df, fresh_df], ignore_index=True)
+    merged = merged.drop_duplicates(subset=['country_code', 'year'], keep='last')
+    merged = merged.sort_values(['country', 'year'], ascending=[True, False]).reset_index(drop=True)
+    return coerce_cache_dtypes(merged, value_column)
+
+
+def fetch_last_updated(indicator=INFLATION_INDICATOR, first_year=DATA_START_YEAR,
+                       last_year=DATA_END_YEAR, client=None, telemetry=None):
+    """
+    Ask the API when an indicator was last updated, using a single-record request.
+
+    Args:
+        indicator: World Bank indicator code
+        first_year: First year of the query window
+        last_year: Last year of the query window
+        client: WorldBankClient to use (defaults to the shared pooled client)
+        telemetry: Optional IngestionTelemetry that the request is recorded in
+
+    Returns:
+        str: The 'lastupdated' date from the response metadata
+        None: If the API did not report one
+    """
+    client = client or get_client()
+    url = f"{WORLD_BANK_API_URL}/country/all/indicator/{indicator}"
+    params = {'format': 'json', 'date': f'{first_year}:{last_year}', 'per_page': 1}
+    stats = {}
+    data = client.get_json(url, params=params, deadline=time.monotonic() + API_DEADLINE, stats=stats)
+    if telemetry:
+        telemetry.record_page(f"{indicator} lastupdated", 1, stats)
+    if not data or not isinstance(data[0], dict):
+        return None
+    return data[0].get('lastupdated')
+
+
+def cache_is_current(manifest, last_updated, start_year=DATA_START_YEAR, end_year=DATA_END_YEAR):
+    """
+    Check whether a cache manifest shows the cache already holds the latest API data.
+
+    Args:
+        manifest: Cache manifest from data_cache.read_manifest(), or None
+        last_updated: The API's current 'lastupdated' stamp
+        start_year: First year the cache must cover
+        end_year: Last year the cache must cover
+
+    Returns:
+        bool: True if nothing changed upstream since the cache was fetched
+    """
+    if not manifest or not last_updated or manifest.get('source_last_updated') != last_updated:
+        return False
+    first_year, last_year = manifest.get('date_range') or (None, None)
+    return first_year is not None and first_year <= start_year and last_year >= end_year
+
+
+def refresh_inflation_data(cached_df=None, on_page=None, start_year=DATA_START_YEAR,
+                           end_year=DATA_END_YEAR, lookback=REFRESH_LOOKBACK_YEARS, telemetry=None):
+    """
+    Download headline inflation data, as a delta refresh on top of cached data when given.
+
+    A delta refresh first makes a single-record request for the indicator's
+    'lastupdated' stamp and skips the download entirely if it matches the cache manifest.
+    With lookback=0 only the years outside the cached range are fetched (extending the
+    cache) and the cached years are not revalidated. Large windows are fetched as
+    parallel chunks (see download_year_windows). Aggregate rows are dropped and each
+    country is tagged with its World Bank region and income group.
+
+    Args:
+        cached_df: Optional cached inflation data; without it the full range is downloaded
+        on_page: Optional progress callback passed to fetch_api_pages
+        start_year: First year the data must cover
+        end_year: Last year the data must cover
+        lookback: Number of most recent cached years to re-request (see delta_year_windows)
+        telemetry: Optional IngestionTelemetry that every API request is recorded in
+
+    Returns:
+        tuple: (df, windows, last_updated) where windows lists the (first_year, last_year)
+            windows fetched and df is None if the API returned no observations. If there
+            was nothing to fetch, df is cached_df and windows is None.
+    """
+    if cached_df is not None:
+        manifest = read_manifest()
+        if lookback > 0:
+            last_updated = fetch_last_updated(first_year=start_year, last_year=end_year, telemetry=telemetry)
+            if cache_is_current(manifest, last_updated, start_year, end_year):
+                return cached_df, None, last_updated
+        else:
+            # The cached years keep the stamp they were fetched under
+            last_updated = (manifest or {}).get('source_last_updated')
+        windows = delta_year_windows(cached_date_range(cached_df, manifest), cached_df['year'].unique(),
+                                     start_year, end_year, lookback)
+        if not windows:
+            return cached_df, None, last_updated
+    else:
+        last_updated = fetch_last_updated(first_year=start_year, last_year=end_year, telemetry=telemetry)
+        windows = [(start_year, end_year)]
+
+    df = download_year_windows(INFLATION_INDICATOR, windows, on_page=on_page, value_column='inflation',
+                               telemetry=telemetry)
+    if df is not None:
+        if cached_df is not None:
+            # Metadata is re-attached to every row below, so only the observations are merged
+            df = merge_inflation_data(cached_df.drop(columns=['wb_region', 'income_group'], errors='ignore'), df)
+        # A full re-download also refreshes the country list
+        metadata = load_country_metadata(force_refresh=cached_df is None, telemetry=telemetry)
+        df = coerce_cache_dtypes(attach_country_metadata(df, metadata))
+    return df, windows, last_updated
+
+
+def validate_inflation_data(df, previous_df=None, min_retained=0.9):
+    """
+    Check that a freshly loaded dataset is safe to serve in place of the current one.
+
+    Args:
+        df: Candidate inflation DataFrame
+        previous_df: Dataset currently being served, if any
+        min_retained: Smallest allowed row count as a fraction of previous_df's
+
+    Raises:
+        ValueError: If the dataset is empty, malformed or much smaller than before
+    """
+    required = {'country', 'country_code', 'year', 'inflation'}
+    if df is None or df.empty:
+        raise ValueError("Dataset is empty")
+    missing = required - set(df.columns)
+    if missing:
+        raise ValueError(f"Dataset is missing columns: {', '.join(sorted(missing))}")
+    if df.duplicated(subset=['country_code', 'year']).any():
+        raise ValueError("Dataset has duplicate (country_code, year) rows")
+    if previous_df is not None and len(df) < min_retained * len(previous_df):
+        raise ValueError(f"Dataset shrank from {len(previous_df):,} to {len(df):,} rows")
+
+
+def _load_headline_indicator(first_year, last_year, force_refresh):
+    """
+    Load the headline inflation indicator from the main cache, refreshing it if needed.
+
+    Returns:
+        tuple: (DataFrame with a value column or None, 'api' if any page was fetched else 'cache')
+    """
+    from loader import load_inflation_data  # loader imports this module
+
+    pages = []
+    df = load_inflation_data(
+        force_refresh=force_refresh, start_year=first_year, end_year=last_year,
+        on_page=lambda pages_done, total_pages: pages.append(pages_done)
+    )
+    if df is None:
+        return None, None
+    return df.rename(columns={'inflation': 'value'}), 'api' if pages else 'cache'
+
+
+def fetch_indicators(indicators, first_year=DATA_START_YEAR, last_year=DATA_END_YEAR,
+                     force_refresh=False, on_indicator=None):
+    """
+    Load several World Bank indicators into one long table.
+
+    Each indicator has its own cache file and manifest. Indicators without a cache are
+    downloaded, cached indicators are extended with the years of first_year-last_year
+    they do not cover, and force_refresh re-downloads every indicator over the union of
+    the requested and cached years. Downloads run concurrently, splitting the page worker
+    budget between them, and are written back to the caches. The headline inflation
+    indicator is the main cache, so it is loaded through loader.load_inflation_data,
+    which refreshes it under the cache lock and keeps its manifest and vintages.
+
+    Args:
+        indicators: Indicator codes to load
+        first_year: First year the data must cover
+        last_year: Last year the data must cover
+        force_refresh: If True, re-downloads every indicator even if it is cached
+        on_indicator: Optional callback called as on_indicator(indicator, source) where
+            source is 'cache' or 'api'
+
+    Returns:
+        pd.DataFrame: country, country_code, indicator, year and value columns,
+            keyed by (country_code, indicator, year)
+    """
+    frames = {}
+    to_download = {}  # indicator -> (cached frame or None, year windows to fetch, range once saved)
+    for indicator in indicators:
+        if indicator == INFLATION_INDICATOR:
+            df, source = _load_headline_indicator(first_year, last_year, force_refresh)
+            if df is not None:
+                frames[indicator] = df
+                if on_indicator:
+                    on_indicator(indicator, source)
+            continue
+        cached = load_indicator_cache(indicator)
+        covered = cached_date_range(cached, {'date_range': indicator_date_range(indicator)})
+        if force_refresh or cached is None:
+            # A re-download keeps every year the cache held, not just the requested ones
+            windows = [extended_date_range(covered, first_year, last_year)]
+            cached = None
+        else:
+            windows = missing_year_windows(covered, first_year, last_year)
+        if windows:
+            to_download[indicator] = (cached, windows, extended_date_range(covered, first_year, last_year))
+        else:
+            frames[indicator] = cached
+            if on_indicator:
+                on_indicator(indicator, 'cache')
+
+    if to_download:
+        metadata = load_country_metadata()
+        workers_per_indicator = max(1, MAX_FETCH_WORKERS // len(to_download))
+        with ThreadPoolExecutor(max_workers=len(to_download)) as executor:
+            futures = {
+                indicator: executor.submit(
+                    download_year_windows, indicator, windows, max_workers=workers_per_indicator
+                )
+                for indicator, (_, windows, _) in to_download.items()
+            }
+            for indicator, future in futures.items():
+                cached, _, date_range = to_download[indicator]
+                df = future.result()
+                if df is None:
+                    if cached is not None:
+                        frames[indicator] = cached
+                    continue
+                if cached is not None:
+                    # Metadata is re-attached to every row below, so only the observations are merged
+                    df = merge_inflation_data(
+                        cached.drop(columns=['wb_region', 'income_group'], errors='ignore'), df, 'value'
+                    )
+                df = attach_country_metadata(df, metadata)
+                save_indicator_cache(indicator, df, date_range=date_range)
+                frames[indicator] = df
+                if on_indicator:
+                    on_indicator(indicator, 'api')
+
+    long_frames = [
+        frames[indicator].assign(indicator=indicator)
+        for indicator in indicators if indicator in frames
+    ]
+    if not long_frames:
+        return pd.DataFrame(columns=['country', 'country_code', 'indicator', 'year', 'value'])
+
+    long_df = pd.concat(long_frames, ignore_index=True)
+    long_df = long_df.astype({
+        'country': 'category',
+        'country_code': 'category',
+        'indicator': pd.CategoricalDtype(list(indicators)),
+    })
+    return long_df[['country', 'country_code', 'indicator', 'year', 'value']]
@@ -0,0 +1,138 @@
+import logging
+import threading
+import time
+
+from data_cache import load_cache, save_cache, cache_checked_at, mark_cache_checked, single_flight, read_manifest
+from ingestion import refresh_inflation_data, validate_inflation_data, cached_date_range, extended_date_range
+from telemetry import IngestionTelemetry
+from vintages import record_vintage
+from config import DATA_MAX_AGE, REFRESH_RETRY_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+class LiveDataset:
+    """
+    The inflation dataset currently served to every session, refreshed in the background.
+
+    Readers always get the current dataset immediately (stale-while-revalidate). A refresh
+    runs on a background thread; the new dataset is validated and written to the cache
+    before being swapped in under a lock, so readers never see a partial update.
+    """
+
+    def __init__(self, max_age=DATA_MAX_AGE):
+        self.max_age = max_age
+        self.refreshing = False
+        self.last_error = None
+        self._last_attempt = None
+        self._df = None
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    def load_from_cache(self):
+        """Serve whatever is in the local cache, timestamped with its last fetch or revalidation."""
+        df = load_cache()
+        if df is not None:
+            self.publish(df, cache_checked_at())
+        return df
+
+    def publish(self, df, fetched_at=None):
+        """Atomically swap in a new dataset fetched at `fetched_at` (defaults to now)."""
+        with self._lock:
+            self._df = df
+            self._fetched_at = fetched_at if fetched_at is not None else time.time()
+
+    def snapshot(self):
+        """
+        Return the dataset being served and when it was fetched.
+
+        Returns:
+            tuple: (DataFrame or None, fetch time as a Unix timestamp or None)
+        """
+        with self._lock:
+            return self._df, self._fetched_at
+
+    def age(self):
+        """Seconds since the served dataset was fetched, or None if nothing is loaded."""
+        _, fetched_at = self.snapshot()
+        return None if fetched_at is None else time.time() - fetched_at
+
+    def is_stale(self):
+        age = self.age()
+        return age is not None and age > self.max_age
+
+    def refresh_if_stale(self):
+        """
+        Start a background refresh if the served data is older than max_age.
+
+        After a failed refresh, automatic retries wait REFRESH_RETRY_INTERVAL seconds so
+        an unreachable API is not hit on every rerun.
+
+        Returns:
+            bool: True if a new refresh was started
+        """
+        if not self.is_stale():
+            return False
+        if (self.last_error and self._last_attempt is not None
+                and time.time() - self._last_attempt < REFRESH_RETRY_INTERVAL):
+            return False
+        return self.refresh_async()
+
+    def refresh_async(self, full=False):
+        """
+        Start a background refresh unless one is already running.
+
+        Args:
+            full: If True, re-download the full date range instead of a delta refresh
+
+        Returns:
+            bool: True if a new refresh was started
+        """
+        with self._lock:
+            if self.refreshing:
+                return False
+            self.refreshing = True
+            self._last_attempt = time.time()
+
+        thread = threading.Thread(target=self._refresh, args=(full,), daemon=True)
+        thread.start()
+        return True
+
+    def _refresh(self, full):
+        try:
+            current_df, _ = self.snapshot()
+
+            def refresh_and_save():
+                cached_df = None if full else current_df
+                # A full re-download still covers every year the cache held (see load_inflation_data)
+                covered = cached_date_range(cached_df, read_manifest())
+                start_year, end_year = extended_date_range(covered)
+                telemetry = IngestionTelemetry('background full download' if full else 'background refresh')
+                try:
+                    df, windows, last_updated = refresh_inflation_data(
+                        cached_df, start_year=start_year, end_year=end_year, telemetry=telemetry
+                    )
+                finally:
+                    telemetry.finish()
+                if windows is None:
+                    mark_cache_checked()
+                    return df
+                validate_inflation_data(df, current_df)
+                date_range = extended_date_range(covered)
+                save_cache(df, date_range=date_range, source_last_updated=last_updated)
+                try:
+                    record_vintage(df, last_updated, date_range)
+                except Exception:
+                    # The refreshed data is saved; a missing vintage must not hold it back
+                    logger.exception("Could not record data vintage")
+                return df
+
+            # Another process may already be refreshing; if so its result is reused
+            df, _ = single_flight(refresh_and_save)
+            self.publish(df, cache_checked_at())
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+        finally:
+            with self._lock:
+                self.refreshing = False
@@ -0,0 +1,142 @@
+from data_cache import cache_exists, load_cache, save_cache, single_flight, mark_cache_checked, read_manifest
+from ingestion import refresh_inflation_data, cached_date_range, extended_date_range
+from telemetry import IngestionTelemetry
+from vintages import record_vintage
+from config import CACHE_FILE, DATA_START_YEAR, DATA_END_YEAR, REFRESH_LOOKBACK_YEARS
+
+
+def _describe(df):
+    """Summarise a dataset as 'N records across M countries (first-last)'."""
+    return (
+        f"{len(df):,} records across {df['country'].nunique()} countries "
+        f"({df['year'].min()}-{df['year'].max()})"
+    )
+
+
+def _format_windows(windows):
+    """Format year windows as '1960-1989, 2023-2024'."""
+    return ", ".join(f"{first_year}-{last_year}" for first_year, last_year in windows)
+
+
+def load_inflation_data(force_refresh=False, full_refresh=False, on_status=None, on_page=None,
+                        start_year=DATA_START_YEAR, end_year=DATA_END_YEAR, telemetry=None):
+    """
+    Load inflation data from the local cache, refreshing it from the World Bank API when needed.
+
+    Historical data is cached locally and only fetched once. A refresh is a delta
+    refresh by default: only the most recent (or missing) years are requested and
+    merged into the cache by (country_code, year). If the cache does not cover
+    start_year-end_year, only the missing years are fetched and the cache grows in place.
+
+    This function has no UI dependencies; progress is reported through the callbacks
+    so it can be driven from Streamlit, a CLI or a scheduled job alike. Every API request
+    is recorded in an IngestionTelemetry, which is logged and, once the fetch finishes,
+    available from telemetry.last_telemetry().
+
+    Args:
+        force_refresh: If True, refreshes the cache from the API even if it exists
+        full_refresh: If True, ignores the cache and re-downloads the full date range
+        on_status: Optional callback called as on_status(level, message) with level one
+            of 'info', 'success', 'warning' or 'error'
+        on_page: Optional callback called as on_page(pages_done, total_pages) while fetching
+        start_year: First year the data must cover
+        end_year: Last year the data must cover
+        telemetry: IngestionTelemetry to record requests in (a new one by default)
+
+    Returns:
+        pd.DataFrame: DataFrame containing country, country_code, year, and inflation columns
+        None: If no data is available
+
+    Raises:
+        requests.exceptions.RequestException: If the API could not be reached
+    """
+    def report(level, message):
+        if on_status:
+            on_status(level, message)
+
+    # Load cached data unless a full re-download was requested
+    # (a legacy CSV cache is migrated to Parquet on first load)
+    cached_df = None
+    if cache_exists() and not full_refresh:
+        try:
+            report('info', "Loading data from local cache...")
+            cached_df = load_cache()
+        except Exception as e:
+            report('warning', f"Failed to load cached data: {str(e)}. Fetching from API...")
+
+    # The manifest still describes the cache when its data is discarded (full refresh or
+    # a failed load), so a re-download covers every year the cache held, not just the
+    # configured range
+    covered = cached_date_range(cached_df, read_manifest()) if cache_exists() else None
+    fetch_years = (start_year, end_year)
+    if cached_df is None:
+        fetch_years = extended_date_range(covered, start_year, end_year)
+    lookback = REFRESH_LOOKBACK_YEARS
+    if cached_df is not None and not force_refresh:
+        if covered is not None and covered[0] <= start_year and covered[1] >= end_year:
+            report('success', f"Data loaded from cache: {_describe(cached_df)}")
+            return cached_df
+        # Only fetch the years the cache is missing; the cached years are not revalidated
+        report('info', f"Extending cached data to {start_year}-{end_year}...")
+        lookback = 0
+
+    if telemetry is None:
+        if cached_df is None:
+            telemetry = IngestionTelemetry('full download')
+        else:
+            telemetry = IngestionTelemetry('delta refresh' if lookback else 'cache extension')
+    windows = None
+
+    def refresh_and_save():
+        nonlocal windows
+        try:
+            df, windows, last_updated = refresh_inflation_data(
+                cached_df, on_page=on_page, start_year=fetch_years[0], end_year=fetch_years[1],
+                lookback=lookback, telemetry=telemetry
+            )
+        finally:
+            # Failed runs are published too; they are the ones worth inspecting
+            telemetry.finish()
+        if windows is None:
+            # Nothing changed upstream since the cache was fetched
+            mark_cache_checked()
+        elif df is not None:
+            date_range = extended_date_range(covered, start_year, end_year)
+            try:
+                save_cache(df, date_range=date_range, source_last_updated=last_updated)
+                report('success', f"Data cached locally to {CACHE_FILE}")
+            except Exception as e:
+                report('warning', f"Could not save cache file: {str(e)}")
+                return df
+            try:
+                vintage = record_vintage(df, last_updated, date_range)
+                if vintage:
+                    report('info', f"Recorded data vintage {vintage['id']} ({vintage['added']} added, "
+                                   f"{vintage['revised']} revised, {vintage['removed']} removed)")
+            except Exception as e:
+                report('warning', f"Could not record data vintage: {str(e)}")
+        return df
+
+    # Only one process fetches at a time; the others wait and reuse its result
+    df, fetched_here = single_flight(refresh_and_save)
+
+    if df is None:
+        if cached_df is not None:
+            report('warning', "No new data received from World Bank API. Keeping cached data.")
+            return cached_df
+        report('error', "No data received from World Bank API")
+        return None
+
+    if not fetched_here:
+        source = "Data refreshed by another worker loaded from cache"
+    elif windows is None:
+        source = "World Bank data unchanged since the last fetch; cache revalidated"
+    elif cached_df is not None and lookback == 0:
+        source = f"Cache extended with {_format_windows(windows)}"
+    elif cached_df is not None:
+        source = f"Delta refresh ({_format_windows(windows)}) merged into cache"
+    else:
+        source = "Data fetched from API"
+
+    report('success', f"{source}: {_describe(df)}")
+    return df
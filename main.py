@@ -5,15 +5,37 @@ from datetime import datetime
 import plotly.graph_objects as go
 import plotly.express as px
 
-from config import set_page_config, COUNTRY_COORDS, COUNTRY_REGIONS
-from util import apply_presentation_mode_css, fetch_inflation_data
+from config import (
+    set_page_config,
+    INDICATORS,
+    INFLATION_INDICATOR,
+    STALE_WHILE_REVALIDATE,
+    SHOW_TELEMETRY_PANEL,
+    SQL_STORE_ENABLED,
+)
+from util import (
+    apply_presentation_mode_css,
+    fetch_inflation_data,
+    fetch_indicator_data,
+    load_inflation_cube,
+    load_precomputed_artifacts,
+    load_data_store,
+    load_map_frames,
+    load_sql_store,
+    get_live_dataset,
+    format_age,
+    show_telemetry_panel,
+)
+from data_cache import cache_exists, cache_version, cache_checked_at, dataset_version
+from countries import load_country_table
+from telemetry import last_telemetry
 from analytics import (
-    prepare_map_data,
     generate_insights,
     calculate_adjusted_value,
     cluster_countries,
     find_similar_countries,
     calculate_volatility,
+    compare_indicators,
 )
 
 # ---- Page config ----
@@ -56,18 +78,53 @@ if 'show_clusters' not in st.session_state:
     st.session_state.show_clusters = False
 if 'force_refresh' not in st.session_state:
     st.session_state.force_refresh = False
+if 'full_refresh' not in st.session_state:
+    st.session_state.full_refresh = False
 
 # Fetch data with caching support
-with st.spinner("Loading inflation data..."):
-    inflation_df = fetch_inflation_data(force_refresh=st.session_state.force_refresh)
-    # Reset force_refresh flag after data is loaded
-    if st.session_state.force_refresh:
+live_dataset = get_live_dataset() if STALE_WHILE_REVALIDATE else None
+inflation_df, data_fetched_at = live_dataset.snapshot() if live_dataset else (None, None)
+
+if live_dataset and inflation_df is not None:
+    # Serve the current dataset immediately; refreshes happen on a background thread
+    if st.session_state.force_refresh or st.session_state.full_refresh:
+        live_dataset.refresh_async(full=st.session_state.full_refresh)
         st.session_state.force_refresh = False
+        st.session_state.full_refresh = False
+    else:
+        live_dataset.refresh_if_stale()
+else:
+    with st.spinner("Loading inflation data..."):
+        inflation_df = fetch_inflation_data(
+            force_refresh=st.session_state.force_refresh,
+            full_refresh=st.session_state.full_refresh
+        )
+        # Reset refresh flags after data is loaded
+        if st.session_state.force_refresh or st.session_state.full_refresh:
+            st.session_state.force_refresh = False
+            st.session_state.full_refresh = False
+
+    data_fetched_at = cache_checked_at()
+    if live_dataset and inflation_df is not None:
+        live_dataset.publish(inflation_df, data_fetched_at)
 
 if inflation_df is None or inflation_df.empty:
     st.error("Unable to fetch inflation data. Please try again later.")
     st.stop()
 
+# Dense country x year matrix, memory-mapped once per process and shared by all sessions
+inflation_cube = load_inflation_cube(cache_version())
+
+# Map frames and analytics prebuilt by warmup.py, if they were built from this dataset
+precomputed = load_precomputed_artifacts(dataset_version())
+
+# Dataset sorted by (country, year) with per-country and per-year row offsets, built once
+# per dataset and shared by all sessions, so country and year lookups avoid full scans
+data_store = load_data_store(dataset_version(), data_fetched_at, inflation_df)
+
+# Optional indexed SQLite copy of the dataset for region/year filter queries and exports
+sql_store = load_sql_store(dataset_version(), inflation_df) if SQL_STORE_ENABLED else None
+
 # Get available years
 available_years = sorted(inflation_df['year'].unique(), reverse=True)
 latest_year = available_years[0]
@@ -79,11 +136,13 @@ if st.session_state.year_from is None:
 if st.session_state.year_to is None:
     st.session_state.year_to = latest_year
 
-# Get list of countries with coordinates
-all_countries = sorted([
-    country for country in inflation_df['country'].unique()
-    if country in COUNTRY_COORDS
-])
+# One row per country with its region, joined from the ISO3-keyed country table
+# (aggregates are dropped at ingestion time)
+country_table = load_country_table()
+country_index = country_table.join(
+    inflation_df[['country', 'country_code']].drop_duplicates('country_code'), columns=('region',)
+)
+all_countries = sorted(country_index['country'])
 
 # Sidebar controls
 with st.sidebar:
@@ -91,7 +150,7 @@ with st.sidebar:
 
     # Region filter
     st.subheader("Region Filter")
-    all_regions = sorted(set(COUNTRY_REGIONS.values()))
+    all_regions = country_table.regions()
     selected_regions = st.multiselect(
         "Select regions",
         options=all_regions,
@@ -127,10 +186,9 @@ with st.sidebar:
 
     filtered_countries = all_countries.copy()
     if selected_regions:
-        filtered_countries = [
-            c for c in filtered_countries
-            if COUNTRY_REGIONS.get(c) in selected_regions
-        ]
+        filtered_countries = sorted(
+            country_index.loc[country_index['region'].isin(selected_regions), 'country']
+        )
 
     st.subheader("Country Selection")
     selected_country = st.selectbox(
@@ -211,22 +269,42 @@ with st.sidebar:
 
     st.divider()
 
+    last_updated = (
+        datetime.fromtimestamp(data_fetched_at).strftime('%Y-%m-%d %H:%M')
+        if data_fetched_at else datetime.now().strftime('%Y-%m-%d')
+    )
     st.markdown(f"""
     **Data Source:** World Bank API  
     **Indicator:** Inflation, consumer prices (annual %)  
-    **Last Updated:** {datetime.now().strftime('%Y-%m-%d')}
+    **Last Updated:** {last_updated}
     """)
+
+    # Data age indicator
+    if data_fetched_at:
+        data_age = format_age(datetime.now().timestamp() - data_fetched_at)
+        if live_dataset and live_dataset.refreshing:
+            st.caption(f"Data age: {data_age} · refreshing in background...")
+        else:
+            st.caption(f"Data age: {data_age}")
+        if live_dataset and live_dataset.last_error:
+            st.caption(f"Last background refresh failed: {live_dataset.last_error}")
     
     # Refresh data button
-    import os
-    cache_exists = os.path.exists("inflation_data_cache.csv")
+    has_cache = cache_exists()
     
     if st.button("🔄 Refresh Data from API", use_container_width=True):
         st.session_state.force_refresh = True
         st.rerun()
+
+    if has_cache and st.button("Full Re-download", use_container_width=True):
+        st.session_state.full_refresh = True
+        st.rerun()
     
-    if cache_exists:
-        st.caption("Using cached data. Click above to fetch latest from API.")
+    if has_cache:
+        st.caption(
+            "Using cached data. Refresh fetches only recent years from the API; "
+            "full re-download fetches the entire date range."
+        )
     else:
         st.caption("No cache found. Data will be fetched from API.")
 
@@ -263,22 +341,44 @@ selected_year = st.select_slider(
 
 st.markdown(f"### Viewing data for: **{selected_year}**")
 
-# Apply region filter to data
-filtered_inflation_df = inflation_df.copy()
+# Apply region filter to data. inflation_df is shared by every session in the process, so
+# it is never copied or modified here: without a filter it is used as is, and a region
+# filter only materialises the selected rows (the store selection is just a country mask)
+filtered_inflation_df = inflation_df
+filtered_store = data_store
 if selected_regions:
-    filtered_inflation_df = filtered_inflation_df[
-        filtered_inflation_df['country'].map(lambda x: COUNTRY_REGIONS.get(x) in selected_regions)
-    ]
+    region_codes = country_index.loc[country_index['region'].isin(selected_regions), 'country_code']
+    if sql_store:
+        filtered_inflation_df = sql_store.query(regions=selected_regions)
+    else:
+        filtered_inflation_df = inflation_df[inflation_df['country_code'].isin(region_codes)]
+    filtered_store = data_store.select_countries(region_codes)
+
+# Precomputed artifacts describe the full dataset, so they only apply without a region filter
+artifacts = precomputed if not selected_regions else None
+
+# Map data for every year is prepared once per dataset and region filter and shared by all
+# sessions, so moving the slider only looks up the year's frame
+map_frames = load_map_frames(
+    dataset_version(),
+    data_fetched_at,
+    tuple(sorted(selected_regions)),
+    filtered_inflation_df,
+    filtered_store,
+    available_years,
+)
+map_data = map_frames[int(selected_year)]
 
 st.divider()
 
 # Show insights
 insights = generate_insights(
-    prepare_map_data(filtered_inflation_df, selected_year),
+    map_data,
     filtered_inflation_df,
     selected_year,
     selected_regions,
-    selected_country=st.session_state.selected_country
+    selected_country=st.session_state.selected_country,
+    store=filtered_store
 )
 if insights:
     with st.expander(" **Automatic Insights**", expanded=True):
@@ -312,9 +412,6 @@ with tab1:
     title_size = "h1" if st.session_state.presentation_mode else "h3"
     st.markdown(f"<{title_size}> Global Inflation Map - {selected_year}</{title_size}>", unsafe_allow_html=True)
 
-    # Prepare map data (with filtered data)
-    map_data = prepare_map_data(filtered_inflation_df, selected_year)
-
     # Apply clustering if enabled
     cluster_colors = {
         0: [255, 100, 100, 220],   # Red cluster
@@ -324,7 +421,10 @@ with tab1:
     }
 
     if st.session_state.show_clusters:
-        cluster_result = cluster_countries(filtered_inflation_df, n_clusters=4)
+        if artifacts and artifacts.clusters:
+            cluster_result = artifacts.clusters, None
+        else:
+            cluster_result = cluster_countries(filtered_inflation_df, n_clusters=4, cube=inflation_cube)
         if cluster_result:
             cluster_map, _ = cluster_result
             map_data_display = map_data.copy()
@@ -554,11 +654,20 @@ with tab2:
         )
 
         # Filter data for selected countries and date range
-        comparison_data = filtered_inflation_df[
-            (filtered_inflation_df['country'].isin(compare_countries)) &
-            (filtered_inflation_df['year'] >= year_from) &
-            (filtered_inflation_df['year'] <= year_to)
-        ].sort_values('year')
+        if sql_store:
+            compare_codes = country_index.loc[country_index['country'].isin(compare_countries), 'country_code']
+            comparison_data = sql_store.query(
+                regions=selected_regions or None,
+                year_from=year_from,
+                year_to=year_to,
+                country_codes=compare_codes.tolist()
+            ).sort_values('year')
+        else:
+            comparison_data = filtered_inflation_df[
+                (filtered_inflation_df['country'].isin(compare_countries)) &
+                (filtered_inflation_df['year'] >= year_from) &
+                (filtered_inflation_df['year'] <= year_to)
+            ].sort_values('year')
 
         if not comparison_data.empty:
             # Create comparison chart
@@ -750,7 +859,8 @@ with tab3:
                 calc_start_year,
                 calc_end_year,
                 calc_amount,
-                filtered_inflation_df
+                filtered_inflation_df,
+                store=filtered_store
             )
 
             if result_df is not None and final_value is not None:
@@ -850,10 +960,8 @@ if st.session_state.selected_country:
     st.divider()
     st.header(f" Country Analysis: {st.session_state.selected_country}")
 
-    # Filter data for selected country
-    country_data = filtered_inflation_df[
-        filtered_inflation_df['country'] == st.session_state.selected_country
-    ].sort_values('year')
+    # Slice the selected country's rows (sorted by year) out of the indexed store
+    country_data = filtered_store.country_frame(st.session_state.selected_country)
 
     if not country_data.empty:
         # Current year inflation
@@ -913,7 +1021,10 @@ if st.session_state.selected_country:
             st.divider()
             st.subheader(" Similar Countries")
 
-            similar_countries = find_similar_countries(st.session_state.selected_country, filtered_inflation_df, top_n=5)
+            similar_countries = find_similar_countries(
+                st.session_state.selected_country, filtered_inflation_df, top_n=5, cube=inflation_cube,
+                similarity=artifacts.similarity if artifacts else None
+            )
 
             if similar_countries is not None:
                 st.markdown(f"**Countries with similar inflation patterns to {st.session_state.selected_country}:**")
@@ -1023,6 +1134,45 @@ if st.session_state.selected_country:
 
         st.plotly_chart(fig, width='stretch')
 
+        # Compare inflation measures (fetched on demand, cached per indicator)
+        if st.checkbox("Compare inflation measures", help="Overlay other World Bank inflation measures"):
+            measure_codes = st.multiselect(
+                "Measures",
+                options=list(INDICATORS),
+                default=[INFLATION_INDICATOR, 'NY.GDP.DEFL.KD.ZG'],
+                format_func=INDICATORS.get
+            )
+
+            if measure_codes:
+                with st.spinner("Loading inflation measures..."):
+                    indicator_df = fetch_indicator_data(tuple(measure_codes))
+
+                measures = None
+                if indicator_df is not None:
+                    measures = compare_indicators(indicator_df, st.session_state.selected_country)
+
+                if measures is not None:
+                    measures = measures[(measures.index >= year_from) & (measures.index <= year_to)]
+                    fig_measures = go.Figure()
+                    for code in measures.columns:
+                        fig_measures.add_trace(go.Scatter(
+                            x=measures.index,
+                            y=measures[code],
+                            mode='lines+markers',
+                            name=INDICATORS.get(code, code),
+                            hovertemplate='<b>Year</b>: %{x}<br><b>Value</b>: %{y:.2f}<extra></extra>'
+                        ))
+                    fig_measures.update_layout(
+                        title=f"Inflation Measures: {st.session_state.selected_country}",
+                        xaxis_title="Year",
+                        yaxis_title="Value",
+                        hovermode='x unified',
+                        height=400
+                    )
+                    st.plotly_chart(fig_measures, width='stretch')
+                else:
+                    st.info("No data available for the selected measures")
+
         # Data table for selected country
         with st.expander(" View Historical Data"):
             display_country_df = country_data[['year', 'inflation']].sort_values('year', ascending=False)
@@ -1108,10 +1258,15 @@ if not st.session_state.presentation_mode:
 
         with col1:
             # Prepare filtered data for export
-            export_data = filtered_inflation_df[
-                (filtered_inflation_df['year'] >= year_from) &
-                (filtered_inflation_df['year'] <= year_to)
-            ].sort_values(['country', 'year'])
+            if sql_store:
+                export_data = sql_store.query(
+                    regions=selected_regions or None, year_from=year_from, year_to=year_to
+                ).sort_values(['country', 'year'])
+            else:
+                export_data = filtered_inflation_df[
+                    (filtered_inflation_df['year'] >= year_from) &
+                    (filtered_inflation_df['year'] <= year_to)
+                ].sort_values(['country', 'year'])
 
             csv = export_data.to_csv(index=False)
             st.download_button(
@@ -1152,6 +1307,10 @@ Display Options:
 
 st.divider()
 
+# Admin/debug panel: per-request timings of the last API fetch in this process
+if SHOW_TELEMETRY_PANEL or st.query_params.get('debug') == '1':
+    show_telemetry_panel(last_telemetry())
+
 # Footer
 st.divider()
 st.markdown("""
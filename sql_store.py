@@ -0,0 +1,203 @@
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from countries import load_country_table
+from data_cache import atomic_write, coerce_cache_dtypes
+from config import SQL_STORE_FILE, INFLATION_INDICATOR
+
+# One row per observation. region is the country table's region (the one the sidebar
+# filters on), stored on every row so (year, region) can be indexed. Both indexes lead
+# with the indicator, since every query is for a single indicator.
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE observations (
+    indicator TEXT NOT NULL,
+    country TEXT NOT NULL,
+    country_code TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    value REAL,
+    wb_region TEXT,
+    income_group TEXT,
+    region TEXT
+);
+CREATE INDEX observations_country_year ON observations (indicator, country_code, year);
+CREATE INDEX observations_year_region ON observations (indicator, year, region);
+"""
+
+OBSERVATION_COLUMNS = ['indicator', 'country', 'country_code', 'year', 'value', 'wb_region', 'income_group', 'region']
+
+
+def _column_values(series):
+    """Convert a column to Python values for sqlite3, with None for missing values."""
+    series = series.astype('object')
+    return series.where(series.notna(), None).tolist()
+
+
+def _observation_rows(indicator, df, value_column):
+    """Build the observations rows for one indicator's DataFrame, in the DataFrame's row order."""
+    regions = load_country_table().join(df[['country', 'country_code']], columns=('region',))['region']
+    columns = [
+        [indicator] * len(df),
+        _column_values(df['country']),
+        _column_values(df['country_code']),
+        df['year'].astype('int64').tolist(),
+        df[value_column].astype('float64').tolist(),
+        _column_values(df['wb_region']) if 'wb_region' in df.columns else [None] * len(df),
+        _column_values(df['income_group']) if 'income_group' in df.columns else [None] * len(df),
+        _column_values(regions),
+    ]
+    return zip(*columns)
+
+
+def build_sql_store(df, dataset_version, path=SQL_STORE_FILE, indicator_frames=None):
+    """
+    Write the dataset to an indexed SQLite database.
+
+    The database is built in a temporary file and renamed into place, so processes that
+    have the previous version open keep reading it undisturbed.
+
+    Args:
+        df: Inflation DataFrame (stored as INFLATION_INDICATOR)
+        dataset_version: Version of df (see data_cache.dataset_version) recorded in the database
+        path: Destination database file
+        indicator_frames: Optional dict of indicator code -> DataFrame with country,
+            country_code, year and value columns (e.g. from data_cache.load_indicator_cache)
+
+    Returns:
+        SqlStore: Store reading the new database
+    """
+    frames = [(INFLATION_INDICATOR, df, 'inflation')]
+    frames += [(indicator, frame, 'value') for indicator, frame in (indicator_frames or {}).items()
+               if indicator != INFLATION_INDICATOR]
+
+    with atomic_write(path) as tmp_path:
+        os.remove(tmp_path)
+        connection = sqlite3.connect(tmp_path)
+        try:
+            # The file is only renamed into place once complete, so skip the journal
+            connection.execute("PRAGMA journal_mode = OFF")
+            connection.execute("PRAGMA synchronous = OFF")
+            connection.executescript(SCHEMA)
+            for indicator, frame, value_column in frames:
+                connection.executemany(
+                    f"INSERT INTO observations ({', '.join(OBSERVATION_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(OBSERVATION_COLUMNS))})",
+                    _observation_rows(indicator, frame, value_column),
+                )
+            connection.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", [
+                ('dataset_version', dataset_version),
+                ('built_at', str(time.time())),
+            ])
+            # Statistics let the planner skip-scan the (year, region) index for region-only filters
+            connection.execute("ANALYZE")
+            connection.commit()
+        finally:
+            connection.close()
+    return SqlStore(path)
+
+
+def open_sql_store(dataset_version, path=SQL_STORE_FILE):
+    """
+    Open the SQLite store if it was built from the given dataset version.
+
+    Args:
+        dataset_version: Version of the dataset being served
+        path: Database file written by build_sql_store
+
+    Returns:
+        SqlStore: The opened store
+        None: If there is no database or it belongs to a different dataset version
+    """
+    if dataset_version is None or not os.path.exists(path):
+        return None
+    store = SqlStore(path)
+    try:
+        if store.dataset_version() != dataset_version:
+            return None
+    except sqlite3.DatabaseError:
+        return None
+    return store
+
+
+class SqlStore:
+    """
+    Read-only, indexed SQLite copy of the dataset for filter queries.
+
+    Region, year and country filters are answered from the (country_code, year) and
+    (year, region) indexes instead of scanning a DataFrame. Instances are shared by every
+    session in a process; each thread gets its own read-only connection.
+    """
+
+    def __init__(self, path=SQL_STORE_FILE):
+        self.path = path
+        self._uri = Path(path).resolve().as_uri() + '?mode=ro'
+        self._local = threading.local()
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self._uri, uri=True)
+            self._local.connection = connection
+        return connection
+
+    def dataset_version(self):
+        """Return the dataset version the database was built from."""
+        row = self._connection().execute("SELECT value FROM meta WHERE key = 'dataset_version'").fetchone()
+        return row[0] if row else None
+
+    def indicators(self):
+        """Return the indicator codes stored in the database."""
+        rows = self._connection().execute("SELECT DISTINCT indicator FROM observations ORDER BY indicator")
+        return [indicator for (indicator,) in rows]
+
+    def query(self, regions=None, year_from=None, year_to=None, country_codes=None,
+              indicator=INFLATION_INDICATOR):
+        """
+        Select the observations matching a set of filters.
+
+        Args:
+            regions: Country table regions to keep (None keeps every country, including
+                those without a region)
+            year_from: First year to keep
+            year_to: Last year to keep
+            country_codes: ISO3 codes to keep
+            indicator: Indicator to read
+
+        Returns:
+            pd.DataFrame: Matching rows in the order they were stored, with the cache
+                columns and dtypes (the value column is named 'inflation' for the
+                inflation indicator and 'value' otherwise)
+        """
+        clauses = ["indicator = ?"]
+        params = [indicator]
+        if regions is not None:
+            clauses.append(f"region IN ({', '.join('?' * len(regions))})")
+            params += list(regions)
+        if country_codes is not None:
+            clauses.append(f"country_code IN ({', '.join('?' * len(country_codes))})")
+            params += list(country_codes)
+        if year_from is not None:
+            clauses.append("year >= ?")
+            params.append(int(year_from))
+        if year_to is not None:
+            clauses.append("year <= ?")
+            params.append(int(year_to))
+
+        value_column = 'inflation' if indicator == INFLATION_INDICATOR else 'value'
+        rows = self._connection().execute(
+            f"SELECT country, country_code, year, value, wb_region, income_group FROM observations "
+            f"WHERE {' AND '.join(clauses)} ORDER BY rowid",
+            params,
+        ).fetchall()
+        df = pd.DataFrame.from_records(
+            rows, columns=['country', 'country_code', 'year', value_column, 'wb_region', 'income_group']
+        )
+        return coerce_cache_dtypes(df, value_column)
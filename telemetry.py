@@ -0,0 +1,138 @@
+import logging
+import threading
+import time
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PAGE_FIELDS = ['query', 'page', 'latency', 'bytes', 'decode_seconds', 'parse_seconds', 'retries', 'records']
+
+_last_run = None
+_last_run_lock = threading.Lock()
+
+
+class IngestionTelemetry:
+    """
+    Per-request timings collected during one ingestion run.
+
+    Every API page becomes one record: request latency (including the response body,
+    excluding retry backoff), payload bytes, JSON decode time, parse time, retries and
+    the number of records it added. Records are logged as they arrive, so a run can be
+    followed as a log stream, and summarised once it finishes. Pages may be recorded
+    from several fetch threads at once.
+    """
+
+    def __init__(self, name='refresh'):
+        self.name = name
+        self.started_at = time.time()
+        self.elapsed = None
+        self.pages = []
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def record_page(self, query, page, stats, parse_seconds=0.0, records=0):
+        """
+        Record one fetched page.
+
+        Args:
+            query: Short label for the paginated query (e.g. 'FP.CPI.TOTL.ZG 2010-2019')
+            page: 1-based page number
+            stats: Request stats filled in by the client's get_json (latency, bytes,
+                decode_seconds, retries)
+            parse_seconds: Time spent turning the page into rows
+            records: Number of rows the page added
+        """
+        record = {
+            'query': query,
+            'page': page,
+            'latency': stats.get('latency', 0.0),
+            'bytes': stats.get('bytes', 0),
+            'decode_seconds': stats.get('decode_seconds', 0.0),
+            'parse_seconds': parse_seconds,
+            'retries': stats.get('retries', 0),
+            'records': records,
+        }
+        with self._lock:
+            self.pages.append(record)
+        logger.info(
+            "%s page %d: latency=%.3fs bytes=%d decode=%.3fs parse=%.3fs retries=%d records=%d",
+            query, page, record['latency'], record['bytes'], record['decode_seconds'],
+            parse_seconds, record['retries'], records,
+            extra={'telemetry': record},
+        )
+
+    def finish(self):
+        """
+        Stop the run clock, log the summary and publish it as the process's last run.
+
+        Returns:
+            dict: The run summary (see summary())
+        """
+        global _last_run
+        self.elapsed = time.perf_counter() - self._start
+        summary = self.summary()
+        logger.info(
+            "%s finished in %.2fs: %d requests, %d bytes, %d retries, %d records "
+            "(request %.2fs, parse %.2fs, p95 latency %.3fs)",
+            self.name, summary['elapsed'], summary['requests'], summary['bytes'], summary['retries'],
+            summary['records'], summary['request_seconds'], summary['parse_seconds'],
+            summary['latency_p95'],
+            extra={'telemetry': summary},
+        )
+        with _last_run_lock:
+            _last_run = self
+        return summary
+
+    def pages_frame(self):
+        """
+        Return the page records in request order.
+
+        Returns:
+            pd.DataFrame: One row per page with the PAGE_FIELDS columns
+        """
+        with self._lock:
+            pages = list(self.pages)
+        frame = pd.DataFrame(pages, columns=PAGE_FIELDS)
+        return frame.sort_values(['query', 'page'], kind='stable').reset_index(drop=True)
+
+    def summary(self):
+        """
+        Summarise the run.
+
+        Returns:
+            dict: name, started_at, elapsed (wall seconds, None while running), requests,
+                bytes, retries, records, request_seconds and parse_seconds (summed over
+                pages, so they can exceed elapsed when pages are fetched in parallel),
+                latency_p50/p95/max and the slowest page's record
+        """
+        pages = self.pages_frame()
+        latency = pages['latency'].astype('float64')
+        slowest = pages.loc[latency.idxmax()].to_dict() if len(pages) else None
+        return {
+            'name': self.name,
+            'started_at': self.started_at,
+            'elapsed': self.elapsed,
+            'requests': len(pages),
+            'bytes': int(pages['bytes'].sum()),
+            'retries': int(pages['retries'].sum()),
+            'records': int(pages['records'].sum()),
+            'request_seconds': float(latency.sum()),
+            'parse_seconds': float((pages['decode_seconds'] + pages['parse_seconds']).sum()),
+            'latency_p50': float(latency.quantile(0.5)) if len(pages) else 0.0,
+            'latency_p95': float(latency.quantile(0.95)) if len(pages) else 0.0,
+            'latency_max': float(latency.max()) if len(pages) else 0.0,
+            'slowest_page': slowest,
+        }
+
+
+def last_telemetry():
+    """
+    Return the telemetry of the most recent finished ingestion run in this process.
+
+    Returns:
+        IngestionTelemetry: The last run
+        None: If nothing has been fetched since the process started
+    """
+    with _last_run_lock:
+        return _last_run
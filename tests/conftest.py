@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# The app modules are flat top-level files; the World Bank stand-in lives with the benchmarks
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / 'benchmarks'))
@@ -0,0 +1,44 @@
+import time
+
+import pytest
+
+from api_client import WorldBankClient, DeadlineExceeded
+from fake_worldbank import FakeWorldBankServer, synthetic_records
+from ingestion import fetch_api_pages
+
+
+def fetch_all(server, client, deadline_seconds=60):
+    url = f"{server.base_url}/country/all/indicator/FP.CPI.TOTL.ZG"
+    params = {'format': 'json', 'date': '2010:2024', 'per_page': 200}
+    return list(fetch_api_pages(url, params, client=client, deadline_seconds=deadline_seconds))
+
+
+@pytest.fixture(scope='module')
+def records():
+    return synthetic_records(n_countries=40)
+
+
+@pytest.mark.parametrize('fail_status', [503, 429])
+def test_flaky_server_returns_same_pages_as_healthy_server(records, fail_status):
+    with FakeWorldBankServer(records) as healthy:
+        expected = fetch_all(healthy, WorldBankClient(backoff_factor=0.01))
+
+    with FakeWorldBankServer(records, fail_every=3, fail_status=fail_status) as flaky:
+        client = WorldBankClient(backoff_factor=0.01)
+        pages = fetch_all(flaky, client)
+        failures = flaky.failure_count
+
+    assert len(expected) > 1
+    assert pages == expected
+    assert failures > 0
+    assert client.retry_count >= failures
+
+
+def test_always_failing_server_stops_at_deadline(records):
+    with FakeWorldBankServer(records, fail_every=1) as broken:
+        start = time.perf_counter()
+        with pytest.raises(DeadlineExceeded):
+            fetch_all(broken, WorldBankClient(max_retries=100, backoff_factor=0.1), deadline_seconds=1.0)
+        elapsed = time.perf_counter() - start
+
+    assert elapsed < 5.0
@@ -0,0 +1,78 @@
+import os
+import stat
+import threading
+
+import pandas as pd
+
+from data_cache import FILE_MODE, atomic_write, cache_lock, load_cache, read_manifest
+
+
+def write_legacy_csv(path):
+    pd.DataFrame({
+        'country': ['Germany', 'Germany', 'France'],
+        'country_code': ['DEU', 'DEU', 'FRA'],
+        'year': [2024, 2023, 2024],
+        'inflation': [2.3, 5.9, 2.0],
+    }).to_csv(path, index=False)
+
+
+def test_cache_lock_is_reentrant_within_a_thread(tmp_path):
+    lock_file = str(tmp_path / 'cache.lock')
+    with cache_lock(lock_file, timeout=1):
+        with cache_lock(lock_file, timeout=1):
+            pass
+
+
+def test_cache_lock_excludes_other_threads(tmp_path):
+    lock_file = str(tmp_path / 'cache.lock')
+    acquired = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with cache_lock(lock_file):
+            acquired.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    acquired.wait(5)
+    try:
+        try:
+            with cache_lock(lock_file, timeout=0.3):
+                raise AssertionError("Lock acquired while another thread held it")
+        except TimeoutError:
+            pass
+    finally:
+        release.set()
+        holder.join()
+
+
+def test_csv_migration_while_holding_the_lock(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    write_legacy_csv('inflation_data_cache.csv')
+
+    with cache_lock(timeout=1):
+        df = load_cache()
+
+    assert len(df) == 3
+    assert os.path.exists('inflation_data_cache.parquet')
+
+
+def test_csv_migration_keeps_the_csv_age(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    write_legacy_csv('inflation_data_cache.csv')
+    written_at = os.path.getmtime('inflation_data_cache.csv') - 3 * 365 * 86400
+    os.utime('inflation_data_cache.csv', (written_at, written_at))
+
+    load_cache()
+
+    manifest = read_manifest()
+    assert manifest['fetched_at'] == manifest['checked_at'] == written_at
+
+
+def test_atomic_write_uses_umask_permissions(tmp_path):
+    path = tmp_path / 'out.txt'
+    with atomic_write(str(path)) as tmp:
+        with open(tmp, 'w') as f:
+            f.write('data')
+    assert stat.S_IMODE(os.stat(path).st_mode) == FILE_MODE
@@ -0,0 +1,111 @@
+import threading
+import time
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import ingestion
+from api_client import WorldBankClient
+from fake_worldbank import FakeWorldBankServer, synthetic_records
+
+
+@pytest.fixture
+def fake_api(monkeypatch, tmp_path):
+    """Serve synthetic data from a local API stand-in, with every cache file in a fresh directory."""
+    monkeypatch.chdir(tmp_path)
+    with FakeWorldBankServer(synthetic_records(n_countries=40, start_year=1960)) as server:
+        monkeypatch.setattr(ingestion, 'WORLD_BANK_API_URL', server.base_url)
+        # The pooled client is shared by the process; use one that retries quickly
+        monkeypatch.setattr(ingestion, 'get_client', lambda: WorldBankClient(backoff_factor=0.01))
+        yield server
+
+
+def test_multi_chunk_progress_is_reported_on_calling_thread(fake_api):
+    calls = []
+
+    def on_page(pages_done, total_pages):
+        calls.append((threading.current_thread(), pages_done, total_pages))
+
+    df = ingestion.download_year_windows(
+        'FP.CPI.TOTL.ZG', [(2010, 2024)], on_page=on_page, value_column='inflation', chunk_years=5
+    )
+
+    assert df is not None and set(df['year']) == set(range(2010, 2025))
+    assert calls
+    assert all(thread is threading.current_thread() for thread, _, _ in calls)
+    pages_done = [done for _, done, _ in calls]
+    assert pages_done == sorted(pages_done)
+    assert calls[-1][1] == calls[-1][2]
+
+
+def _cold_start_app():
+    import streamlit as st
+    import util
+
+    df = util.fetch_inflation_data()
+    st.write(f"rows: {0 if df is None else len(df)}")
+
+
+def test_streamlit_cold_start_downloads_several_chunks(fake_api):
+    # The default 2010-2024 range spans two chunks, fetched on worker threads
+    at = AppTest.from_function(_cold_start_app, default_timeout=60)
+    import util
+    util.fetch_inflation_data.clear()
+    at.run()
+
+    assert not at.exception
+    assert not at.error, [error.value for error in at.error]
+    assert at.markdown[-1].value == f"rows: {40 * 15}"
+    assert fake_api.request_count > 2
+
+
+def test_indicator_cache_is_extended_to_requested_years(fake_api):
+    indicator = 'NY.GDP.DEFL.KD.ZG'
+    sources = []
+
+    def on_indicator(code, source):
+        sources.append(source)
+
+    df = ingestion.fetch_indicators([indicator], 2010, 2024, on_indicator=on_indicator)
+    assert (df['year'].min(), df['year'].max(), len(df)) == (2010, 2024, 40 * 15)
+
+    requests_before = fake_api.request_count
+    df = ingestion.fetch_indicators([indicator], 2000, 2024, on_indicator=on_indicator)
+    assert (df['year'].min(), df['year'].max(), len(df)) == (2000, 2024, 40 * 25)
+    assert fake_api.request_count > requests_before
+
+    # The extended range is recorded, so a narrower request is served from the cache
+    requests_before = fake_api.request_count
+    df = ingestion.fetch_indicators([indicator], 2005, 2024, on_indicator=on_indicator)
+    assert len(df) == 40 * 25
+    assert fake_api.request_count == requests_before
+    assert sources == ['api', 'api', 'cache']
+
+
+def test_full_refresh_keeps_extended_history(fake_api):
+    import loader
+    from data_cache import read_manifest
+
+    df = loader.load_inflation_data(start_year=1960, end_year=2024)
+    assert len(df) == 40 * 65
+
+    df = loader.load_inflation_data(force_refresh=True, full_refresh=True)
+    assert len(df) == 40 * 65
+    assert read_manifest()['date_range'] == [1960, 2024]
+
+
+def test_background_full_refresh_keeps_extended_history(fake_api):
+    import loader
+    from live_dataset import LiveDataset
+
+    loader.load_inflation_data(start_year=1960, end_year=2024)
+    live = LiveDataset()
+    live.load_from_cache()
+    live.refresh_async(full=True)
+    deadline = time.monotonic() + 30
+    while live.refreshing and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert live.last_error is None
+    df, _ = live.snapshot()
+    assert len(df) == 40 * 65
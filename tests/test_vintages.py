@@ -0,0 +1,47 @@
+import pandas as pd
+
+from data_cache import coerce_cache_dtypes
+from vintages import VintageStore, apply_diff, diff_frames, _canonical
+
+
+def make_dataset(rows):
+    return coerce_cache_dtypes(pd.DataFrame(
+        rows, columns=['country', 'country_code', 'year', 'inflation', 'wb_region', 'income_group']
+    ))
+
+
+OLD = make_dataset([
+    ('A', 'AAA', 2023, 1.0, 'Europe & Central Asia', 'High income'),
+    ('A', 'AAA', 2024, 2.0, 'Europe & Central Asia', 'High income'),
+    ('B', 'BBB', 2023, 3.0, 'South Asia', 'Low income'),
+    ('B', 'BBB', 2024, 4.0, 'South Asia', 'Low income'),
+])
+
+# C is new, so the country categories differ; one B row is removed and one A row revised
+NEW = make_dataset([
+    ('A', 'AAA', 2023, 1.0, 'Europe & Central Asia', 'High income'),
+    ('A', 'AAA', 2024, 2.5, 'Europe & Central Asia', 'High income'),
+    ('B', 'BBB', 2023, 3.0, 'South Asia', 'Low income'),
+    ('C', 'CCC', 2024, 5.0, 'Sub-Saharan Africa', 'Low income'),
+])
+
+
+def test_diff_with_removed_row_and_new_country_categories():
+    diff = diff_frames(OLD, NEW)
+
+    changes = {(code, year): change for code, year, change
+               in zip(diff['country_code'].astype('object'), diff['year'], diff['change'])}
+    assert changes == {('AAA', 2024): 'revised', ('BBB', 2024): 'removed', ('CCC', 2024): 'added'}
+    removed = diff[diff['change'] == 'removed']
+    assert removed['country'].astype('object').tolist() == ['B']
+    assert isinstance(diff['country'].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(apply_diff(_canonical(OLD), diff), _canonical(NEW), check_categorical=False)
+
+
+def test_record_and_load_across_changed_countries(tmp_path):
+    store = VintageStore(str(tmp_path / 'vintages'), snapshot_interval=10)
+    store.record(OLD, '2025-01-01', (2023, 2024))
+    entry = store.record(NEW, '2025-02-01', (2023, 2024))
+
+    assert (entry['kind'], entry['added'], entry['revised'], entry['removed']) == ('diff', 1, 1, 1)
+    pd.testing.assert_frame_equal(store.load(entry['id']), _canonical(NEW), check_categorical=False)
@@ -1,7 +1,16 @@
 import streamlit as st
-import pandas as pd
 import requests
 import traceback
+from datetime import datetime
+
+from analytics import prepare_map_frames
+from artifacts import load_artifacts
+from data_cache import load_cube
+from datastore import DataStore
+from sql_store import open_sql_store, build_sql_store
+from ingestion import fetch_indicators
+from live_dataset import LiveDataset
+from loader import load_inflation_data
 
 
 def apply_presentation_mode_css():
@@ -38,117 +47,237 @@ def apply_presentation_mode_css():
 
 
 @st.cache_data(ttl=3600)
-def fetch_inflation_data(force_refresh=False):
+def fetch_indicator_data(indicators):
     """
-    Fetch inflation data from World Bank API with local CSV caching.
-    
-    Historical data (2010-2023) is cached locally and only fetched once.
-    Current year (2024) can be updated by forcing a refresh.
-    
+    Load several inflation measures through the multi-indicator ingestion engine.
+
     Args:
-        force_refresh: If True, forces re-download from API even if CSV exists
-        
+        indicators: Tuple of World Bank indicator codes
+
     Returns:
-        pd.DataFrame: DataFrame containing country, country_code, year, and inflation columns
-        None: If data fetch fails or no data is available
+        pd.DataFrame: Long table with country, country_code, indicator, year and value columns
+        None: If the data could not be fetched
     """
-    import os
-    
-    # Define cache file path
-    cache_file = "inflation_data_cache.csv"
-    
-    # Check if cached data exists and force_refresh is False
-    if os.path.exists(cache_file) and not force_refresh:
-        try:
-            st.info("Loading data from local cache...")
-            df = pd.read_csv(cache_file)
-            
-            # Display cache info
-            unique_countries = df['country'].nunique()
-            total_records = len(df)
-            year_range = f"{df['year'].min()}-{df['year'].max()}"
-            
-            st.success(
-                f"Data loaded from cache: {total_records:,} records across "
-                f"{unique_countries} countries ({year_range})"
-            )
-            
-            return df
-            
-        except Exception as e:
-            st.warning(f"Failed to load cached data: {str(e)}. Fetching from API...")
-            # Continue to API fetch below
-    
-    # Fetch from API
     try:
-        url = "https://api.worldbank.org/v2/country/all/indicator/FP.CPI.TOTL.ZG"
-        all_records = []
-        page = 1
-        per_page = 1000
+        return fetch_indicators(list(indicators))
+    except requests.exceptions.RequestException as e:
+        st.error(f"Network error while fetching indicator data: {str(e)}")
+        return None
+
 
-        status_placeholder = st.empty()
+def format_age(seconds):
+    """
+    Format a data age in seconds as a short human-readable string.
 
-        while True:
-            params = {
-                'format': 'json',
-                'date': '2010:2024',
-                'per_page': per_page,
-                'page': page
-            }
+    Args:
+        seconds: Age in seconds
 
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+    Returns:
+        str: e.g. "45 s", "12 min", "3 h 5 min" or "2 days"
+    """
+    seconds = max(0, int(seconds))
+    if seconds < 60:
+        return f"{seconds} s"
+    if seconds < 3600:
+        return f"{seconds // 60} min"
+    if seconds < 86400:
+        return f"{seconds // 3600} h {seconds % 3600 // 60} min"
+    return f"{seconds // 86400} days"
 
-            if len(data) < 2 or not data[1]:
-                break
 
-            for item in data[1]:
-                if item['value'] is not None:
-                    all_records.append({
-                        'country': item['country']['value'],
-                        'country_code': item['countryiso3code'],
-                        'year': int(item['date']),
-                        'inflation': float(item['value'])
-                    })
+def show_telemetry_panel(telemetry):
+    """
+    Render the admin/debug panel with the timings of the last ingestion run.
 
-            metadata = data[0]
-            total_pages = metadata.get('pages', 1)
-            current_page = metadata.get('page', 1)
+    Args:
+        telemetry: IngestionTelemetry from telemetry.last_telemetry(), or None
+    """
+    with st.expander("**Ingestion Telemetry** (admin)", expanded=False):
+        if telemetry is None:
+            st.caption("No API fetch has run in this process yet.")
+            return
 
-            status_placeholder.info(f"Fetching from API: Page {current_page} of {total_pages}")
+        summary = telemetry.summary()
+        started = datetime.fromtimestamp(summary['started_at']).strftime('%Y-%m-%d %H:%M:%S')
+        st.caption(f"Last run: {summary['name']} started {started}")
 
-            if page >= total_pages:
-                break
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Elapsed", f"{summary['elapsed']:.2f} s" if summary['elapsed'] is not None else "running")
+        col2.metric("Requests", f"{summary['requests']:,}")
+        col3.metric("Retries", f"{summary['retries']:,}")
+        col4.metric("Records", f"{summary['records']:,}")
+        st.caption(
+            f"{summary['bytes'] / 1024:,.0f} KB received · request time {summary['request_seconds']:.2f} s · "
+            f"decode + parse {summary['parse_seconds']:.2f} s · latency p50 {summary['latency_p50']:.3f} s, "
+            f"p95 {summary['latency_p95']:.3f} s, max {summary['latency_max']:.3f} s"
+        )
+        st.dataframe(
+            telemetry.pages_frame(),
+            column_config={
+                'query': 'Query',
+                'page': 'Page',
+                'latency': st.column_config.NumberColumn('Latency (s)', format="%.3f"),
+                'bytes': st.column_config.NumberColumn('Bytes', format="%d"),
+                'decode_seconds': st.column_config.NumberColumn('Decode (s)', format="%.3f"),
+                'parse_seconds': st.column_config.NumberColumn('Parse (s)', format="%.3f"),
+                'retries': 'Retries',
+                'records': 'Records',
+            },
+            hide_index=True,
+            width='stretch'
+        )
 
-            page += 1
 
-        status_placeholder.empty()
+@st.cache_resource
+def get_live_dataset():
+    """
+    Return the process-wide LiveDataset, primed from the local cache on first use.
+
+    Returns:
+        LiveDataset: Dataset holder shared by every session in this process
+    """
+    live = LiveDataset()
+    try:
+        live.load_from_cache()
+    except Exception as e:
+        st.warning(f"Failed to load cached data: {str(e)}")
+    return live
+
+
+@st.cache_resource
+def load_inflation_cube(cache_version):
+    """
+    Memory-map the dense country x year inflation cube once per process.
+
+    Args:
+        cache_version: Value from data_cache.cache_version(); a new value reloads the cube
+
+    Returns:
+        InflationCube: Read-only cube shared by every session in this process
+        None: If no cache exists yet
+    """
+    try:
+        return load_cube()
+    except Exception as e:
+        st.warning(f"Could not load inflation cube: {str(e)}")
+        return None
+
+
+@st.cache_resource
+def load_precomputed_artifacts(dataset_version):
+    """
+    Load the analytics prebuilt by warmup.py once per process.
+
+    Args:
+        dataset_version: Value from data_cache.dataset_version(); artifacts built from
+            another version of the data are ignored
+
+    Returns:
+        Artifacts: Precomputed map frames, clusters and similarity matrix
+        None: If no matching artifacts exist
+    """
+    try:
+        return load_artifacts(dataset_version)
+    except Exception as e:
+        st.warning(f"Could not load precomputed artifacts: {str(e)}")
+        return None
 
-        if not all_records:
-            st.error("No data received from World Bank API")
-            return None
-
-        df = pd.DataFrame(all_records)
-        
-        # Save to CSV cache
-        try:
-            df.to_csv(cache_file, index=False)
-            st.success(f"Data cached locally to {cache_file}")
-        except Exception as e:
-            st.warning(f"Could not save cache file: {str(e)}")
-        
-        # Display success info
-        unique_countries = df['country'].nunique()
-        total_records = len(df)
-        year_range = f"{df['year'].min()}-{df['year'].max()}"
-        
-        st.success(
-            f"Data fetched from API: {total_records:,} records across "
-            f"{unique_countries} countries ({year_range})"
-        )
-        
-        return df
+
+@st.cache_resource(max_entries=2)
+def load_data_store(dataset_version, fetched_at, _inflation_df):
+    """
+    Index the served dataset once and share the DataStore with every session.
+
+    Args:
+        dataset_version: Value from data_cache.dataset_version()
+        fetched_at: When the served dataset was fetched; together with dataset_version it
+            identifies the DataFrame, which is not hashed
+        _inflation_df: The served inflation DataFrame
+
+    Returns:
+        DataStore: Dataset sorted by (country, year) with country and year row offsets
+    """
+    return DataStore(_inflation_df)
+
+
+@st.cache_resource(max_entries=16)
+def load_map_frames(dataset_version, fetched_at, regions, _inflation_df, _store, _years):
+    """
+    Prepare the map data for every year once per dataset and region filter.
+
+    Without a region filter the frames prebuilt by warmup.py are used when they match
+    the dataset. The frames are shared by every session, so moving the year slider is a
+    dictionary lookup; callers must copy a frame before modifying it.
+
+    Args:
+        dataset_version: Value from data_cache.dataset_version()
+        fetched_at: When the served dataset was fetched (see load_data_store)
+        regions: Sorted tuple of the selected regions (empty for no filter); together with
+            the dataset identifies _inflation_df and _store, which are not hashed
+        _inflation_df: The served inflation DataFrame, filtered to the regions
+        _store: DataStore (or selection) for the same rows
+        _years: Every year the slider offers
+
+    Returns:
+        dict: Year -> prepared map data (see analytics.prepare_map_frames)
+    """
+    if not regions:
+        artifacts = load_precomputed_artifacts(dataset_version)
+        if artifacts and all(int(year) in artifacts.map_frames for year in _years):
+            return artifacts.map_frames
+    return prepare_map_frames(_inflation_df, store=_store, years=_years)
+
+
+@st.cache_resource(max_entries=2)
+def load_sql_store(dataset_version, _inflation_df):
+    """
+    Open the SQLite store for the served dataset once per process, building it if needed.
+
+    Args:
+        dataset_version: Value from data_cache.dataset_version(); a store built from
+            another version is rebuilt from _inflation_df
+        _inflation_df: The served inflation DataFrame (not hashed)
+
+    Returns:
+        SqlStore: Indexed store shared by every session in this process
+        None: If the dataset has no version or the store could not be built
+    """
+    if dataset_version is None:
+        return None
+    try:
+        return open_sql_store(dataset_version) or build_sql_store(_inflation_df, dataset_version)
+    except Exception as e:
+        st.warning(f"Could not open the SQL store: {str(e)}")
+        return None
+
+
+@st.cache_resource(ttl=3600)
+def fetch_inflation_data(force_refresh=False, full_refresh=False):
+    """
+    Streamlit wrapper around loader.load_inflation_data that shows its progress.
+
+    The result is cached as a resource, so every session shares one read-only DataFrame
+    instead of receiving its own copy on each rerun; callers must not modify it.
+
+    Args:
+        force_refresh: If True, refreshes the cache from the API even if it exists
+        full_refresh: If True, ignores the cache and re-downloads the full date range
+
+    Returns:
+        pd.DataFrame: DataFrame containing country, country_code, year, and inflation columns
+        None: If data fetch fails or no data is available
+    """
+    status_placeholder = st.empty()
+
+    def show_status(level, message):
+        getattr(st, level)(message)
+
+    def show_progress(pages_done, total_pages):
+        status_placeholder.info(f"Fetching from API: Page {pages_done} of {total_pages}")
+
+    try:
+        return load_inflation_data(force_refresh, full_refresh,
+                                   on_status=show_status, on_page=show_progress)
 
     except requests.exceptions.RequestException as e:
         st.error(f"Network error while fetching data: {str(e)}")
@@ -158,4 +287,7 @@ def fetch_inflation_data(force_refresh=False):
     except Exception as e:
         st.error(f"Unexpected error occurred: {str(e)}")
         st.error(f"Technical details: {traceback.format_exc()}")
-        return None
\ No newline at end of file
+        return None
+
+    finally:
+        status_placeholder.empty()
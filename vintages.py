@@ -0,0 +1,356 @@
+"""
+Keep every refresh of the inflation cache as a vintage and compare revisions.
+
+The World Bank revises past figures, and a refresh overwrites the cache. Each
+refresh that changes the data is also recorded as a vintage: the first one (and
+every VINTAGE_SNAPSHOT_INTERVAL-th) as a full snapshot, the others as a diff
+holding only the rows added, revised or removed since the previous vintage. A
+vintage is rebuilt from the nearest snapshot plus at most
+VINTAGE_SNAPSHOT_INTERVAL - 1 diffs, and checked against a content hash.
+
+Usage:
+    python vintages.py init                # record the current cache as the first vintage
+    python vintages.py list
+    python vintages.py diff 3 7            # revisions between vintages 3 and 7
+    python vintages.py diff 3              # vintage 3 against the latest one
+    python vintages.py restore 5           # roll the cache back to vintage 5
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from data_cache import (
+    CacheError,
+    atomic_write,
+    cache_lock,
+    coerce_cache_dtypes,
+    load_cache,
+    read_manifest,
+    save_cache,
+)
+from config import VINTAGE_DIR, VINTAGE_SNAPSHOT_INTERVAL
+
+VINTAGE_INDEX = "index.json"
+KEY_COLUMNS = ['country_code', 'year']
+VALUE_COLUMNS = ['country', 'inflation', 'wb_region', 'income_group']
+CHANGES = ['added', 'revised', 'removed']
+
+
+def _canonical(df):
+    """Return the data in the cache's row order and dtypes, with the cache columns only."""
+    columns = ['country', 'country_code', 'year', 'inflation', 'wb_region', 'income_group']
+    df = coerce_cache_dtypes(df[[col for col in columns if col in df.columns]])
+    return df.sort_values(['country', 'year'], ascending=[True, False]).reset_index(drop=True)
+
+
+def _content_hash(df):
+    """Hash a canonical frame's values, independent of category order."""
+    plain = df.astype({col: 'object' for col in df.columns if df[col].dtype == 'category'})
+    return format(int(pd.util.hash_pandas_object(plain, index=False).sum()) & (2 ** 64 - 1), '016x')
+
+
+def _same(a, b):
+    """Element-wise equality that treats two missing values as equal."""
+    a = pd.Series(np.asarray(a, dtype=object))
+    b = pd.Series(np.asarray(b, dtype=object))
+    return ((a == b) | (a.isna() & b.isna())).to_numpy()
+
+
+def diff_frames(old, new):
+    """
+    Find the rows added, revised or removed between two datasets, keyed by (country_code, year).
+
+    Args:
+        old: Previous dataset
+        new: Current dataset
+
+    Returns:
+        pd.DataFrame: One row per changed key with the new values (missing for removed
+            rows) and a 'change' column of 'added', 'revised' or 'removed'
+    """
+    merged = old[KEY_COLUMNS + VALUE_COLUMNS].astype({'country_code': 'object'}).merge(
+        new[KEY_COLUMNS + VALUE_COLUMNS].astype({'country_code': 'object'}),
+        on=KEY_COLUMNS, how='outer', suffixes=('_old', '_new'), indicator=True,
+    )
+    unchanged = np.ones(len(merged), dtype=bool)
+    for column in VALUE_COLUMNS:
+        unchanged &= _same(merged[f'{column}_old'], merged[f'{column}_new'])
+
+    change = np.select(
+        [merged['_merge'] == 'right_only', merged['_merge'] == 'left_only', ~unchanged],
+        ['added', 'removed', 'revised'],
+        default='',
+    )
+    changed = merged[change != ''].rename(columns={f'{column}_new': column for column in VALUE_COLUMNS})
+    diff = changed[KEY_COLUMNS + VALUE_COLUMNS].copy()
+    # Removed rows keep their country name so the diff stays readable. The old and new
+    # country categories differ when a country was added or dropped, so the names are
+    # assigned as objects; coerce_cache_dtypes makes the column categorical again
+    removed = (change[change != ''] == 'removed')
+    diff['country'] = diff['country'].astype('object')
+    diff.loc[removed, 'country'] = changed.loc[removed, 'country_old'].astype('object')
+    diff['change'] = pd.Categorical(change[change != ''], categories=CHANGES)
+    return coerce_cache_dtypes(diff).reset_index(drop=True)
+
+
+def _upsert(df, diff):
+    """Drop the diff's keys from df and append its added and revised rows (order not restored)."""
+    keys = pd.MultiIndex.from_arrays([df['country_code'].astype('object'), df['year']])
+    diff_keys = pd.MultiIndex.from_arrays([diff['country_code'].astype('object'), diff['year']])
+    upserts = diff[diff['change'] != 'removed'].drop(columns='change')
+    return pd.concat([df[~keys.isin(diff_keys)], upserts], ignore_index=True)
+
+
+def apply_diff(df, diff):
+    """
+    Apply a diff from diff_frames to the dataset it was computed against.
+
+    Returns:
+        pd.DataFrame: The newer dataset, in canonical order
+    """
+    return _canonical(_upsert(df, diff))
+
+
+class VintageStore:
+    """
+    Vintages of the inflation dataset in a directory: Parquet snapshots and diffs plus
+    a JSON index describing each vintage (id, time, source stamp, counts and hash).
+    """
+
+    def __init__(self, directory=VINTAGE_DIR, snapshot_interval=VINTAGE_SNAPSHOT_INTERVAL):
+        self.directory = directory
+        self.snapshot_interval = snapshot_interval
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def list(self):
+        """
+        Return the recorded vintages, oldest first.
+
+        Returns:
+            list: Index entries (dicts with id, created_at, kind, file, rows, added, revised,
+                removed, source_last_updated, date_range and content_hash)
+        """
+        path = self._path(VINTAGE_INDEX)
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)['vintages']
+
+    def latest_id(self):
+        """Return the id of the newest vintage, or None if there are none."""
+        vintages = self.list()
+        return vintages[-1]['id'] if vintages else None
+
+    def _entry(self, vintage_id):
+        for entry in self.list():
+            if entry['id'] == vintage_id:
+                return entry
+        raise KeyError(f"No vintage {vintage_id}")
+
+    def load(self, vintage_id=None):
+        """
+        Rebuild the dataset as it was at one vintage.
+
+        Args:
+            vintage_id: Vintage to load (the latest by default)
+
+        Returns:
+            pd.DataFrame: The dataset, in the cache's row order and dtypes
+
+        Raises:
+            KeyError: If the vintage does not exist
+            CacheError: If the rebuilt data does not match the vintage's content hash
+        """
+        vintages = self.list()
+        if vintage_id is None:
+            if not vintages:
+                raise KeyError("No vintages recorded")
+            vintage_id = vintages[-1]['id']
+        target = self._entry(vintage_id)
+        chain = [entry for entry in vintages if entry['id'] <= vintage_id]
+        start = max(i for i, entry in enumerate(chain) if entry['kind'] == 'snapshot')
+
+        df = pd.read_parquet(self._path(chain[start]['file']))
+        for entry in chain[start + 1:]:
+            df = _upsert(df, pd.read_parquet(self._path(entry['file'])))
+        df = _canonical(df)
+        if _content_hash(df) != target['content_hash']:
+            raise CacheError(f"Vintage {vintage_id} does not match its recorded content hash")
+        return df
+
+    def record(self, df, source_last_updated=None, date_range=None, created_at=None):
+        """
+        Record a dataset as a new vintage if it differs from the latest one.
+
+        Call this while holding the cache lock (e.g. inside data_cache.single_flight), as
+        the refresh paths do, so two processes never append at once.
+
+        Args:
+            df: The refreshed dataset
+            source_last_updated: The API's 'lastupdated' stamp for the data
+            date_range: (first_year, last_year) the data covers
+            created_at: Unix timestamp of the vintage (defaults to now)
+
+        Returns:
+            dict: The new index entry
+            None: If the data is identical to the latest vintage
+        """
+        df = _canonical(df)
+        content_hash = _content_hash(df)
+        vintages = self.list()
+        if vintages and vintages[-1]['content_hash'] == content_hash:
+            return None
+
+        vintage_id = vintages[-1]['id'] + 1 if vintages else 1
+        since_snapshot = next(
+            (len(vintages) - i for i in range(len(vintages) - 1, -1, -1) if vintages[i]['kind'] == 'snapshot'),
+            None,
+        )
+        if since_snapshot is None or since_snapshot >= self.snapshot_interval:
+            kind, stored = 'snapshot', df
+            counts = {'added': len(df), 'revised': 0, 'removed': 0}
+        else:
+            kind, stored = 'diff', diff_frames(self.load(vintages[-1]['id']), df)
+            counts = {change: int((stored['change'] == change).sum()) for change in CHANGES}
+
+        os.makedirs(self.directory, exist_ok=True)
+        file_name = f"vintage_{vintage_id:04d}_{kind}.parquet"
+        with atomic_write(self._path(file_name)) as tmp_path:
+            stored.to_parquet(tmp_path, index=False)
+
+        entry = {
+            'id': vintage_id,
+            'created_at': created_at if created_at is not None else time.time(),
+            'kind': kind,
+            'file': file_name,
+            'rows': len(df),
+            **counts,
+            'source_last_updated': source_last_updated,
+            'date_range': None if date_range is None else [None if year is None else int(year) for year in date_range],
+            'content_hash': content_hash,
+        }
+        with atomic_write(self._path(VINTAGE_INDEX)) as tmp_path:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'vintages': vintages + [entry]}, f, indent=2)
+        return entry
+
+    def compare(self, old_id, new_id=None):
+        """
+        List the revisions between two vintages.
+
+        Args:
+            old_id: Earlier vintage
+            new_id: Later vintage (the latest by default)
+
+        Returns:
+            pd.DataFrame: One row per (country_code, year) whose inflation value differs,
+                with country, inflation_old, inflation_new, revision (new - old) and
+                change ('added', 'revised' or 'removed'), sorted by the size of the revision
+        """
+        old = self.load(old_id)
+        new = self.load(new_id)
+        merged = old[['country', 'country_code', 'year', 'inflation']].astype({'country_code': 'object'}).merge(
+            new[['country', 'country_code', 'year', 'inflation']].astype({'country_code': 'object'}),
+            on=['country_code', 'year'], how='outer', suffixes=('_old', '_new'), indicator=True,
+        )
+        merged = merged[~_same(merged['inflation_old'], merged['inflation_new'])]
+        revisions = pd.DataFrame({
+            'country': merged['country_new'].astype('object').fillna(merged['country_old'].astype('object')),
+            'country_code': merged['country_code'],
+            'year': merged['year'],
+            'inflation_old': merged['inflation_old'],
+            'inflation_new': merged['inflation_new'],
+            'revision': merged['inflation_new'] - merged['inflation_old'],
+            'change': pd.Categorical(
+                np.select([merged['_merge'] == 'right_only', merged['_merge'] == 'left_only'],
+                          ['added', 'removed'], default='revised'),
+                categories=CHANGES,
+            ),
+        })
+        order = revisions['revision'].abs().sort_values(ascending=False, na_position='last').index
+        return coerce_cache_dtypes(revisions.loc[order], 'inflation_new').reset_index(drop=True)
+
+
+def record_vintage(df, source_last_updated=None, date_range=None):
+    """Record a refreshed dataset in the default vintage store (see VintageStore.record)."""
+    return VintageStore().record(df, source_last_updated, date_range)
+
+
+def restore_vintage(vintage_id, store=None):
+    """
+    Roll the cache back to a vintage.
+
+    The restored data is written to the cache and recorded as a new vintage, so the
+    rollback itself stays in the history. Running apps pick it up on their next reload
+    of the cache; the next refresh sees the restored 'lastupdated' stamp and fetches again.
+
+    Args:
+        vintage_id: Vintage to restore
+        store: VintageStore to read from (the default directory if None)
+
+    Returns:
+        pd.DataFrame: The restored dataset
+    """
+    store = store or VintageStore()
+    entry = store._entry(vintage_id)
+    df = store.load(vintage_id)
+    with cache_lock():
+        save_cache(df, date_range=entry['date_range'], source_last_updated=entry['source_last_updated'])
+        store.record(df, entry['source_last_updated'], entry['date_range'])
+    return df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('list', help="List the recorded vintages")
+    diff = commands.add_parser('diff', help="Show the revisions between two vintages")
+    diff.add_argument('old', type=int, help="Earlier vintage id")
+    diff.add_argument('new', type=int, nargs='?', help="Later vintage id (default: latest)")
+    diff.add_argument('--limit', type=int, default=20, help="Rows to print (largest revisions first)")
+    restore = commands.add_parser('restore', help="Roll the cache back to a vintage")
+    restore.add_argument('id', type=int, help="Vintage id")
+    commands.add_parser('init', help="Record the current cache as a vintage")
+    args = parser.parse_args(argv)
+
+    store = VintageStore()
+    try:
+        if args.command == 'list':
+            for entry in store.list():
+                created = datetime.fromtimestamp(entry['created_at']).strftime('%Y-%m-%d %H:%M')
+                print(f"{entry['id']:>4}  {created}  {entry['kind']:<8} {entry['rows']:>7,} rows  "
+                      f"+{entry['added']} ~{entry['revised']} -{entry['removed']}  "
+                      f"source {entry['source_last_updated'] or 'unknown'}")
+        elif args.command == 'diff':
+            revisions = store.compare(args.old, args.new)
+            print(f"{len(revisions):,} changed values")
+            if len(revisions):
+                print(revisions.head(args.limit).to_string(index=False))
+        elif args.command == 'restore':
+            df = restore_vintage(args.id, store)
+            print(f"Restored vintage {args.id}: {len(df):,} records")
+        elif args.command == 'init':
+            with cache_lock():
+                df = load_cache()
+                if df is None:
+                    print("No cache to record", file=sys.stderr)
+                    return 1
+                manifest = read_manifest() or {}
+                entry = store.record(df, manifest.get('source_last_updated'), manifest.get('date_range'))
+            print(f"Recorded vintage {entry['id']}" if entry else "Cache matches the latest vintage")
+    except (KeyError, CacheError) as e:
+        print(f"[error] {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Prebuild the local cache and the dashboard's derived artifacts.
+
+Run this before starting the app (e.g. in a container entrypoint or on a
+schedule) so the first visitor does not pay for the API crawl or analytics:
+per-year map frames, the country clustering and the similarity matrix are
+written to the artifacts directory and loaded by the app at startup.
+
+Usage:
+    python warmup.py                  # use the cache, fetching only if there is none
+    python warmup.py --refresh        # delta refresh from the API first
+    python warmup.py --full-refresh   # re-download the full date range first
+    python warmup.py --start-year 1960  # extend the cache back to 1960 (fetches only the new years)
+    python warmup.py --sql-store      # also build the indexed SQLite store
+"""
+import argparse
+import logging
+import sys
+import time
+
+from artifacts import build_artifacts
+from data_cache import dataset_version
+from loader import load_inflation_data
+from sql_store import build_sql_store
+from config import ARTIFACTS_DIR, DATA_START_YEAR, DATA_END_YEAR, SQL_STORE_ENABLED, SQL_STORE_FILE
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    refresh = parser.add_mutually_exclusive_group()
+    refresh.add_argument('--refresh', action='store_true', help="Delta refresh the cache from the API")
+    refresh.add_argument('--full-refresh', action='store_true', help="Re-download the full date range")
+    parser.add_argument('--start-year', type=int, default=DATA_START_YEAR,
+                        help=f"First year to load (default {DATA_START_YEAR}; the World Bank series start in 1960)")
+    parser.add_argument('--end-year', type=int, default=DATA_END_YEAR,
+                        help=f"Last year to load (default {DATA_END_YEAR})")
+    parser.add_argument('--telemetry', action='store_true',
+                        help="Log the latency, size, parse time and retries of every API request")
+    parser.add_argument('--artifacts-dir', default=ARTIFACTS_DIR, help="Directory to write artifacts to")
+    parser.add_argument('--sql-store', action='store_true', default=SQL_STORE_ENABLED,
+                        help=f"Also build the indexed SQLite store ({SQL_STORE_FILE}); on by default "
+                             f"when SQL_STORE_ENABLED is set")
+    args = parser.parse_args(argv)
+    if args.start_year > args.end_year:
+        parser.error("--start-year must not be after --end-year")
+    if args.telemetry:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("[telemetry] %(message)s"))
+        telemetry_logger = logging.getLogger('telemetry')
+        telemetry_logger.addHandler(handler)
+        telemetry_logger.setLevel(logging.INFO)
+
+    def show_status(level, message):
+        print(f"[{level}] {message}", file=sys.stderr if level in ('warning', 'error') else sys.stdout)
+
+    def show_progress(pages_done, total_pages):
+        print(f"[info] Fetching from API: page {pages_done} of {total_pages}")
+
+    start = time.perf_counter()
+    df = load_inflation_data(
+        force_refresh=args.refresh,
+        full_refresh=args.full_refresh,
+        on_status=show_status,
+        on_page=show_progress,
+        start_year=args.start_year,
+        end_year=args.end_year,
+    )
+    if df is None or df.empty:
+        show_status('error', "No inflation data available; artifacts not built")
+        return 1
+
+    build_artifacts(
+        df,
+        dataset_version(),
+        artifacts_dir=args.artifacts_dir,
+        on_status=lambda message: show_status('info', message),
+    )
+    if args.sql_store:
+        sql_start = time.perf_counter()
+        build_sql_store(df, dataset_version())
+        show_status('info', f"Built {SQL_STORE_FILE} in {time.perf_counter() - sql_start:.2f} s")
+    show_status('success', f"Warm-up finished in {time.perf_counter() - start:.1f} s ({args.artifacts_dir}/)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
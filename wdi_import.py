@@ -0,0 +1,304 @@
+"""
+Import World Development Indicators from a bulk CSV/ZIP download.
+
+The World Bank publishes the whole WDI dataset (WDI_CSV.zip) and single
+indicators (API_<indicator>_DS2_en_csv_v2_*.zip) as wide CSV files with one
+row per country and indicator and one column per year. Reading one of those
+from local disk is much faster than paging the API and needs no network access.
+The archive is streamed in blocks of lines; only rows for the requested
+indicators are parsed, and the results are written to the same caches the API
+path fills (the headline inflation indicator to the main Parquet cache, other
+indicators to the indicator cache). Country regions and income groups are read
+from the archive's country metadata file when it has one.
+
+Usage:
+    python wdi_import.py WDI_CSV.zip
+    python wdi_import.py API_FP.CPI.TOTL.ZG_DS2_en_csv_v2.zip --start-year 1960
+    python wdi_import.py WDI_CSV.zip --indicators FP.CPI.TOTL.ZG NY.GDP.DEFL.KD.ZG
+"""
+import argparse
+import csv
+import io
+import os
+import sys
+import time
+import zipfile
+from contextlib import contextmanager
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from data_cache import (
+    save_cache,
+    save_indicator_cache,
+    cache_lock,
+    coerce_cache_dtypes,
+    attach_country_metadata,
+    load_country_metadata_cache,
+    save_country_metadata_cache,
+)
+from vintages import record_vintage
+from config import INFLATION_INDICATOR, DATA_START_YEAR, DATA_END_YEAR
+
+BULK_CHUNK_LINES = 20000  # Lines read from the data file per block
+ID_COLUMNS = ['Country Name', 'Country Code', 'Indicator Code']
+
+
+def _find_member(names, kind):
+    """Pick the data ('data') or country metadata ('country') CSV out of a bulk archive's members."""
+    for name in names:
+        base = os.path.basename(name).lower()
+        if not base.endswith('.csv'):
+            continue
+        if kind == 'data' and (base in ('wdicsv.csv', 'wdidata.csv') or base.startswith('api_')):
+            return name
+        if kind == 'country' and (base == 'wdicountry.csv' or base.startswith('metadata_country_')):
+            return name
+    return None
+
+
+@contextmanager
+def _open_bulk_csv(path, kind):
+    """
+    Open the data or country metadata CSV of a bulk download as a text stream.
+
+    Args:
+        path: A bulk ZIP archive, or a bare data CSV
+        kind: 'data' or 'country'
+
+    Yields:
+        io.TextIOBase: The decompressed CSV, read lazily
+        None: If the download has no such file
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            name = _find_member(archive.namelist(), kind)
+            if name is None:
+                yield None
+                return
+            with archive.open(name) as raw:
+                yield io.TextIOWrapper(raw, encoding='utf-8-sig')
+    elif kind == 'data':
+        with open(path, encoding='utf-8-sig') as f:
+            yield f
+    else:
+        yield None
+
+
+def _read_header(stream):
+    """
+    Skip the preamble of a bulk data file up to and including its header row.
+
+    Single-indicator downloads start with 'Data Source' and 'Last Updated Date' lines;
+    the full WDI file starts with the header.
+
+    Returns:
+        tuple: (column names, 'Last Updated Date' value or None)
+    """
+    last_updated = None
+    for line in stream:
+        row = next(csv.reader([line]), [])
+        if len(row) > 1 and row[0] == 'Last Updated Date':
+            last_updated = row[1]
+        elif row and row[0] == 'Country Name':
+            # Rows end with a trailing comma, which gives an unnamed last column
+            return [column or f'unnamed_{i}' for i, column in enumerate(row)], last_updated
+    raise ValueError("No 'Country Name' header row found in the bulk data file")
+
+
+def read_bulk_indicators(path, indicators, first_year=DATA_START_YEAR, last_year=DATA_END_YEAR,
+                         chunk_lines=BULK_CHUNK_LINES):
+    """
+    Stream the requested indicators out of a bulk WDI download.
+
+    Lines are read in blocks of chunk_lines and cheaply pre-filtered on the indicator
+    codes as text, so only candidate rows are parsed; memory stays proportional to the
+    block size plus the matching rows.
+
+    Args:
+        path: Bulk ZIP archive or data CSV
+        indicators: Indicator codes to extract
+        first_year: First year to keep
+        last_year: Last year to keep
+        chunk_lines: Lines read per block
+
+    Returns:
+        tuple: (df, years, last_updated) where df has country, country_code, indicator,
+            year and value columns, years is the (first_year, last_year) range of the
+            file's year columns within the requested range, and last_updated is the
+            file's 'Last Updated Date' (None if it has none)
+    """
+    indicators = list(indicators)
+    with _open_bulk_csv(path, 'data') as stream:
+        if stream is None:
+            raise ValueError(f"{path} does not contain a WDI data file")
+        names, last_updated = _read_header(stream)
+        year_columns = [name for name in names if name.isdigit() and first_year <= int(name) <= last_year]
+        if not year_columns:
+            raise ValueError(f"{path} has no data for {first_year}-{last_year}")
+
+        frames = []
+        while True:
+            block = list(islice(stream, chunk_lines))
+            if not block:
+                break
+            candidates = [line for line in block if any(code in line for code in indicators)]
+            if not candidates:
+                continue
+            chunk = pd.read_csv(
+                io.StringIO(''.join(candidates)),
+                header=None,
+                names=names,
+                usecols=ID_COLUMNS + year_columns,
+                dtype={column: 'object' for column in ID_COLUMNS},
+            )
+            # The text filter also matches codes that contain a requested code
+            frames.append(chunk[chunk['Indicator Code'].isin(indicators)])
+
+    years = (int(year_columns[0]), int(year_columns[-1]))
+    if not frames:
+        empty = pd.DataFrame(columns=['country', 'country_code', 'indicator', 'year', 'value'])
+        return empty, years, last_updated
+
+    wide = pd.concat(frames, ignore_index=True)
+    long_df = wide.melt(id_vars=ID_COLUMNS, value_vars=year_columns, var_name='year', value_name='value')
+    long_df = long_df.dropna(subset=['value']).rename(columns={
+        'Country Name': 'country',
+        'Country Code': 'country_code',
+        'Indicator Code': 'indicator',
+    })
+    long_df = long_df.astype({
+        'country': 'category',
+        'country_code': 'category',
+        'indicator': pd.CategoricalDtype(indicators),
+        'year': 'int16',
+        'value': 'float64',
+    })
+    long_df = long_df[['country', 'country_code', 'indicator', 'year', 'value']].reset_index(drop=True)
+    return long_df, years, last_updated
+
+
+def read_bulk_country_metadata(path):
+    """
+    Read the country list of a bulk WDI download.
+
+    Args:
+        path: Bulk ZIP archive
+
+    Returns:
+        pd.DataFrame: iso3, name, wb_region, income_group and is_aggregate columns, as
+            ingestion.fetch_country_metadata returns them
+        None: If the download has no country metadata file
+    """
+    with _open_bulk_csv(path, 'country') as stream:
+        if stream is None:
+            return None
+        countries = pd.read_csv(stream, dtype='object')
+
+    # WDI_CSV.zip and the single-indicator downloads spell the columns differently
+    countries = countries.rename(columns={
+        'Country Code': 'iso3',
+        'Table Name': 'name',
+        'TableName': 'name',
+        'Region': 'wb_region',
+        'Income Group': 'income_group',
+        'IncomeGroup': 'income_group',
+    })
+    # Aggregates are the rows without a region, like the API's 'Aggregates' region
+    is_aggregate = countries['wb_region'].isna()
+    return pd.DataFrame({
+        'iso3': countries['iso3'],
+        'name': countries['name'],
+        'wb_region': countries['wb_region'].fillna('Aggregates'),
+        'income_group': countries['income_group'].fillna(
+            pd.Series(np.where(is_aggregate, 'Aggregates', 'Not classified'), index=countries.index)
+        ),
+        'is_aggregate': is_aggregate,
+    })
+
+
+def import_bulk_file(path, indicators=(INFLATION_INDICATOR,), first_year=DATA_START_YEAR,
+                     last_year=DATA_END_YEAR, on_status=None, chunk_lines=BULK_CHUNK_LINES):
+    """
+    Load indicators from a bulk WDI download into the local caches.
+
+    The headline inflation indicator replaces the main cache (with a manifest whose
+    date range is the years the file covers, so the app can extend it from the API);
+    other indicators are written to the indicator cache.
+
+    Args:
+        path: Bulk ZIP archive or data CSV
+        indicators: Indicator codes to import
+        first_year: First year to import
+        last_year: Last year to import
+        on_status: Optional callback called as on_status(level, message)
+        chunk_lines: Lines read per block (see read_bulk_indicators)
+
+    Returns:
+        dict: Rows written per indicator (indicators missing from the file are left out)
+    """
+    def report(level, message):
+        if on_status:
+            on_status(level, message)
+
+    long_df, years, last_updated = read_bulk_indicators(path, indicators, first_year, last_year, chunk_lines)
+
+    metadata = read_bulk_country_metadata(path)
+    if metadata is not None:
+        save_country_metadata_cache(metadata)
+    else:
+        report('info', "No country metadata in the bulk file; using the cached country list")
+        metadata = load_country_metadata_cache()
+
+    written = {}
+    for indicator in indicators:
+        df = long_df[long_df['indicator'] == indicator].drop(columns='indicator')
+        if df.empty:
+            report('warning', f"{indicator}: not found in {path}")
+            continue
+        df = attach_country_metadata(df, metadata)
+        if indicator == INFLATION_INDICATOR:
+            df = coerce_cache_dtypes(df.rename(columns={'value': 'inflation'}))
+            df = df.sort_values(['country', 'year'], ascending=[True, False]).reset_index(drop=True)
+            with cache_lock():
+                save_cache(df, date_range=years, source_last_updated=last_updated)
+                vintage = record_vintage(df, last_updated, years)
+            if vintage:
+                report('info', f"Recorded data vintage {vintage['id']}")
+        else:
+            save_indicator_cache(indicator, df.reset_index(drop=True), date_range=years)
+        written[indicator] = len(df)
+        report('success', f"{indicator}: {len(df):,} records across {df['country'].nunique()} countries "
+                          f"({years[0]}-{years[1]})")
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', help="Bulk WDI ZIP archive or data CSV")
+    parser.add_argument('--indicators', nargs='+', default=[INFLATION_INDICATOR],
+                        help=f"Indicator codes to import (default {INFLATION_INDICATOR})")
+    parser.add_argument('--start-year', type=int, default=DATA_START_YEAR, help="First year to import")
+    parser.add_argument('--end-year', type=int, default=DATA_END_YEAR, help="Last year to import")
+    args = parser.parse_args(argv)
+
+    def show_status(level, message):
+        print(f"[{level}] {message}", file=sys.stderr if level in ('warning', 'error') else sys.stdout)
+
+    start = time.perf_counter()
+    try:
+        written = import_bulk_file(args.path, args.indicators, args.start_year, args.end_year,
+                                   on_status=show_status)
+    except (OSError, ValueError) as e:
+        show_status('error', str(e))
+        return 1
+    if not written:
+        show_status('error', "None of the requested indicators were found")
+        return 1
+    show_status('success', f"Imported {sum(written.values()):,} records in {time.perf_counter() - start:.1f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())